@@ -0,0 +1,38 @@
+"""transaction keyset index
+
+Revision ID: 1806004da623
+Revises: 5e04826d491e
+Create Date: 2026-10-17 10:41:52.301944
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1806004da623'
+down_revision: Union[str, None] = '5e04826d491e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build without locking writes on large transaction tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transaction_user_date_created_id',
+            'transaction',
+            ['user_id', 'transaction_date', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transaction_user_date_created_id',
+            table_name='transaction',
+            postgresql_concurrently=True,
+        )
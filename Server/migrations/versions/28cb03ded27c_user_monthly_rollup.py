@@ -0,0 +1,56 @@
+"""user monthly rollup
+
+Revision ID: 28cb03ded27c
+Revises: 6d5fa9d70dc0
+Create Date: 2026-10-17 09:12:41.220517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '28cb03ded27c'
+down_revision: Union[str, None] = '6d5fa9d70dc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_monthly_rollup',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('year_month', sa.String(length=7), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('category_id', sa.String(), server_default='', nullable=False),
+    sa.Column('total', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'year_month', 'type', 'category_id')
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO user_monthly_rollup
+            (user_id, year_month, type, category_id, total, transaction_count, created_at, updated_at)
+        SELECT
+            user_id,
+            to_char(transaction_date, 'YYYY-MM'),
+            type,
+            coalesce(category_id, ''),
+            sum(amount),
+            count(id),
+            now(),
+            now()
+        FROM "transaction"
+        GROUP BY user_id, to_char(transaction_date, 'YYYY-MM'), type, coalesce(category_id, '')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_monthly_rollup')
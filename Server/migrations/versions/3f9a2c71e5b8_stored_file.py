@@ -0,0 +1,39 @@
+"""stored file
+
+Revision ID: 3f9a2c71e5b8
+Revises: b71c4e09d2a3
+Create Date: 2026-10-17 14:02:36.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a2c71e5b8'
+down_revision: Union[str, None] = 'b71c4e09d2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('stored_file',
+    sa.Column('file_path', sa.String(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('content_type', sa.String(), nullable=True),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('file_path')
+    )
+    op.create_index(op.f('ix_stored_file_sha256'), 'stored_file', ['sha256'], unique=False)
+    op.add_column('attachment', sa.Column('file_path', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('attachment', 'file_path')
+    op.drop_index(op.f('ix_stored_file_sha256'), table_name='stored_file')
+    op.drop_table('stored_file')
@@ -0,0 +1,38 @@
+"""transaction amount date index
+
+Revision ID: 51d9e8b0f3a6
+Revises: e2b57a93c014
+Create Date: 2026-10-17 18:25:14.870163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '51d9e8b0f3a6'
+down_revision: Union[str, None] = 'e2b57a93c014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build without locking writes on large transaction tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transaction_user_amount_date',
+            'transaction',
+            ['user_id', 'amount', 'transaction_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transaction_user_amount_date',
+            table_name='transaction',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""group member balance
+
+Revision ID: 5e04826d491e
+Revises: 28cb03ded27c
+Create Date: 2026-10-17 10:03:17.874102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e04826d491e'
+down_revision: Union[str, None] = '28cb03ded27c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('group_member_balance',
+    sa.Column('group_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['group.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('group_id', 'user_id')
+    )
+    op.create_index(op.f('ix_group_member_balance_user_id'), 'group_member_balance', ['user_id'], unique=False)
+
+    # Backfill from existing expenses, splits and settlements
+    op.execute(
+        """
+        INSERT INTO group_member_balance (group_id, user_id, balance, created_at, updated_at)
+        SELECT group_id, user_id, sum(amount), now(), now()
+        FROM (
+            SELECT group_id, paid_by AS user_id, amount FROM group_expense
+            UNION ALL
+            SELECT e.group_id, s.user_id, -s.share_amount
+            FROM expense_split s JOIN group_expense e ON s.group_expense_id = e.id
+            UNION ALL
+            SELECT group_id, to_user_id, amount FROM settlement
+            UNION ALL
+            SELECT group_id, from_user_id, -amount FROM settlement
+        ) AS flows
+        GROUP BY group_id, user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_group_member_balance_user_id'), table_name='group_member_balance')
+    op.drop_table('group_member_balance')
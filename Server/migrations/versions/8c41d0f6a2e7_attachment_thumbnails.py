@@ -0,0 +1,26 @@
+"""attachment thumbnails
+
+Revision ID: 8c41d0f6a2e7
+Revises: 3f9a2c71e5b8
+Create Date: 2026-10-17 15:41:09.503127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d0f6a2e7'
+down_revision: Union[str, None] = '3f9a2c71e5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('attachment', sa.Column('thumbnails', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('attachment', 'thumbnails')
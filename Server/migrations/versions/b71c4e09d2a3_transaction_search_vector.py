@@ -0,0 +1,98 @@
+"""transaction search vector
+
+Revision ID: b71c4e09d2a3
+Revises: 1806004da623
+Create Date: 2026-10-17 11:20:07.514286
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71c4e09d2a3'
+down_revision: Union[str, None] = '1806004da623'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, source column) pairs that get a search_vector kept current by a trigger
+SEARCH_SOURCES = (('transaction', 'description'), ('attachment', 'extracted_text'))
+# Rows filled per transaction, so the backfill never holds many row locks for long
+BACKFILL_BATCH = 5000
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # A plain nullable column is a catalog-only change; a generated column
+    # would rewrite both tables under an ACCESS EXCLUSIVE lock
+    for table, source in SEARCH_SOURCES:
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+        op.execute(f"""
+            CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := to_tsvector('simple', coalesce(NEW.{source}, ''));
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_search_vector_update
+            BEFORE INSERT OR UPDATE OF {source} ON "{table}"
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        """)
+
+    # Rows written from here on are covered by the triggers; fill the rest in batches
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for table, source in SEARCH_SOURCES:
+            backfill = sa.text(f"""
+                UPDATE "{table}" SET search_vector = to_tsvector('simple', coalesce({source}, ''))
+                WHERE id IN (
+                    SELECT id FROM "{table}" WHERE search_vector IS NULL LIMIT {BACKFILL_BATCH}
+                )
+            """)
+            while connection.execute(backfill).rowcount:
+                pass
+
+    # Build without locking writes on large tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transaction_search_vector',
+            'transaction',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_transaction_description_trgm',
+            'transaction',
+            ['description'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_attachment_search_vector',
+            'attachment',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_attachment_search_vector', table_name='attachment', postgresql_concurrently=True)
+        op.drop_index('ix_transaction_description_trgm', table_name='transaction', postgresql_concurrently=True)
+        op.drop_index('ix_transaction_search_vector', table_name='transaction', postgresql_concurrently=True)
+    for table, _ in reversed(SEARCH_SOURCES):
+        op.execute(f'DROP TRIGGER {table}_search_vector_update ON "{table}"')
+        op.execute(f'DROP FUNCTION {table}_search_vector_update()')
+        op.drop_column(table, 'search_vector')
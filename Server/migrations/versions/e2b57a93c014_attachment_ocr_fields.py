@@ -0,0 +1,32 @@
+"""attachment ocr fields
+
+Revision ID: e2b57a93c014
+Revises: 8c41d0f6a2e7
+Create Date: 2026-10-17 17:08:52.334910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b57a93c014'
+down_revision: Union[str, None] = '8c41d0f6a2e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('attachment', sa.Column('ocr_status', sa.String(), nullable=True))
+    op.add_column('attachment', sa.Column('extracted_amount', sa.Numeric(precision=15, scale=2), nullable=True))
+    op.add_column('attachment', sa.Column('extracted_date', sa.Date(), nullable=True))
+    op.add_column('attachment', sa.Column('extracted_merchant', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('attachment', 'extracted_merchant')
+    op.drop_column('attachment', 'extracted_date')
+    op.drop_column('attachment', 'extracted_amount')
+    op.drop_column('attachment', 'ocr_status')
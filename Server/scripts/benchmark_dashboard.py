@@ -0,0 +1,269 @@
+"""Benchmark the dashboard summary: legacy per-figure queries vs the single-statement query.
+
+Seeds a synthetic user with 50k transactions and 30 groups, then measures
+round trips and latency percentiles for both implementations.
+
+Usage:
+    python scripts/benchmark_dashboard.py [--transactions 50000] [--groups 30] [--runs 50]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import (
+    Account,
+    ExpenseSplit,
+    Group,
+    GroupExpense,
+    GroupMember,
+    Transaction,
+    User,
+    UserMonthlyRollup,
+)
+from src.app.services import DashboardService, GroupBalanceService, MonthlyRollupService
+from src.core.db.session import async_session_factory, engine
+
+BATCH_SIZE = 5000
+MEMBERS_PER_GROUP = 5
+EXPENSES_PER_GROUP = 20
+
+
+class StatementCounter:
+    """Count statements sent to the database (one per round trip)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+async def seed(session: AsyncSession, prefix: str, transactions: int, groups: int) -> str:
+    """Create the synthetic user and its data. Returns the user ID."""
+    users = [
+        {
+            "id": f"{prefix}-user-{i}",
+            "name": f"Bench User {i}",
+            "email": f"{prefix}-{i}@bench.local",
+            "username": f"{prefix}-{i}",
+            "is_active": True,
+        }
+        for i in range(MEMBERS_PER_GROUP)
+    ]
+    user_id = users[0]["id"]
+    await session.execute(insert(User), users)
+
+    accounts = [
+        {
+            "id": f"{prefix}-account-{i}",
+            "user_id": user_id,
+            "name": f"Account {i}",
+            "type": "bank",
+            "currency": "INR",
+            "opening_balance": Decimal("1000.00"),
+            "current_balance": Decimal("1000.00"),
+            "is_active": True,
+        }
+        for i in range(3)
+    ]
+    await session.execute(insert(Account), accounts)
+
+    today = date.today()
+    rows = []
+    for i in range(transactions):
+        rows.append({
+            "id": f"{prefix}-txn-{i}",
+            "user_id": user_id,
+            "account_id": accounts[i % len(accounts)]["id"],
+            "type": random.choice(("income", "expense", "expense")),
+            "amount": Decimal(random.randint(100, 500000)) / 100,
+            "currency": "INR",
+            "description": f"Bench transaction {i}",
+            "transaction_date": today - timedelta(days=random.randint(0, 730)),
+        })
+        if len(rows) == BATCH_SIZE:
+            await session.execute(insert(Transaction), rows)
+            rows = []
+    if rows:
+        await session.execute(insert(Transaction), rows)
+
+    for g in range(groups):
+        group_id = f"{prefix}-group-{g}"
+        await session.execute(insert(Group).values(
+            id=group_id, name=f"Bench Group {g}", created_by=user_id, currency="INR"
+        ))
+        await session.execute(insert(GroupMember), [
+            {"id": f"{group_id}-member-{u['id']}", "group_id": group_id, "user_id": u["id"], "role": "member"}
+            for u in users
+        ])
+        for e in range(EXPENSES_PER_GROUP):
+            expense_id = f"{group_id}-expense-{e}"
+            amount = Decimal(random.randint(1000, 100000)) / 100
+            await session.execute(insert(GroupExpense).values(
+                id=expense_id,
+                group_id=group_id,
+                paid_by=random.choice(users)["id"],
+                title=f"Bench expense {e}",
+                amount=amount,
+                currency="INR",
+                split_type="equal",
+            ))
+            await session.execute(insert(ExpenseSplit), [
+                {
+                    "id": f"{expense_id}-split-{u['id']}",
+                    "group_expense_id": expense_id,
+                    "user_id": u["id"],
+                    "share_amount": amount / len(users),
+                }
+                for u in users
+            ])
+
+    await MonthlyRollupService(session).rebuild(user_id)
+    for g in range(groups):
+        await GroupBalanceService(session).rebuild(f"{prefix}-group-{g}")
+    await session.commit()
+    return user_id
+
+
+async def cleanup(session: AsyncSession, prefix: str) -> None:
+    """Remove all seeded rows."""
+    pattern = f"{prefix}-%"
+    await session.execute(delete(ExpenseSplit).where(ExpenseSplit.id.like(pattern)))
+    await session.execute(delete(GroupExpense).where(GroupExpense.id.like(pattern)))
+    await session.execute(delete(GroupMember).where(GroupMember.id.like(pattern)))
+    await session.execute(delete(Group).where(Group.id.like(pattern)))
+    await session.execute(delete(Transaction).where(Transaction.id.like(pattern)))
+    await session.execute(delete(UserMonthlyRollup).where(UserMonthlyRollup.user_id.like(pattern)))
+    await session.execute(delete(Account).where(Account.id.like(pattern)))
+    await session.execute(delete(User).where(User.id.like(pattern)))
+    await session.commit()
+
+
+async def legacy_summary(db: AsyncSession, user_id: str) -> dict:
+    """The previous implementation: one query per figure plus a per-group loop."""
+    async def scalar(query):
+        return Decimal(str((await db.execute(query)).scalar_one()))
+
+    first_of_month = date.today().replace(day=1)
+    net_balance = await scalar(select(func.coalesce(func.sum(Account.current_balance), 0)).where(
+        Account.user_id == user_id, Account.is_active == True
+    ))
+    total_income = await scalar(select(func.coalesce(func.sum(Transaction.amount), 0)).where(
+        Transaction.user_id == user_id,
+        Transaction.type == "income",
+        Transaction.transaction_date >= first_of_month,
+    ))
+    total_expense = await scalar(select(func.coalesce(func.sum(Transaction.amount), 0)).where(
+        Transaction.user_id == user_id,
+        Transaction.type == "expense",
+        Transaction.transaction_date >= first_of_month,
+    ))
+
+    group_ids = [
+        row[0] for row in (await db.execute(
+            select(GroupMember.group_id).where(GroupMember.user_id == user_id)
+        )).all()
+    ]
+    pending_dues = Decimal("0.00")
+    for group_id in group_ids:
+        owed = await scalar(select(func.coalesce(func.sum(ExpenseSplit.share_amount), 0)).where(
+            ExpenseSplit.user_id == user_id
+        ).join(GroupExpense).where(GroupExpense.group_id == group_id))
+        paid = await scalar(select(func.coalesce(func.sum(GroupExpense.amount), 0)).where(
+            GroupExpense.group_id == group_id, GroupExpense.paid_by == user_id
+        ))
+        if paid - owed < 0:
+            pending_dues += owed - paid
+
+    account_count = (await db.execute(select(func.count(Account.id)).where(
+        Account.user_id == user_id, Account.is_active == True
+    ))).scalar_one()
+    group_count = (await db.execute(
+        select(func.count(GroupMember.id)).where(GroupMember.user_id == user_id)
+    )).scalar_one()
+
+    return {
+        "net_balance": net_balance,
+        "total_income": total_income,
+        "total_expense": total_expense,
+        "pending_group_dues": pending_dues,
+        "account_count": account_count,
+        "group_count": group_count,
+    }
+
+
+async def measure(label: str, runner, user_id: str, runs: int) -> dict:
+    """Run one implementation repeatedly and report round trips and latency."""
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    timings = []
+    result = None
+    try:
+        for _ in range(runs):
+            async with async_session_factory() as session:
+                counter.count = 0
+                started = time.perf_counter()
+                result = await runner(session, user_id)
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"{label:<10} round trips: {counter.count:>4} | "
+        f"p50: {statistics.median(timings):8.2f} ms | p95: {p95:8.2f} ms"
+    )
+    return result
+
+
+async def run(transactions: int, groups: int, runs: int) -> None:
+    """Seed, benchmark both implementations, and clean up."""
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    async with async_session_factory() as session:
+        print(f"Seeding {transactions} transactions and {groups} groups...")
+        user_id = await seed(session, prefix, transactions, groups)
+
+    try:
+        legacy = await measure("legacy", legacy_summary, user_id, runs)
+        current = await measure(
+            "single", lambda db, uid: DashboardService(db).get_dashboard_summary(uid), user_id, runs
+        )
+        if legacy != current:
+            print(f"⚠️ Results differ:\n  legacy: {legacy}\n  single: {current}")
+        else:
+            print("✅ Both implementations return the same summary")
+    finally:
+        async with async_session_factory() as session:
+            await cleanup(session, prefix)
+        await engine.dispose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=50000)
+    parser.add_argument("--groups", type=int, default=30)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(run(args.transactions, args.groups, args.runs))
+
+
+if __name__ == "__main__":
+    main()
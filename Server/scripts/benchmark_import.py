@@ -0,0 +1,92 @@
+"""Benchmark the bulk statement import.
+
+Generates an in-memory CSV statement (50k rows by default) for a synthetic
+user and imports it through TransactionImportService.
+
+Usage:
+    python scripts/benchmark_import.py [--rows 50000]
+"""
+import argparse
+import asyncio
+import io
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert
+
+from src.app.models import Account, Transaction, User, UserMonthlyRollup
+from src.app.services import TransactionImportService
+from src.core.db.session import async_session_factory, engine
+
+
+def build_statement(rows: int) -> io.BytesIO:
+    """A bank-style CSV with signed amounts and no type column."""
+    today = date.today()
+    lines = ["Date,Narration,Amount"]
+    for i in range(rows):
+        amount = random.randint(100, 500000) / 100
+        if random.random() < 0.8:
+            amount = -amount
+        day = today - timedelta(days=random.randint(0, 365))
+        lines.append(f"{day.isoformat()},Statement row {i},{amount:.2f}")
+    return io.BytesIO("\n".join(lines).encode())
+
+
+async def run(rows: int) -> None:
+    """Seed a user and account, import the statement, and clean up."""
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    user_id = f"{prefix}-user"
+    account_id = f"{prefix}-account"
+    async with async_session_factory() as session:
+        await session.execute(insert(User).values(
+            id=user_id, name="Bench User", email=f"{prefix}@bench.local", username=prefix, is_active=True
+        ))
+        await session.execute(insert(Account).values(
+            id=account_id, user_id=user_id, name="Bench Account", type="bank", currency="INR",
+            opening_balance=0, current_balance=0, is_active=True,
+        ))
+        await session.commit()
+
+    try:
+        statement = build_statement(rows)
+        async with async_session_factory() as session:
+            started = time.perf_counter()
+            result = await TransactionImportService(session).import_file(
+                user_id, account_id, statement, "csv"
+            )
+            elapsed = time.perf_counter() - started
+
+        if result.errors:
+            print(f"❌ Import rejected: {result.errors[:5]}")
+        else:
+            print(f"✅ Imported {result.imported} rows in {elapsed:.2f}s ({result.imported / elapsed:,.0f} rows/s)")
+    finally:
+        async with async_session_factory() as session:
+            await session.execute(delete(Transaction).where(Transaction.user_id == user_id))
+            await session.execute(delete(UserMonthlyRollup).where(UserMonthlyRollup.user_id == user_id))
+            await session.execute(delete(Account).where(Account.id == account_id))
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
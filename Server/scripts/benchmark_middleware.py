@@ -0,0 +1,137 @@
+"""Benchmark per-request overhead of the logging middleware.
+
+Drives a trivial ASGI app directly (no server, no sockets) through:
+    - no middleware,
+    - the previous BaseHTTPMiddleware-style logging middleware, reproduced
+      here with its two synchronous log lines per request,
+    - the current pure ASGI LoggingMiddleware with its enqueued JSON sink,
+and reports the added cost per request. Log output is discarded unless
+--log-file is given.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests 20000] [--log-file access.log]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import Request, Response
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.middleware.logging import LoggingMiddleware
+
+
+async def endpoint(scope, receive, send) -> None:
+    """Smallest possible JSON response."""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": b'{"ok":true}'})
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The logging middleware as it was before the ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        logger.info(
+            f"Request: {request.method} {request.url.path} "
+            f"from {request.client.host if request.client else 'unknown'}"
+        )
+        response = await call_next(request)
+        logger.info(f"Response: {response.status_code} for {request.method} {request.url.path}")
+        return response
+
+
+def configure_logging(log_file: str) -> None:
+    """Same sinks as setup_logging, written to a file."""
+    logger.configure(handlers=[
+        {
+            "sink": log_file,
+            "level": "INFO",
+            "filter": lambda record: "access" not in record["extra"],
+        },
+        {
+            "sink": log_file,
+            "level": "INFO",
+            "format": "{message}",
+            "filter": lambda record: "access" in record["extra"],
+            "enqueue": True,
+        },
+    ])
+
+
+async def run(app, requests: int) -> float:
+    """Seconds per request through an ASGI app."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/vectix/dashboard/summary",
+        "raw_path": b"/api/v1/vectix/dashboard/summary",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # Warm up
+    for _ in range(min(1000, requests)):
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def main_async(requests: int) -> None:
+    """Compare the three stacks."""
+    baseline = await run(endpoint, requests)
+    print(f"No middleware:          {baseline * 1e6:8.1f} µs/request")
+
+    for name, app in (
+        ("BaseHTTPMiddleware:", BaseHTTPLoggingMiddleware(endpoint)),
+        ("Pure ASGI + JSON sink:", LoggingMiddleware(endpoint)),
+    ):
+        per_request = await run(app, requests)
+        print(
+            f"{name:<23} {per_request * 1e6:8.1f} µs/request "
+            f"(+{(per_request - baseline) * 1e6:.1f} µs)"
+        )
+    await logger.complete()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--log-file", default=os.devnull)
+    args = parser.parse_args()
+
+    configure_logging(args.log_file)
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
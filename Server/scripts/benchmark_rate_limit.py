@@ -0,0 +1,145 @@
+"""Check and benchmark the Redis token-bucket rate limiter.
+
+First checks counting is exact: many concurrent requests against a bucket
+that cannot refill during the run must admit exactly ``capacity`` of them.
+Then measures checks per second from concurrent coroutines, and how fast
+the optional per-worker tier (LocalRateLimiter) rejects a client that is
+already over its limit.
+
+Runs against REDIS_URL, or an in-process fakeredis server with --fake
+(needs the dev dependency fakeredis[lua]).
+
+Usage:
+    python scripts/benchmark_rate_limit.py [--fake] [--requests 20000] [--concurrency 100]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from redis import asyncio as aioredis
+
+from src.core.config import settings
+from src.core.utils.rate_limit import LocalRateLimiter, RateLimiter
+
+
+def connect(fake: bool) -> aioredis.Redis:
+    """Redis client for the real server or a fakeredis stand-in."""
+    if fake:
+        from fakeredis import FakeAsyncRedis
+
+        return FakeAsyncRedis(decode_responses=True)
+    return aioredis.from_url(str(settings.REDIS_URL), encoding="utf8", decode_responses=True)
+
+
+async def check_exact(redis: aioredis.Redis, capacity: int, attempts: int) -> bool:
+    """Fire concurrent requests at one IP+user bucket pair and count admissions."""
+    # One token per day: nothing refills while the check runs
+    limiter = RateLimiter(redis, times=capacity, seconds=86400 * capacity)
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    keys = (f"{prefix}:ip", f"{prefix}:user")
+    try:
+        results = await asyncio.gather(*(limiter.is_rate_limited(*keys) for _ in range(attempts)))
+    finally:
+        await redis.delete(*keys)
+
+    admitted = sum(1 for is_limited, _ in results if not is_limited)
+    if admitted == capacity:
+        print(f"✅ Exact: {admitted}/{attempts} concurrent requests admitted (capacity {capacity})")
+        return True
+    print(f"❌ Admitted {admitted} of {attempts}, expected {capacity}")
+    return False
+
+
+async def benchmark(redis: aioredis.Redis, requests: int, concurrency: int) -> None:
+    """Measure limiter checks per second."""
+    limiter = RateLimiter(redis, times=1000000, seconds=1)
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    per_worker = requests // concurrency
+
+    async def worker(n: int) -> None:
+        keys = (f"{prefix}:ip:{n % 10}", f"{prefix}:user:{n}")
+        for _ in range(per_worker):
+            await limiter.is_rate_limited(*keys)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    async for key in redis.scan_iter(match=f"{prefix}:*"):
+        await redis.delete(key)
+    total = per_worker * concurrency
+    print(f"{total} checks in {elapsed:.2f}s: {total / elapsed:,.0f} checks/s ({elapsed / total * 1e6:.0f} µs each)")
+
+
+async def benchmark_local(redis: aioredis.Redis, capacity: int, requests: int) -> bool:
+    """Admissions through the local tier stay within capacity; rejections skip Redis."""
+    limiter = RateLimiter(redis, times=capacity, seconds=86400 * capacity)
+    local = LocalRateLimiter(capacity, 86400 * capacity, lease_fraction=0.1, lease_seconds=60)
+    keys = (f"bench-{uuid.uuid4().hex[:8]}:ip",)
+    round_trips = 0
+
+    async def check() -> bool:
+        nonlocal round_trips
+        decision = local.try_local(keys)
+        if decision is None:
+            round_trips += 1
+            taken, info = await limiter.acquire(keys, local.lease_size)
+            local.record(keys, taken, info)
+            decision = (taken == 0, info)
+        return decision[0]
+
+    try:
+        started = time.perf_counter()
+        admitted = 0
+        for _ in range(requests):
+            if not await check():
+                admitted += 1
+        elapsed = time.perf_counter() - started
+    finally:
+        await redis.delete(*keys)
+
+    print(
+        f"Local tier: {requests} checks in {elapsed:.3f}s ({elapsed / requests * 1e6:.1f} µs each), "
+        f"{round_trips} Redis round trips"
+    )
+    if admitted == capacity:
+        print(f"✅ Local tier admitted {admitted} (capacity {capacity})")
+        return True
+    print(f"❌ Local tier admitted {admitted}, expected {capacity}")
+    return False
+
+
+async def run(fake: bool, requests: int, concurrency: int) -> bool:
+    """Run the exactness check and the benchmark."""
+    redis = connect(fake)
+    try:
+        exact = await check_exact(redis, capacity=50, attempts=500)
+        await benchmark(redis, requests, concurrency)
+        local = await benchmark_local(redis, capacity=50, requests=requests)
+        return exact and local
+    finally:
+        await redis.aclose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fake", action="store_true", help="use an in-process fakeredis server")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    if not asyncio.run(run(args.fake, args.requests, args.concurrency)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmark transaction search: legacy LIKE scan vs the indexed search predicate.
+
+Seeds a synthetic user with 1M transactions (generated server-side with
+generate_series), then measures latency percentiles for a set of search
+terms using the old ``lower(description) LIKE '%term%'`` filter and the
+tsvector/trigram predicate used by TransactionService.
+
+Usage:
+    python scripts/benchmark_search.py [--transactions 1000000] [--runs 20]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Account, Transaction, User
+from src.app.services import TransactionService
+from src.core.db.session import async_session_factory, engine
+
+TERMS = ("coffee", "uber", "groc", "rent march", "zzz-no-match")
+WORDS = ("coffee", "uber ride", "groceries", "rent march", "electricity bill", "pizza", "salary", "gym")
+
+
+async def seed(session: AsyncSession, prefix: str, transactions: int) -> str:
+    """Create the synthetic user and its transactions. Returns the user ID."""
+    user_id = f"{prefix}-user"
+    account_id = f"{prefix}-account"
+    await session.execute(insert(User).values(
+        id=user_id, name="Bench User", email=f"{prefix}@bench.local", username=prefix, is_active=True
+    ))
+    await session.execute(insert(Account).values(
+        id=account_id, user_id=user_id, name="Bench Account", type="bank", currency="INR",
+        opening_balance=0, current_balance=0, is_active=True,
+    ))
+    await session.execute(
+        text(
+            """
+            INSERT INTO transaction (
+                id, user_id, account_id, type, amount, currency, description,
+                transaction_date, created_at, updated_at
+            )
+            SELECT
+                :prefix || '-txn-' || n,
+                :user_id,
+                :account_id,
+                'expense',
+                (random() * 5000)::numeric(15, 2),
+                'INR',
+                (CAST(:words AS text[]))[1 + n % array_length(CAST(:words AS text[]), 1)] || ' ' || md5(n::text),
+                current_date - (n % 730),
+                now(),
+                now()
+            FROM generate_series(1, CAST(:count AS integer)) AS n
+            """
+        ),
+        {"prefix": prefix, "user_id": user_id, "account_id": account_id, "words": list(WORDS), "count": transactions},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE transaction"))
+    return user_id
+
+
+async def cleanup(session: AsyncSession, prefix: str) -> None:
+    """Remove all seeded rows."""
+    pattern = f"{prefix}-%"
+    await session.execute(delete(Transaction).where(Transaction.id.like(pattern)))
+    await session.execute(delete(Account).where(Account.id.like(pattern)))
+    await session.execute(delete(User).where(User.id.like(pattern)))
+    await session.commit()
+
+
+def legacy_query(user_id: str, term: str):
+    """The previous filter: a case-insensitive substring scan."""
+    return select(func.count(Transaction.id)).where(
+        Transaction.user_id == user_id,
+        func.lower(Transaction.description).like(f"%{term.lower()}%"),
+    )
+
+
+def indexed_query(user_id: str, term: str):
+    """The indexed predicate used by TransactionService."""
+    return select(func.count(Transaction.id)).where(
+        Transaction.user_id == user_id,
+        TransactionService._search_condition(term),
+    )
+
+
+async def measure(label: str, build, user_id: str, runs: int) -> None:
+    """Run one query shape for every term and report latency."""
+    timings = []
+    async with async_session_factory() as session:
+        for _ in range(runs):
+            for term in TERMS:
+                started = time.perf_counter()
+                await session.execute(build(user_id, term))
+                timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<8} p50: {statistics.median(timings):8.2f} ms | p95: {p95:8.2f} ms")
+
+
+async def run(transactions: int, runs: int) -> None:
+    """Seed, benchmark both predicates, and clean up."""
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    async with async_session_factory() as session:
+        print(f"Seeding {transactions} transactions...")
+        user_id = await seed(session, prefix, transactions)
+
+    try:
+        await measure("legacy", legacy_query, user_id, runs)
+        await measure("indexed", indexed_query, user_id, runs)
+
+        async with async_session_factory() as session:
+            results = await TransactionService(session).search(user_id, "coff", limit=3)
+            if results:
+                print(f"✅ Prefix search 'coff' ranked first: {results[0].description}")
+            else:
+                print("⚠️ Prefix search 'coff' returned no results")
+    finally:
+        async with async_session_factory() as session:
+            await cleanup(session, prefix)
+        await engine.dispose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(run(args.transactions, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Concurrency check for account balance updates.
+
+Hammers one account from many coroutines, each in its own session and
+transaction, mixing credits, debits and transfers, then checks the final
+balances are exact. Exits non-zero on a mismatch.
+
+Usage:
+    python scripts/check_balance_concurrency.py [--workers 50] [--rounds 20]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from typing import Tuple
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert, select
+
+from src.app.models import Account, User
+from src.app.services import AccountService
+from src.core.db.session import async_session_factory, engine
+
+OPENING_BALANCE = Decimal("1000.00")
+
+
+async def worker(user_id: str, account_id: str, other_id: str, rounds: int) -> Tuple[Decimal, Decimal]:
+    """Apply random balance changes; return (net change on account_id, total transferred out)."""
+    expected = Decimal("0.00")
+    transferred = Decimal("0.00")
+    for _ in range(rounds):
+        amount = Decimal(random.randint(1, 10000)) / 100
+        async with async_session_factory() as session:
+            service = AccountService(session)
+            action = random.choice(("credit", "debit", "transfer"))
+            if action == "credit":
+                await service.update_balance(account_id, amount, is_credit=True)
+                expected += amount
+            elif action == "debit":
+                await service.update_balance(account_id, amount, is_credit=False)
+                expected -= amount
+            else:
+                if not await service.transfer_money(account_id, other_id, amount, user_id):
+                    raise RuntimeError("transfer was rejected")
+                expected -= amount
+                transferred += amount
+            await session.commit()
+    return expected, transferred
+
+
+async def run(workers: int, rounds: int) -> bool:
+    """Seed two accounts, run the workers concurrently and verify the balances."""
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    user_id = f"{prefix}-user"
+    account_id, other_id = f"{prefix}-account-a", f"{prefix}-account-b"
+    async with async_session_factory() as session:
+        await session.execute(insert(User).values(
+            id=user_id, name="Bench User", email=f"{prefix}@bench.local", username=prefix, is_active=True
+        ))
+        await session.execute(insert(Account), [
+            {
+                "id": account, "user_id": user_id, "name": account, "type": "bank", "currency": "INR",
+                "opening_balance": OPENING_BALANCE, "current_balance": OPENING_BALANCE, "is_active": True,
+            }
+            for account in (account_id, other_id)
+        ])
+        await session.commit()
+
+    try:
+        changes = await asyncio.gather(*(
+            worker(user_id, account_id, other_id, rounds) for _ in range(workers)
+        ))
+        expected = OPENING_BALANCE + sum(change for change, _ in changes)
+        expected_other = OPENING_BALANCE + sum(transferred for _, transferred in changes)
+
+        async with async_session_factory() as session:
+            balances = dict((await session.execute(
+                select(Account.id, Account.current_balance).where(Account.user_id == user_id)
+            )).all())
+
+        if balances[account_id] == expected and balances[other_id] == expected_other:
+            print(f"✅ {workers * rounds} concurrent updates, final balances exact: {balances[account_id]}")
+            return True
+        print(
+            f"❌ Expected {expected} / {expected_other}, "
+            f"got {balances[account_id]} / {balances[other_id]}"
+        )
+        return False
+    finally:
+        async with async_session_factory() as session:
+            await session.execute(delete(Account).where(Account.user_id == user_id))
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    if not asyncio.run(run(args.workers, args.rounds)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Script to delete stored uploads that no stored_file row references.
+
+An upload places its content-addressed blob before the caller commits; if
+that commit fails, the blob stays on disk without a row. This removes such
+blobs (with their thumbnails) and abandoned temporary uploads, once they
+are older than --min-age-hours so in-flight uploads are never touched.
+"""
+import argparse
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from src.app.models import StoredFile
+from src.app.services.stored_file_service import StoredFileService
+from src.core.db.session import async_session_factory
+from src.core.utils import file_upload_service
+from src.core.utils.file_utils import TEMP_SUBFOLDER
+
+# <subfolder>/ab/cd/<sha256><ext>; thumbnails (<sha256>_<size>.webp) go with their original
+BLOB_RE = re.compile(r"^[0-9a-f]{64}(\.[A-Za-z0-9]+)?$")
+CHECK_BATCH = 500
+
+
+def old_blobs(min_age_seconds: float) -> List[str]:
+    """Upload-relative paths of content-addressed blobs not touched for min_age_seconds."""
+    upload_dir = file_upload_service.upload_dir
+    cutoff = time.time() - min_age_seconds
+    blobs = []
+    for path in upload_dir.glob("*/??/??/*"):
+        if path.is_file() and BLOB_RE.match(path.name) and path.stat().st_mtime < cutoff:
+            blobs.append(path.relative_to(upload_dir).as_posix())
+    return blobs
+
+
+async def clean_orphan_files(min_age_hours: float, dry_run: bool) -> None:
+    """Delete unreferenced blobs and stale temporary uploads."""
+    print(f"\n🧹 Looking for orphaned uploads older than {min_age_hours:g} h...")
+    min_age_seconds = min_age_hours * 3600
+
+    stale_temps = [
+        path for path in (file_upload_service.upload_dir / TEMP_SUBFOLDER).iterdir()
+        if path.is_file() and path.stat().st_mtime < time.time() - min_age_seconds
+    ]
+    blobs = old_blobs(min_age_seconds)
+
+    orphans = []
+    async with async_session_factory() as session:
+        for start in range(0, len(blobs), CHECK_BATCH):
+            batch = blobs[start:start + CHECK_BATCH]
+            referenced = set((await session.execute(
+                select(StoredFile.file_path).where(StoredFile.file_path.in_(batch))
+            )).scalars())
+            orphans.extend(path for path in batch if path not in referenced)
+        await session.commit()
+
+        if not dry_run:
+            for path in stale_temps:
+                path.unlink(missing_ok=True)
+            # Re-checks each row under the blob's lock, so a concurrent upload wins
+            await StoredFileService(session).purge(orphans)
+
+    verb = "Would delete" if dry_run else "Deleted"
+    print(f"✅ {verb} {len(orphans)} orphaned blob(s) and {len(stale_temps)} temporary upload(s)")
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Delete stored uploads that nothing references.")
+    parser.add_argument("--min-age-hours", type=float, default=24, help="Leave newer files alone")
+    parser.add_argument("--dry-run", action="store_true", help="Only count what would be deleted")
+    args = parser.parse_args()
+
+    try:
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+        asyncio.run(clean_orphan_files(args.min_age_hours, args.dry_run))
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Operation cancelled by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Script to generate missing thumbnails for uploaded attachments."""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, update
+
+from src.app.models import Attachment
+from src.app.services.thumbnail_service import ThumbnailService
+from src.core.db.session import async_session_factory
+from src.core.utils.process_pool import shutdown_process_pool
+
+
+async def generate_thumbnails() -> None:
+    """Fill in Attachment.thumbnails for uploads that have none."""
+    print("\n🖼️  Generating attachment thumbnails...")
+
+    async with async_session_factory() as session:
+        query = select(Attachment.id, Attachment.file_path).where(
+            Attachment.file_path.isnot(None), Attachment.thumbnails.is_(None)
+        )
+        attachments = (await session.execute(query)).all()
+
+        done = skipped = 0
+        for attachment_id, file_path in attachments:
+            thumbnails = await ThumbnailService.generate(file_path)
+            if not thumbnails:
+                skipped += 1
+                continue
+            await session.execute(
+                update(Attachment).where(Attachment.id == attachment_id).values(thumbnails=thumbnails)
+            )
+            done += 1
+            if done % 100 == 0:
+                await session.commit()
+                print(f"   {done} attachments done")
+        await session.commit()
+
+    shutdown_process_pool()
+    print(f"✅ Thumbnails generated for {done} attachments ({skipped} not renderable)")
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Generate missing attachment thumbnails.")
+    parser.parse_args()
+
+    try:
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+        asyncio.run(generate_thumbnails())
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Operation cancelled by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
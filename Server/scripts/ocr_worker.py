@@ -0,0 +1,279 @@
+"""OCR worker: extracts text, amount, date and merchant from uploaded attachments.
+
+Pulls attachment jobs queued by the API from Redis, runs extraction in a
+process pool with at most --concurrency files in flight, and writes the
+results back in batches.
+
+Usage:
+    python scripts/ocr_worker.py [--concurrency 2] [--batch-size 50] [--flush-seconds 2]
+                                 [--backfill] [--auto-link]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import signal
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.app.services.ocr_service import OCR_DONE, OCR_FAILED, OCR_QUEUE, OcrService
+from src.app.services.receipt_matching_service import ReceiptMatchingService
+from src.core.config import settings
+from src.core.db.session import async_session_factory, engine
+from src.core.redis import InstrumentedRedis, set_redis_client
+from src.core.utils import file_upload_service
+from src.core.utils.ocr import can_extract, extract_receipt
+
+# Worker process crashes a job may see before it is marked failed
+MAX_ATTEMPTS = 3
+
+
+class OcrWorker:
+    """Reserves OCR jobs, extracts in a process pool and saves results in batches."""
+
+    def __init__(
+        self,
+        consumer: str,
+        concurrency: int,
+        batch_size: int,
+        flush_seconds: float,
+        dayfirst: bool,
+        auto_link: bool = False,
+    ):
+        self.consumer = consumer
+        self.auto_link = auto_link
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.dayfirst = dayfirst
+        self.concurrency = concurrency
+        self.pool = self._new_pool()
+        # Bounds jobs reserved but not yet extracted, so a crash strands few
+        self.slots = asyncio.Semaphore(concurrency)
+        self.stopping = asyncio.Event()
+        self.tasks: Set[asyncio.Task] = set()
+        # (raw job, result) waiting for the next batch write
+        self.results: List[Tuple[str, Dict[str, Any]]] = []
+        self.flush_lock = asyncio.Lock()
+        self.processed = 0
+
+    async def run(self) -> None:
+        """Work until stop() is called, then finish in-flight jobs and flush."""
+        recovered = await OCR_QUEUE.recover(self.consumer)
+        if recovered:
+            logger.info(f"Requeued {recovered} unfinished OCR job(s) from a previous run")
+
+        flusher = asyncio.create_task(self._flush_periodically())
+        try:
+            while not self.stopping.is_set():
+                await self.slots.acquire()
+                job = await OCR_QUEUE.reserve(self.consumer, timeout=1)
+                if job is None:
+                    self.slots.release()
+                    continue
+                task = asyncio.create_task(self._process(*job))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+        finally:
+            if self.tasks:
+                await asyncio.gather(*self.tasks, return_exceptions=True)
+            flusher.cancel()
+            await self.flush()
+            self.pool.shutdown()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.concurrency, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def stop(self) -> None:
+        """Stop reserving new jobs."""
+        logger.info("Stopping OCR worker after in-flight jobs")
+        self.stopping.set()
+
+    async def _process(self, raw: str, job: Dict[str, Any]) -> None:
+        result = {"attachment_id": job["attachment_id"], "user_id": job["user_id"]}
+        pool = self.pool
+        broken = False
+        try:
+            if not can_extract(job["file_path"]):
+                raise ValueError(f"no extractor for {Path(job['file_path']).suffix or 'this file'}")
+            source = str(file_upload_service.upload_dir / job["file_path"])
+            loop = asyncio.get_running_loop()
+            receipt = await loop.run_in_executor(pool, extract_receipt, source, self.dayfirst)
+            result.update(
+                ocr_status=OCR_DONE,
+                text=receipt["text"] or None,
+                amount=receipt["amount"],
+                date=receipt["date"],
+                merchant=receipt["merchant"],
+            )
+        except BrokenProcessPool:
+            # The worker process died, not necessarily on this file
+            broken = True
+        except Exception as e:
+            logger.warning(f"OCR failed for attachment {job['attachment_id']}: {e}")
+            result["ocr_status"] = OCR_FAILED
+        finally:
+            self.slots.release()
+
+        if broken:
+            await self._retry(raw, job, pool)
+            return
+        self.results.append((raw, result))
+        if len(self.results) >= self.batch_size:
+            await self.flush()
+
+    async def _retry(self, raw: str, job: Dict[str, Any], pool: ProcessPoolExecutor) -> None:
+        """Requeue a job whose worker process died, replacing the broken pool."""
+        # Every job in flight sees the same failure; only the first replaces the pool
+        if self.pool is pool:
+            logger.warning("OCR process pool broke; starting a new one")
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = self._new_pool()
+
+        attempts = job.get("attempts", 0) + 1
+        if attempts >= MAX_ATTEMPTS:
+            # Probably the file itself kills the process; stop retrying it
+            logger.warning(f"OCR crashed {attempts} times on attachment {job['attachment_id']}")
+            self.results.append((raw, {
+                "attachment_id": job["attachment_id"], "user_id": job["user_id"], "ocr_status": OCR_FAILED,
+            }))
+            return
+        if await OCR_QUEUE.enqueue({**job, "attempts": attempts}):
+            await OCR_QUEUE.ack(self.consumer, raw)
+        # Otherwise left unacknowledged: redone when this consumer restarts
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Save the buffered results in one statement, then acknowledge their jobs."""
+        async with self.flush_lock:
+            batch, self.results = self.results, []
+            if not batch:
+                return
+            try:
+                async with async_session_factory() as db:
+                    await OcrService(db).save_results([result for _, result in batch])
+            except Exception as e:
+                # Left unacknowledged: the jobs are redone when this consumer restarts
+                logger.error(f"Failed to save {len(batch)} OCR result(s): {e}")
+                return
+            await OCR_QUEUE.ack(self.consumer, *(raw for raw, _ in batch))
+            self.processed += len(batch)
+            logger.info(f"Saved {len(batch)} OCR result(s) ({self.processed} this run)")
+
+            if self.auto_link:
+                await self._auto_link([result for _, result in batch if result["ocr_status"] == OCR_DONE])
+
+    async def _auto_link(self, results: List[Dict[str, Any]]) -> None:
+        """Link the freshly read receipts that have one unambiguous matching transaction."""
+        by_user: Dict[str, List[str]] = {}
+        for result in results:
+            if result.get("amount") is not None:
+                by_user.setdefault(result["user_id"], []).append(result["attachment_id"])
+        try:
+            async with async_session_factory() as db:
+                service = ReceiptMatchingService(db)
+                for user_id, attachment_ids in by_user.items():
+                    links = await service.auto_link(user_id, attachment_ids=attachment_ids)
+                    if links:
+                        logger.info(f"Auto-linked {len(links)} receipt(s) for user {user_id}")
+        except Exception as e:
+            logger.warning(f"Auto-link failed: {e}")
+
+
+async def backfill() -> int:
+    """Queue every pending attachment, e.g. ones uploaded while Redis was down."""
+    queued = 0
+    async with async_session_factory() as db:
+        service = OcrService(db)
+        last_seen = None
+        while True:
+            attachments = await service.get_pending(after=last_seen)
+            if not attachments:
+                break
+            await OcrService.enqueue(*attachments)
+            queued += len(attachments)
+            last_seen = (attachments[-1].created_at, attachments[-1].id)
+    return queued
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Connect, optionally backfill, and run the worker until signalled."""
+    redis = InstrumentedRedis.from_url(str(settings.REDIS_URL), encoding="utf8", decode_responses=True)
+    await redis.ping()
+    set_redis_client(redis)
+
+    try:
+        if args.backfill:
+            print(f"📥 Queued {await backfill()} pending attachment(s)")
+
+        worker = OcrWorker(
+            consumer=args.consumer,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            flush_seconds=args.flush_seconds,
+            dayfirst=not args.monthfirst,
+            auto_link=args.auto_link,
+        )
+        if sys.platform != 'win32':
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, worker.stop)
+
+        print(f"✅ OCR worker {args.consumer} running with {args.concurrency} process(es)")
+        await worker.run()
+        print(f"✅ OCR worker stopped after {worker.processed} attachment(s)")
+    finally:
+        set_redis_client(None)
+        await redis.close()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=2, help="Files extracted at once")
+    parser.add_argument("--batch-size", type=int, default=50, help="Results per database write")
+    parser.add_argument("--flush-seconds", type=float, default=2.0, help="Longest wait before a write")
+    parser.add_argument(
+        "--consumer", default=socket.gethostname(),
+        help="Stable name of this worker; its unfinished jobs are retried when it restarts",
+    )
+    parser.add_argument("--monthfirst", action="store_true", help="Read 03/04/2025 as March 4")
+    parser.add_argument(
+        "--auto-link", action="store_true",
+        help="Link new receipts to their transaction when the match is unambiguous",
+    )
+    parser.add_argument(
+        "--backfill", action="store_true",
+        help="Queue every pending attachment first (ones already queued are just redone)",
+    )
+    args = parser.parse_args()
+
+    try:
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Operation cancelled by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Script to recompute the group member balance ledger from scratch."""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.app.services.group_balance_service import GroupBalanceService
+from src.core.db.session import async_session_factory
+
+
+async def rebuild_group_balances(group_id: str = None) -> None:
+    """Recompute group_member_balance for one group or for every group."""
+    scope = f"group {group_id}" if group_id else "all groups"
+    print(f"\n🔁 Rebuilding group balances for {scope}...")
+
+    async with async_session_factory() as session:
+        try:
+            await GroupBalanceService(session).rebuild(group_id)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    print("✅ Group balances rebuilt successfully")
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Recompute the group member balance ledger.")
+    parser.add_argument("--group", dest="group_id", default=None, help="Only rebuild this group")
+    args = parser.parse_args()
+
+    try:
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+        asyncio.run(rebuild_group_balances(args.group_id))
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Operation cancelled by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
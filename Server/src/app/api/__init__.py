@@ -4,6 +4,7 @@ from src.app.api.deps import (
     get_current_active_user,
     get_current_superuser,
     get_current_user,
+    get_read_db,
     has_permission,
 )
 from src.app.api.router import api_router
@@ -13,5 +14,6 @@ __all__ = [
     "get_current_user",
     "get_current_active_user",
     "get_current_superuser",
+    "get_read_db",
     "has_permission",
 ]
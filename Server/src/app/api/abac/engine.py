@@ -1,4 +1,10 @@
+import json
 import re
+from functools import lru_cache
+from typing import Any, Callable
+
+# A compiled expression: takes the ABAC context, returns the expression's value
+CompiledExpression = Callable[[dict], Any]
 
 
 class ABACEngine:
@@ -26,36 +32,92 @@ class ABACEngine:
         self.context = context
 
     def evaluate(self, expr):
-        print(f"Evaluating expression: {expr}")
-        if isinstance(expr, dict):
-            if "var" in expr:
-                return self.resolve_var(expr["var"])
-            for op, args in expr.items():
-                if op == "if":
-                    if not isinstance(args, list) or len(args) < 2:
-                        raise ValueError('"if" operator requires at least 2 arguments')
-                    condition = self.evaluate(args[0])
-                    if condition:
-                        return self.evaluate(args[1])
-                    elif len(args) > 2:
-                        return self.evaluate(args[2])
-                    else:
-                        return None
-                if op not in self.OPERATORS:
-                    raise ValueError(f"Unknown operator: {op}")
-                if not isinstance(args, list):
-                    args = [args]
-                eval_args = [self.evaluate(arg) for arg in args]
-                return self.OPERATORS[op](*eval_args)
-        return expr
+        return self.compile(expr)(self.context)
 
     def resolve_var(self, var_path: str):
-        parts = var_path.split(".")
-        value = self.context
+        return self._resolve(self.context, var_path.split("."))
+
+    @classmethod
+    def compile(cls, expr) -> CompiledExpression:
+        """
+        Compile an expression tree into a closure over the context.
+
+        Compiled closures are cached by the expression's JSON, so each
+        distinct Permission.expression is only walked once per process.
+        Malformed nodes compile to a closure that raises ValueError when
+        reached, as evaluating them always did.
+        """
+        try:
+            key = json.dumps(expr, sort_keys=True)
+        except (TypeError, ValueError):
+            return cls._compile(expr)
+        return cls._compile_cached(key)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _compile_cached(cls, key: str) -> CompiledExpression:
+        return cls._compile(json.loads(key))
+
+    @classmethod
+    def _compile(cls, expr) -> CompiledExpression:
+        if not isinstance(expr, dict) or not expr:
+            return lambda context: expr
+
+        if "var" in expr:
+            parts = expr["var"].split(".")
+            return lambda context: cls._resolve(context, parts)
+
+        op, args = next(iter(expr.items()))
+        if op == "if":
+            if not isinstance(args, list) or len(args) < 2:
+                return cls._fail('"if" operator requires at least 2 arguments')
+            condition, then = cls._compile(args[0]), cls._compile(args[1])
+            otherwise = cls._compile(args[2]) if len(args) > 2 else (lambda context: None)
+            return lambda context: then(context) if condition(context) else otherwise(context)
+
+        if op not in cls.OPERATORS:
+            return cls._fail(f"Unknown operator: {op}")
+        if not isinstance(args, list):
+            args = [args]
+        compiled = [cls._compile(arg) for arg in args]
+
+        if op == "and":
+            return lambda context: all(arg(context) for arg in compiled)
+        if op == "or":
+            return lambda context: any(arg(context) for arg in compiled)
+        if op == "regexMatch" and len(args) == 2 and isinstance(args[0], str):
+            pattern = re.compile(args[0])
+            value = compiled[1]
+
+            def regex_match(context):
+                text = value(context)
+                return bool(pattern.match(text)) if isinstance(text, str) else False
+
+            return regex_match
+        if len(compiled) == 1:
+            unary, arg = cls.OPERATORS[op], compiled[0]
+            return lambda context: unary(arg(context))
+        if len(compiled) == 2:
+            binary, left, right = cls.OPERATORS[op], compiled[0], compiled[1]
+            return lambda context: binary(left(context), right(context))
+
+        operator = cls.OPERATORS[op]
+        return lambda context: operator(*(arg(context) for arg in compiled))
+
+    @staticmethod
+    def _fail(message: str) -> CompiledExpression:
+        def fail(context):
+            raise ValueError(message)
+
+        return fail
+
+    @staticmethod
+    def _resolve(context: dict, parts: list):
+        value = context
         for part in parts:
             if not isinstance(value, dict):
                 return None
             value = value.get(part)
             if value is None:
                 return None
-        return value
\ No newline at end of file
+        return value
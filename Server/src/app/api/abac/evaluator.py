@@ -1,4 +1,3 @@
-from src.app.api.abac.engine import ABACEngine
 from src.app.services import PermissionService
 
 
@@ -7,12 +6,13 @@ class ABAuthorizer:
         self.policy_service = PermissionService(db)
 
     async def is_allowed(self, resource, action, actor, target):
-        roles = [role.name for role in actor.roles]
+        # Principals carry role names; ORM users carry Role objects
+        roles = [role if isinstance(role, str) else role.name for role in actor.roles or []]
 
-        permissions = await self.policy_service.get_policies(roles, resource, action)
-        print(
-            f"Checking permissions for actor: {actor.id}, resource: {resource}, action: {action}"
-        )
+        # Compiled and cached per (roles, resource, action)
+        policies = await self.policy_service.get_compiled_policies(roles, resource, action)
+        if not policies:
+            return False
 
         # Extract actor fields for ABAC context
         actor_context = {
@@ -27,11 +27,10 @@ class ABAuthorizer:
 
         context = {"actor": actor_context, "target": target}
 
-        for permission in permissions:
-            if permission.expression is None:
+        for check in policies:
+            if check is None:
                 return True
-            engine = ABACEngine(context)
-            if engine.evaluate(permission.expression):
+            if check(context):
                 return True
 
-        return False
\ No newline at end of file
+        return False
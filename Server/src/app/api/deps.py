@@ -1,6 +1,7 @@
 """API dependencies."""
 
-from typing import Optional
+from types import SimpleNamespace
+from typing import AsyncGenerator, Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -9,31 +10,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from src.app.models import User, Role
 from src.app.schemas import TokenPayload, UserResponse
-from src.app.services import UserService
+from src.app.services import PrincipalCache, UserService
 from src.core.config import settings
 from src.core.db import get_db
+from src.core.db.session import get_read_db_for
 from src.app.api.abac.evaluator import ABAuthorizer
 
 # HTTP Bearer scheme
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+def _token_subject(credentials: HTTPAuthorizationCredentials) -> str:
     """
-    Get current user from token.
-
-    Args:
-        credentials: Bearer token credentials
-        db: Database session
-
-    Returns:
-        Current user
+    Validate an access token and return its subject (username).
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If the token is invalid
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -64,70 +56,104 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    # Get user from database
+    return username
+
+
+async def _get_principal(username: str, db: AsyncSession) -> Optional[dict]:
+    """Get the principal for a username from the principal cache, loading it on a miss."""
+    principal = await PrincipalCache.get(username)
+    if principal is not None:
+        return principal
+
     user_service = UserService(db)
-    current_user = await user_service.get_by_username(username)
-    if current_user is None:
-        raise credentials_exception
-    print(f"Current user: {current_user} with ID: {current_user.id}")
-    return UserResponse(
-        id=current_user.id,
-        name=current_user.name,
-        phoneNumber=current_user.phoneNumber,
-        email=current_user.email,
-        username=current_user.username,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-        roles=[role.name for role in current_user.roles],
-    )
+    user = await user_service.get_by_username(username)
+    if user is None:
+        return None
+
+    principal = UserResponse(
+        id=user.id,
+        name=user.name,
+        phoneNumber=user.phoneNumber,
+        email=user.email,
+        username=user.username,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+        roles=[role.name for role in user.roles],
+    ).model_dump(mode="json")
+    principal["is_superuser"] = bool(user.is_superuser)
+    await PrincipalCache.set(username, principal)
+    return principal
 
 
-async def get_current_user_with_roles(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
-    Get current user from token, with roles and permissions eagerly loaded.
+    Get current user from token.
+
+    The user is served from the principal cache, so a warm request makes
+    no database query for identity.
 
     Args:
         credentials: Bearer token credentials
         db: Database session
 
     Returns:
-        Current user with roles and permissions
+        Current user
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        # Decode token
-        payload = jwt.decode(
-            credentials.credentials, settings.SECRET_KEY, algorithms=["HS256"]
+    username = _token_subject(credentials)
+    principal = await _get_principal(username, db)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        token_data = TokenPayload(**payload)
+    return UserResponse.model_validate(principal)
 
-        # Check token type
-        if token_data.type != "access":
-            raise credentials_exception
 
-        # Check if token is expired
-        if token_data.exp is None:
-            raise credentials_exception
+async def get_read_db(
+    current_user: User = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a read-only database session for the current user.
 
-        # Get id from token
-        username: Optional[str] = token_data.sub
-        if username is None:
-            raise credentials_exception
+    Served by the read replica when one is configured, except right after
+    a write that changed the user's data; those reads go to the primary.
 
-    except JWTError:
-        raise credentials_exception
+    Args:
+        current_user: Current user
+
+    Yields:
+        Database session
+    """
+    async for session in get_read_db_for(current_user.id):
+        yield session
+
+
+async def get_current_user_with_roles(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Get current user from token, with roles and permissions eagerly loaded.
+
+    Args:
+        credentials: Bearer token credentials
+        db: Database session
+
+    Returns:
+        Current user with roles and permissions
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    username = _token_subject(credentials)
 
     # Eagerly load roles and permissions
     result = await db.execute(
@@ -137,7 +163,11 @@ async def get_current_user_with_roles(
     )
     user = result.scalar_one_or_none()
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
@@ -166,8 +196,7 @@ async def get_current_active_user(
 
 
 async def get_current_superuser(
-    current_user: User = Depends(get_current_user_with_roles),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ) -> bool:
     """
     Get current superuser.
@@ -176,21 +205,11 @@ async def get_current_superuser(
         current_user: Current user
 
     Returns:
-        Current superuser
-
-    Raises:
-        HTTPException: If user is not superuser
+        True if the current user exists (its principal was resolved)
     """
-    try:
-        user_service = UserService(db)
-        user  = await user_service.get_by_username(current_user.username)
-        return user is not None
-
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error fetching user from database",
-        )
+    # Resolving the principal already proved the user exists; re-querying
+    # the database here (as this used to) cannot return anything different.
+    return current_user is not None
 
 
 def has_permission(resource: str, action: str):
@@ -206,7 +225,7 @@ def has_permission(resource: str, action: str):
     """
 
     async def check_permission(
-        current_user: User = Depends(get_current_user_with_roles),
+        credentials: HTTPAuthorizationCredentials = Depends(security),
         db: AsyncSession = Depends(get_db),
         request: Request = None,
     ) -> User:
@@ -214,7 +233,9 @@ def has_permission(resource: str, action: str):
         Check if user has permission.
 
         Args:
-            current_user: Current user
+            credentials: Bearer token credentials
+            db: Database session
+            request: Current request
 
         Returns:
             Current user
@@ -222,19 +243,19 @@ def has_permission(resource: str, action: str):
         Raises:
             HTTPException: If user does not have permission
         """
-        # Superuser has all permissions
-        if await get_current_superuser(current_user, db):
-            return UserResponse(
-                id=current_user.id,
-                name=current_user.name,
-                phoneNumber=current_user.phoneNumber,
-                email=current_user.email,
-                username=current_user.username,
-                is_active=current_user.is_active,
-                created_at=current_user.created_at,
-                updated_at=current_user.updated_at,
-                roles=[role.name for role in current_user.roles],
+        username = _token_subject(credentials)
+        principal = await _get_principal(username, db)
+        if principal is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
             )
+        current_user = UserResponse.model_validate(principal)
+
+        # Superuser has all permissions
+        if await get_current_superuser(current_user):
+            return current_user
         # Initialize ABAC Authorizer
         authorizer = ABAuthorizer(db)
         target = {}
@@ -252,24 +273,15 @@ def has_permission(resource: str, action: str):
                 else:
                     target = {"response": "all"}
 
-        is_allowed = await authorizer.is_allowed(resource, action, current_user, target)
+        actor = SimpleNamespace(**principal)
+        is_allowed = await authorizer.is_allowed(resource, action, actor, target)
 
         # User does not have permission
         if is_allowed:
-            return UserResponse(
-                id=current_user.id,
-                name=current_user.name,
-                phoneNumber=current_user.phoneNumber,
-                email=current_user.email,
-                username=current_user.username,
-                is_active=current_user.is_active,
-                created_at=current_user.created_at,
-                updated_at=current_user.updated_at,
-                roles=[role.name for role in current_user.roles],
-            )
+            return current_user
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
 
-    return check_permission
\ No newline at end of file
+    return check_permission
@@ -18,6 +18,7 @@ from src.app.api.v1.endpoints.vectix import (
     group_expenses_router,
     settlements_router,
     dashboard_router,
+    exports_router,
 )
 
 __all__ = [
@@ -39,4 +40,5 @@ __all__ = [
     "group_expenses_router",
     "settlements_router",
     "dashboard_router",
+    "exports_router",
 ]
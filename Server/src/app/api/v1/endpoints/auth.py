@@ -15,7 +15,7 @@ from src.app.schemas import (
     GoogleTokenRequest,
     GoogleAuthResponse,
 )
-from src.app.services import AuthService, UserService, GoogleAuthService
+from src.app.services import AuthService, UserService, GoogleAuthService, StoredFileService
 from src.core.utils import create_rate_limiter
 from src.core.db import get_db
 from src.core.utils import file_upload_service
@@ -87,7 +87,8 @@ async def register(
     """
     photo_url = None
     if photo:
-        file_info = await file_upload_service.save_file(photo, subfolder="userphotos")
+        # The reference commits together with the new user
+        file_info = await StoredFileService(db).save(photo, subfolder="userphotos")
         photo_url = file_upload_service.get_file_url(file_info["file_path"])
     user_data = {
         "name": name,
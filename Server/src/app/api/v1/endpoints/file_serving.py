@@ -1,7 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, Request
 from pathlib import Path
 from src.core.config import settings
+from src.core.utils.file_response import FileResponse, stat_regular_file
 from src.app.api.deps import has_permission
 
 router = APIRouter()
@@ -9,20 +9,22 @@ router = APIRouter()
 
 @router.get("/files/{file_path:path}")
 async def serve_file(
-    file_path: str, current_user: dict = Depends(has_permission("file", "read"))
+    file_path: str,
+    request: Request,
+    current_user: dict = Depends(has_permission("file", "read")),
 ):
-    """Serve uploaded files."""
-    full_path = Path(settings.UPLOAD_DIR) / file_path
-
-    if not full_path.exists() or not full_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found")
+    """Serve uploaded files, with ETag/304 revalidation and byte ranges."""
+    upload_dir = Path(settings.UPLOAD_DIR).resolve()
+    full_path = (upload_dir / file_path).resolve()
 
     # Security: Ensure file is within upload directory
     try:
-        full_path.resolve().relative_to(Path(settings.UPLOAD_DIR).resolve())
+        full_path.relative_to(upload_dir)
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return FileResponse(
-        path=full_path, filename=full_path.name, media_type="application/octet-stream"
-    )
+    stat_result = stat_regular_file(full_path)
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    return FileResponse(full_path, request.headers, stat_result=stat_result)
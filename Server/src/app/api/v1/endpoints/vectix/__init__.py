@@ -9,6 +9,7 @@ from src.app.api.v1.endpoints.vectix.groups import router as groups_router
 from src.app.api.v1.endpoints.vectix.group_expenses import router as group_expenses_router
 from src.app.api.v1.endpoints.vectix.settlements import router as settlements_router
 from src.app.api.v1.endpoints.vectix.dashboard import router as dashboard_router
+from src.app.api.v1.endpoints.vectix.exports import router as exports_router
 
 __all__ = [
     "accounts_router",
@@ -20,5 +21,6 @@ __all__ = [
     "group_expenses_router",
     "settlements_router",
     "dashboard_router",
+    "exports_router",
 ]
 
@@ -4,8 +4,9 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import account_tag, cached_response
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import AccountService
 from src.app.schemas import (
@@ -19,10 +20,11 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[Account])
+@cached_response(expire=300, model=List[Account])
 async def get_accounts(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     account_type: Optional[str] = Query(None, description="Filter by account type"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all accounts for the current user."""
@@ -33,8 +35,9 @@ async def get_accounts(
 
 
 @router.get("/summary")
+@cached_response(expire=300)
 async def get_accounts_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get account summary with total balance."""
@@ -60,6 +63,7 @@ async def get_accounts_summary(
 
 
 @router.get("/{account_id}", response_model=Account)
+@cached_response(expire=300, tags=lambda account_id: [account_tag(account_id)], model=Account)
 async def get_account(
     account_id: str,
     db: AsyncSession = Depends(get_db),
@@ -117,7 +121,7 @@ async def delete_account(
 async def get_account_transactions(
     account_id: str,
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get recent transactions for an account."""
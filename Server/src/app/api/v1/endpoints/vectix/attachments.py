@@ -1,16 +1,19 @@
 """Attachment endpoints for Personal Finance (Bills/Receipts)."""
 
+from decimal import Decimal
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
-from src.app.services import AttachmentService
+from src.app.services import AttachmentService, ReceiptMatchingService
 from src.app.schemas import (
     Attachment,
+    AttachmentAutoLinkResult,
     AttachmentCreate,
+    AttachmentMatchSuggestion,
     AttachmentUpdate,
 )
 
@@ -21,7 +24,7 @@ router = APIRouter()
 async def get_attachments(
     type: Optional[str] = Query(None, description="Filter by type: bill | receipt"),
     linked_only: bool = Query(False, description="Only show linked attachments"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all attachments for the current user."""
@@ -33,7 +36,7 @@ async def get_attachments(
 
 @router.get("/unlinked", response_model=List[Attachment])
 async def get_unlinked_attachments(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all unlinked attachments (bills not converted to expenses)."""
@@ -41,6 +44,40 @@ async def get_unlinked_attachments(
     return await service.get_unlinked(current_user.id)
 
 
+@router.get("/match-suggestions", response_model=List[AttachmentMatchSuggestion])
+async def get_match_suggestions(
+    window_days: int = Query(3, ge=0, le=31, description="Days either side of the receipt date"),
+    amount_tolerance: Decimal = Query(Decimal("0"), ge=0, description="Largest amount difference"),
+    limit: int = Query(3, ge=1, le=10, description="Candidates per attachment"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get ranked candidate transactions for unlinked bills with extracted amounts."""
+    service = ReceiptMatchingService(db)
+    return await service.suggest(
+        current_user.id,
+        window_days=window_days,
+        amount_tolerance=amount_tolerance,
+        limit=limit,
+    )
+
+
+@router.post("/auto-link", response_model=AttachmentAutoLinkResult)
+async def auto_link_attachments(
+    min_score: float = Query(0.85, ge=0.5, le=1, description="Lowest confidence linked"),
+    window_days: int = Query(3, ge=0, le=31, description="Days either side of the receipt date"),
+    dry_run: bool = Query(False, description="Only report what would be linked"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Link unlinked bills to their unambiguous, high-confidence matching transactions."""
+    service = ReceiptMatchingService(db)
+    linked = await service.auto_link(
+        current_user.id, min_score=min_score, window_days=window_days, dry_run=dry_run
+    )
+    return {"linked": linked, "dry_run": dry_run}
+
+
 @router.get("/{attachment_id}", response_model=Attachment)
 async def get_attachment(
     attachment_id: str,
@@ -66,6 +103,21 @@ async def create_attachment(
     return await service.create_attachment(current_user.id, data)
 
 
+@router.post("/upload", response_model=Attachment)
+async def upload_attachment(
+    file: UploadFile = File(...),
+    type: str = Form(..., description="Attachment type: bill | receipt"),
+    linked_transaction_id: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Upload a bill/receipt file and create its attachment."""
+    service = AttachmentService(db)
+    return await service.upload_attachment(
+        current_user.id, file, type, linked_transaction_id=linked_transaction_id
+    )
+
+
 @router.put("/{attachment_id}", response_model=Attachment)
 async def update_attachment(
     attachment_id: str,
@@ -4,8 +4,9 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import cached_response
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import CategoryService
 from src.app.schemas import (
@@ -19,9 +20,10 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[Category])
+@cached_response(expire=300, model=List[Category])
 async def get_categories(
     type: Optional[str] = Query(None, description="Filter by type: income | expense"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all categories for the current user."""
@@ -30,8 +32,9 @@ async def get_categories(
 
 
 @router.get("/with-stats")
+@cached_response(expire=300)
 async def get_categories_with_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all categories with usage statistics."""
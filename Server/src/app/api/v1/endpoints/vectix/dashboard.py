@@ -5,8 +5,9 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import cached_response
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import DashboardService, CategoryService, AccountService
 from src.app.schemas import (
@@ -20,8 +21,9 @@ router = APIRouter()
 
 
 @router.get("/summary")
+@cached_response(expire=300)
 async def get_dashboard_summary(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get main dashboard summary."""
@@ -30,9 +32,10 @@ async def get_dashboard_summary(
 
 
 @router.get("/monthly-breakdown")
+@cached_response(expire=300, stale=900)
 async def get_monthly_breakdown(
     months: int = Query(6, ge=1, le=12, description="Number of months"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get monthly income/expense breakdown."""
@@ -41,11 +44,12 @@ async def get_monthly_breakdown(
 
 
 @router.get("/category-breakdown")
+@cached_response(expire=300, stale=900)
 async def get_category_breakdown(
     type: str = Query("expense", description="Transaction type"),
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get spending breakdown by category."""
@@ -56,10 +60,11 @@ async def get_category_breakdown(
 
 
 @router.get("/monthly-summary")
+@cached_response(expire=300)
 async def get_monthly_summary(
     year: int = Query(..., description="Year"),
     month: int = Query(..., ge=1, le=12, description="Month"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get detailed monthly summary."""
@@ -68,10 +73,11 @@ async def get_monthly_summary(
 
 
 @router.get("/analytics")
+@cached_response(expire=300, stale=900)
 async def get_analytics(
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get comprehensive analytics data."""
@@ -134,8 +140,9 @@ async def complete_onboarding(
 
 
 @router.get("/quick-stats")
+@cached_response(expire=300)
 async def get_quick_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get quick stats for dashboard widgets."""
@@ -0,0 +1,53 @@
+"""Export endpoints for full-history downloads."""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from src.core.db.session import get_read_session_factory
+from src.app.api import get_current_user
+from src.app.models import User
+from src.app.services import ExportService
+from src.app.services.export_service import DATASETS, FORMATS
+
+router = APIRouter()
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: str = Query("csv", description="csv | parquet | arrow"),
+    group_id: Optional[str] = Query(None, description="Only this group (group_expenses, settlements)"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream a full-history export.
+
+    ``dataset`` is transactions, group_expenses (one row per split) or
+    settlements. Parquet and Arrow need the optional pyarrow dependency.
+    """
+    if dataset not in DATASETS:
+        raise HTTPException(status_code=404, detail="Unknown dataset")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail="Unknown format")
+    if format != "csv" and not ExportService.columnar_available():
+        raise HTTPException(status_code=400, detail=f"{format} export is not available on this server")
+
+    async def body():
+        # The request's session closes before a streamed body is sent, so use our
+        # own, on the read replica unless the user has just written
+        session_factory = await get_read_session_factory(current_user.id)
+        async with session_factory() as session:
+            service = ExportService(session)
+            query = service.build_query(dataset, current_user.id, group_id)
+            async for chunk in await service.stream(query, format):
+                yield chunk
+
+    media_type, extension = FORMATS[format]
+    filename = f"vectix-{dataset}-{date.today().isoformat()}.{extension}"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
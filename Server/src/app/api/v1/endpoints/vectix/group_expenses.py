@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import GroupExpenseService, GroupService
 from src.app.schemas import (
@@ -23,7 +23,7 @@ async def get_group_expenses(
     group_id: str,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all expenses for a group."""
@@ -4,8 +4,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import cached_response, group_tag
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import GroupService
 from src.app.schemas import (
@@ -21,8 +22,9 @@ router = APIRouter()
 
 
 @router.get("/")
+@cached_response(expire=300)
 async def get_groups(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all groups for the current user."""
@@ -31,6 +33,7 @@ async def get_groups(
 
 
 @router.get("/{group_id}")
+@cached_response(expire=300, tags=lambda group_id: [group_tag(group_id)])
 async def get_group(
     group_id: str,
     db: AsyncSession = Depends(get_db),
@@ -152,6 +155,7 @@ async def remove_group_member(
 
 
 @router.get("/{group_id}/balances")
+@cached_response(expire=300, tags=lambda group_id: [group_tag(group_id)])
 async def get_group_balances(
     group_id: str,
     db: AsyncSession = Depends(get_db),
@@ -4,8 +4,9 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import cached_response
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
 from src.app.services import SubscriptionService, AccountService
 from src.app.schemas import (
@@ -21,7 +22,7 @@ router = APIRouter()
 @router.get("/", response_model=List[Subscription])
 async def get_subscriptions(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all subscriptions for the current user."""
@@ -30,9 +31,10 @@ async def get_subscriptions(
 
 
 @router.get("/upcoming")
+@cached_response(expire=300)
 async def get_upcoming_subscriptions(
     days: int = Query(30, ge=1, le=90, description="Days to look ahead"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get upcoming subscription payments."""
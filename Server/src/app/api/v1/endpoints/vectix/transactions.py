@@ -1,21 +1,23 @@
 """Transaction endpoints for Personal Finance."""
 
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import cached_response
 from src.core.db import get_db
-from src.app.api import get_current_user
+from src.app.api import get_current_user, get_read_db
 from src.app.models import User
-from src.app.services import TransactionService, AccountService
+from src.app.services import TransactionService, AccountService, TransactionImportService
 from src.app.schemas import (
     Transaction,
     TransactionCreate,
     TransactionUpdate,
     TransactionFilter,
     TransactionSummary,
+    TransactionImportResult,
 )
 
 router = APIRouter()
@@ -28,38 +30,58 @@ async def get_transactions(
     category_id: Optional[str] = Query(None, description="Filter by category"),
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
+    min_amount: Optional[Decimal] = Query(None, ge=0, description="Minimum amount"),
+    max_amount: Optional[Decimal] = Query(None, ge=0, description="Maximum amount"),
     search: Optional[str] = Query(None, description="Search in description"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    include_count: bool = Query(True, description="Set false to skip total_count (e.g. infinite scroll)"),
+    estimate: bool = Query(False, description="Return an approximate total_count for large result sets"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all transactions with filters."""
+    """
+    Get all transactions with filters.
+
+    Supports offset pagination (``offset``) and keyset pagination: pass the
+    ``next_cursor`` of the previous page as ``cursor`` to fetch the next one.
+    ``total_count`` is null when ``include_count`` is false.
+    """
     filters = TransactionFilter(
         type=type,
         account_id=account_id,
         category_id=category_id,
         start_date=start_date,
         end_date=end_date,
+        min_amount=min_amount,
+        max_amount=max_amount,
         search=search,
     )
     
+    count = "none" if not include_count else "estimate" if estimate else "exact"
+    
     service = TransactionService(db)
-    transactions, total = await service.get_all_by_user(
-        current_user.id, filters, limit, offset
-    )
+    try:
+        transactions, total, next_cursor = await service.get_all_by_user(
+            current_user.id, filters, limit, offset, cursor, count
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     
     return {
         "total_count": total,
         "transactions": transactions,
+        "next_cursor": next_cursor,
     }
 
 
 @router.get("/summary")
+@cached_response(expire=300)
 async def get_transaction_summary(
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get transaction summary (income, expense, net)."""
@@ -69,11 +91,12 @@ async def get_transaction_summary(
 
 
 @router.get("/category-breakdown")
+@cached_response(expire=300)
 async def get_category_breakdown(
     type: str = Query("expense", description="Transaction type"),
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get spending breakdown by category."""
@@ -84,6 +107,18 @@ async def get_category_breakdown(
     return breakdown
 
 
+@router.get("/search", response_model=List[Transaction])
+async def search_transactions(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Search transactions and their receipts, best match first."""
+    service = TransactionService(db)
+    return await service.search(current_user.id, q, limit)
+
+
 @router.get("/{transaction_id}", response_model=Transaction)
 async def get_transaction(
     transaction_id: str,
@@ -122,6 +157,44 @@ async def create_transaction(
     return await service.create_transaction(current_user.id, data, account_service)
 
 
+@router.post("/import", response_model=TransactionImportResult)
+async def import_transactions(
+    file: UploadFile = File(..., description="Statement file (.csv, .ofx/.qfx or .jsonl)"),
+    account_id: str = Form(..., description="Account the statement belongs to"),
+    format: Optional[str] = Form(None, description="csv | ofx | jsonl (default: from file name)"),
+    skip_invalid: bool = Form(False, description="Import valid rows and skip invalid ones"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Bulk import a bank statement.
+
+    CSV needs a header row with date, amount and optionally description,
+    type, category_id, account_id and currency columns; without a type
+    column negative amounts are expenses. By default any invalid row
+    rejects the whole file (422) and reports the first errors.
+    """
+    account = await AccountService(db).get_by_id(account_id, current_user.id)
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+    
+    service = TransactionImportService(db)
+    file_format = format or service.detect_format(file.filename)
+    if not file_format:
+        raise HTTPException(status_code=400, detail="Could not detect statement format")
+    
+    try:
+        result = await service.import_file(
+            current_user.id, account_id, file.file, file_format, skip_invalid
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if result.errors and not skip_invalid:
+        raise HTTPException(status_code=422, detail=result.model_dump())
+    return result
+
+
 @router.put("/{transaction_id}", response_model=Transaction)
 async def update_transaction(
     transaction_id: str,
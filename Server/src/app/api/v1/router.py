@@ -21,6 +21,7 @@ from src.app.api.v1.endpoints import (
     group_expenses_router,
     settlements_router,
     dashboard_router,
+    exports_router,
 )
 
 # Create API router
@@ -45,3 +46,4 @@ router.include_router(groups_router, prefix="/vectix/groups", tags=["vectix-grou
 router.include_router(group_expenses_router, prefix="/vectix/expenses", tags=["vectix-expenses"])
 router.include_router(settlements_router, prefix="/vectix/settlements", tags=["vectix-settlements"])
 router.include_router(dashboard_router, prefix="/vectix/dashboard", tags=["vectix-dashboard"])
+router.include_router(exports_router, prefix="/vectix/exports", tags=["vectix-exports"])
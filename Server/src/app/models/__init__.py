@@ -13,6 +13,8 @@ from src.app.models.transaction import Transaction
 from src.app.models.category import Category
 from src.app.models.subscription import Subscription
 from src.app.models.attachment import Attachment
+from src.app.models.user_monthly_rollup import UserMonthlyRollup
+from src.app.models.stored_file import StoredFile
 
 # Splitwise Models
 from src.app.models.group import Group
@@ -20,6 +22,7 @@ from src.app.models.group_member import GroupMember
 from src.app.models.group_expense import GroupExpense
 from src.app.models.expense_split import ExpenseSplit
 from src.app.models.settlement import Settlement
+from src.app.models.group_member_balance import GroupMemberBalance
 
 __all__ = [
     # RBAC
@@ -36,10 +39,13 @@ __all__ = [
     "Category",
     "Subscription",
     "Attachment",
+    "UserMonthlyRollup",
+    "StoredFile",
     # Splitwise
     "Group",
     "GroupMember",
     "GroupExpense",
     "ExpenseSplit",
     "Settlement",
+    "GroupMemberBalance",
 ]
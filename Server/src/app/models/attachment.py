@@ -1,8 +1,9 @@
 """Attachment model for Personal Finance (Bill Scans / OCR Ready)."""
 
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import JSON, Column, Date, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, relationship
 
 from src.core.db import Base
 
@@ -15,15 +16,27 @@ class Attachment(Base):
     """Attachment model for bills, receipts, and OCR data."""
 
     __tablename__ = "attachment"
+    __table_args__ = (
+        Index("ix_attachment_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(String, primary_key=True, unique=True, index=True)
     user_id = Column(String, ForeignKey("user.id"), nullable=False, index=True)
 
     file_url = Column(String, nullable=False)  # URL to stored file
+    file_path = Column(String, nullable=True)  # Upload-relative path when uploaded here
+    thumbnails = Column(JSON, nullable=True)  # {"256": url, "1024": url}, filled in the background
     type = Column(String, nullable=False)  # bill | receipt
     extracted_text = Column(Text, nullable=True)  # OCR extracted text
+    ocr_status = Column(String, nullable=True)  # pending | done | failed; null when not uploaded here
+    extracted_amount = Column(Numeric(15, 2), nullable=True)  # Parsed from extracted_text
+    extracted_date = Column(Date, nullable=True)
+    extracted_merchant = Column(String, nullable=True)
     linked_transaction_id = Column(String, ForeignKey("transaction.id"), nullable=True, index=True)
 
+    # Full-text search document over the OCR text, kept current by a trigger
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="attachments")
     linked_transaction: Mapped["Transaction"] = relationship(
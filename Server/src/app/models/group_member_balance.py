@@ -0,0 +1,17 @@
+"""Group Member Balance model for Splitwise functionality."""
+
+from sqlalchemy import Column, ForeignKey, Numeric, String
+
+from src.core.db import Base
+
+
+class GroupMemberBalance(Base):
+    """Running net balance of a user in a group (ledger)."""
+
+    __tablename__ = "group_member_balance"
+
+    group_id = Column(String, ForeignKey("group.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(String, ForeignKey("user.id"), primary_key=True, index=True)
+
+    # Positive = user is owed money, negative = user owes money
+    balance = Column(Numeric(15, 2), default=0, nullable=False)
@@ -0,0 +1,17 @@
+"""Stored file model for content-addressed uploads."""
+
+from sqlalchemy import BigInteger, Column, Integer, String
+
+from src.core.db import Base
+
+
+class StoredFile(Base):
+    """A content-addressed blob on disk and how many records point at it."""
+
+    __tablename__ = "stored_file"
+
+    file_path = Column(String, primary_key=True)  # <subfolder>/ab/cd/<sha256><ext>
+    sha256 = Column(String(64), nullable=False, index=True)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String, nullable=True)
+    ref_count = Column(Integer, default=0, nullable=False)
@@ -2,8 +2,9 @@
 
 from datetime import date
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Date, ForeignKey, Numeric, String
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import Column, Date, ForeignKey, Index, Numeric, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, relationship
 
 from src.core.db import Base
 
@@ -19,6 +20,20 @@ class Transaction(Base):
     """Transaction model (Income / Expense / Transfer)."""
 
     __tablename__ = "transaction"
+    __table_args__ = (
+        # Keyset pagination: seek on (transaction_date, created_at, id) per user
+        Index("ix_transaction_user_date_created_id", "user_id", "transaction_date", "created_at", "id"),
+        # Receipt matching: equal (or nearly equal) amount, then a date window
+        Index("ix_transaction_user_amount_date", "user_id", "amount", "transaction_date"),
+        # Search: full-text (prefix) matching and trigram substring matching
+        Index("ix_transaction_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_transaction_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(String, primary_key=True, unique=True, index=True)
     user_id = Column(String, ForeignKey("user.id"), nullable=False, index=True)
@@ -34,6 +49,9 @@ class Transaction(Base):
     related_account_id = Column(String, ForeignKey("account.id"), nullable=True)  # For transfers
     group_expense_id = Column(String, ForeignKey("group_expense.id"), nullable=True, index=True)
 
+    # Full-text search document, kept current by a trigger (not loaded unless asked for)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="transactions")
     account: Mapped["Account"] = relationship(
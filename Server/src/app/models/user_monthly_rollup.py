@@ -0,0 +1,19 @@
+"""Monthly rollup model for Personal Finance aggregates."""
+
+from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
+
+from src.core.db import Base
+
+
+class UserMonthlyRollup(Base):
+    """Per-month income/expense totals, maintained alongside transactions."""
+
+    __tablename__ = "user_monthly_rollup"
+
+    user_id = Column(String, ForeignKey("user.id"), primary_key=True)
+    year_month = Column(String(7), primary_key=True)  # YYYY-MM
+    type = Column(String, primary_key=True)  # income | expense | transfer
+    category_id = Column(String, primary_key=True, default="", server_default="")  # "" = uncategorized
+
+    total = Column(Numeric(15, 2), default=0, nullable=False)
+    transaction_count = Column(Integer, default=0, nullable=False)
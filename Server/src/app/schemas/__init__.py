@@ -64,6 +64,8 @@ from src.app.schemas.transaction import (
     TransactionWithDetails,
     TransactionSummary,
     TransactionFilter,
+    TransactionImportRow,
+    TransactionImportResult,
 )
 from src.app.schemas.category import (
     Category,
@@ -89,6 +91,10 @@ from src.app.schemas.attachment import (
     AttachmentUpdate,
     AttachmentInDB,
     AttachmentWithTransaction,
+    AttachmentMatchCandidate,
+    AttachmentMatchSuggestion,
+    AttachmentAutoLink,
+    AttachmentAutoLinkResult,
 )
 
 # Splitwise Schemas
@@ -190,6 +196,8 @@ __all__ = [
     "TransactionWithDetails",
     "TransactionSummary",
     "TransactionFilter",
+    "TransactionImportRow",
+    "TransactionImportResult",
     "Category",
     "CategoryBase",
     "CategoryCreate",
@@ -209,6 +217,10 @@ __all__ = [
     "AttachmentUpdate",
     "AttachmentInDB",
     "AttachmentWithTransaction",
+    "AttachmentMatchCandidate",
+    "AttachmentMatchSuggestion",
+    "AttachmentAutoLink",
+    "AttachmentAutoLinkResult",
     # Splitwise
     "Group",
     "GroupBase",
@@ -1,7 +1,8 @@
 """Attachment schemas for Personal Finance (Bills/Receipts)."""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -21,6 +22,9 @@ class AttachmentUpdate(BaseModel):
     """Attachment update schema."""
     type: Optional[str] = None
     extracted_text: Optional[str] = None
+    extracted_amount: Optional[Decimal] = None
+    extracted_date: Optional[date] = None
+    extracted_merchant: Optional[str] = None
     linked_transaction_id: Optional[str] = None
 
 
@@ -28,6 +32,14 @@ class AttachmentInDB(AttachmentBase):
     """Attachment in DB schema."""
     id: str
     user_id: str
+    file_path: Optional[str] = None
+    ocr_status: Optional[str] = Field(None, description="Text extraction: pending | done | failed")
+    extracted_amount: Optional[Decimal] = Field(None, description="Total parsed from the text")
+    extracted_date: Optional[date] = Field(None, description="Date parsed from the text")
+    extracted_merchant: Optional[str] = Field(None, description="Merchant parsed from the text")
+    thumbnails: Optional[Dict[str, str]] = Field(
+        None, description="WebP thumbnail URLs keyed by longest edge in px (e.g. 256, 1024)"
+    )
     linked_transaction_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -47,3 +59,33 @@ class AttachmentWithTransaction(Attachment):
     transaction_description: Optional[str] = None
     transaction_date: Optional[datetime] = None
 
+
+class AttachmentMatchCandidate(BaseModel):
+    """Transaction that may be the one a receipt records."""
+    transaction_id: str
+    amount: Decimal
+    transaction_date: date
+    description: Optional[str] = None
+    score: float = Field(..., description="Match confidence from 0 to 1")
+
+
+class AttachmentMatchSuggestion(BaseModel):
+    """Ranked candidate transactions for an unlinked attachment."""
+    attachment_id: str
+    extracted_amount: Decimal
+    extracted_date: Optional[date] = None
+    extracted_merchant: Optional[str] = None
+    candidates: List[AttachmentMatchCandidate]
+
+
+class AttachmentAutoLink(BaseModel):
+    """An attachment linked (or, in a dry run, to be linked) by auto-link."""
+    attachment_id: str
+    transaction_id: str
+    score: float
+
+
+class AttachmentAutoLinkResult(BaseModel):
+    """Auto-link outcome."""
+    linked: List[AttachmentAutoLink]
+    dry_run: bool = False
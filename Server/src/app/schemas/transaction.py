@@ -79,3 +79,21 @@ class TransactionFilter(BaseModel):
     max_amount: Optional[Decimal] = None
     search: Optional[str] = None
 
+
+
+class TransactionImportRow(BaseModel):
+    """One row of a bulk statement import."""
+    type: str = Field(..., pattern="^(income|expense)$", description="Transaction type: income | expense")
+    amount: Decimal = Field(..., gt=0, description="Transaction amount")
+    transaction_date: date = Field(..., description="Date of transaction")
+    description: Optional[str] = Field(None, description="Transaction description")
+    currency: Optional[str] = Field(None, description="ISO 4217 currency code (defaults to the account's)")
+    category_id: Optional[str] = Field(None, description="Category ID")
+    account_id: Optional[str] = Field(None, description="Account ID (defaults to the import's account)")
+
+
+class TransactionImportResult(BaseModel):
+    """Bulk import outcome."""
+    imported: int = 0
+    skipped: int = 0
+    errors: List[str] = Field(default_factory=list, description="First validation errors, by row number")
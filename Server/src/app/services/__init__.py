@@ -10,6 +10,7 @@ from src.app.services.module import ModuleService
 from src.app.services.route import RouteService
 from src.app.services.sidebar import SidebarService
 from src.app.services.google_auth import GoogleAuthService
+from src.app.services.principal_cache import PrincipalCache
 
 # Personal Finance Services
 from src.app.services.account import AccountService
@@ -17,15 +18,25 @@ from src.app.services.transaction import TransactionService
 from src.app.services.category import CategoryService
 from src.app.services.subscription_service import SubscriptionService
 from src.app.services.attachment_service import AttachmentService
+from src.app.services.rollup_service import MonthlyRollupService
+from src.app.services.transaction_import_service import TransactionImportService
+from src.app.services.stored_file_service import StoredFileService
+from src.app.services.thumbnail_service import ThumbnailService
+from src.app.services.ocr_service import OcrService
+from src.app.services.receipt_matching_service import ReceiptMatchingService
 
 # Splitwise Services
 from src.app.services.group_service import GroupService
 from src.app.services.group_expense_service import GroupExpenseService
 from src.app.services.settlement_service import SettlementService
+from src.app.services.group_balance_service import GroupBalanceService
 
 # Dashboard Service
 from src.app.services.dashboard_service import DashboardService
 
+# Export Service
+from src.app.services.export_service import ExportService
+
 __all__ = [
     # Auth & RBAC
     "UserService",
@@ -37,16 +48,26 @@ __all__ = [
     "RouteService",
     "SidebarService",
     "GoogleAuthService",
+    "PrincipalCache",
     # Personal Finance
     "AccountService",
     "TransactionService",
     "CategoryService",
     "SubscriptionService",
     "AttachmentService",
+    "MonthlyRollupService",
+    "TransactionImportService",
+    "StoredFileService",
+    "ThumbnailService",
+    "OcrService",
+    "ReceiptMatchingService",
     # Splitwise
     "GroupService",
     "GroupExpenseService",
     "SettlementService",
+    "GroupBalanceService",
     # Dashboard
     "DashboardService",
+    # Export
+    "ExportService",
 ]
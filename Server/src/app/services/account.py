@@ -1,15 +1,16 @@
 """Account service for Personal Finance."""
 
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.app.models import Account, Transaction
 from src.app.schemas import AccountCreate, AccountUpdate
 from src.app.services.base import BaseService
+from src.core.cache import TaggedCache, account_tag, user_tag
 
 
 class AccountService(BaseService[Account]):
@@ -59,6 +60,7 @@ class AccountService(BaseService[Account]):
         )
         self.db.add(account)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id), account_tag(account.id))
         await self.db.refresh(account)
         return account
 
@@ -75,6 +77,7 @@ class AccountService(BaseService[Account]):
             setattr(account, key, value)
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id), account_tag(account_id))
         await self.db.refresh(account)
         return account
 
@@ -86,6 +89,7 @@ class AccountService(BaseService[Account]):
         
         account.is_active = False
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id), account_tag(account_id))
         return True
 
     async def get_total_balance(self, user_id: str) -> Decimal:
@@ -100,23 +104,39 @@ class AccountService(BaseService[Account]):
 
     async def update_balance(
         self, account_id: str, amount: Decimal, is_credit: bool
-    ) -> Optional[Account]:
-        """Update account balance after a transaction."""
-        query = select(Account).where(Account.id == account_id)
+    ) -> Optional[Decimal]:
+        """
+        Credit or debit an account after a transaction.
+
+        Runs as one atomic UPDATE ... RETURNING inside the caller's
+        transaction (the caller commits), so concurrent updates to the same
+        account cannot overwrite each other. Returns the new balance, or
+        None if the account does not exist.
+        """
+        delta = amount if is_credit else -amount
+        query = (
+            update(Account)
+            .where(Account.id == account_id)
+            .values(current_balance=Account.current_balance + delta)
+            .returning(Account.current_balance)
+        )
         result = await self.db.execute(query)
-        account = result.scalar_one_or_none()
-        
-        if not account:
-            return None
-        
-        if is_credit:
-            account.current_balance += amount
-        else:
-            account.current_balance -= amount
-        
-        await self.db.commit()
-        await self.db.refresh(account)
-        return account
+        return result.scalar_one_or_none()
+
+    async def apply_balance_deltas(self, deltas: Dict[str, Decimal]) -> None:
+        """
+        Add a net delta to each account's balance inside the caller's transaction.
+
+        Each account gets one atomic UPDATE, so concurrent writers cannot
+        lose each other's changes.
+        """
+        for account_id, delta in deltas.items():
+            if delta:
+                await self.db.execute(
+                    update(Account)
+                    .where(Account.id == account_id)
+                    .values(current_balance=Account.current_balance + delta)
+                )
 
     async def transfer_money(
         self,
@@ -125,16 +145,31 @@ class AccountService(BaseService[Account]):
         amount: Decimal,
         user_id: str
     ) -> bool:
-        """Transfer money between accounts."""
-        from_account = await self.get_by_id(from_account_id, user_id)
-        to_account = await self.get_by_id(to_account_id, user_id)
-        
-        if not from_account or not to_account:
+        """
+        Transfer money between two of the user's accounts.
+
+        Both balances move in a single UPDATE inside the caller's
+        transaction; nothing changes unless both accounts belong to the user.
+        """
+        if from_account_id == to_account_id:
             return False
         
-        from_account.current_balance -= amount
-        to_account.current_balance += amount
-        
-        await self.db.commit()
-        return True
-
+        account_ids = (from_account_id, to_account_id)
+        owned = aliased(Account)
+        owned_count = (
+            select(func.count(owned.id))
+            .where(owned.id.in_(account_ids), owned.user_id == user_id)
+            .scalar_subquery()
+        )
+        query = (
+            update(Account)
+            .where(Account.id.in_(account_ids), Account.user_id == user_id, owned_count == 2)
+            .values(
+                current_balance=Account.current_balance + case(
+                    (Account.id == from_account_id, -amount), else_=amount
+                )
+            )
+            .returning(Account.id)
+        )
+        result = await self.db.execute(query)
+        return len(result.all()) == 2
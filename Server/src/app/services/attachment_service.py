@@ -2,6 +2,7 @@
 
 import uuid
 from typing import List, Optional
+from fastapi import UploadFile
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -9,6 +10,13 @@ from sqlalchemy.orm import selectinload
 from src.app.models import Attachment, Transaction
 from src.app.schemas import AttachmentCreate, AttachmentUpdate
 from src.app.services.base import BaseService
+from src.app.services.ocr_service import OCR_PENDING, OcrService
+from src.app.services.stored_file_service import StoredFileService
+from src.app.services.thumbnail_service import ThumbnailService
+from src.core.cache import TaggedCache, user_tag
+from src.core.utils import file_upload_service
+
+ATTACHMENT_SUBFOLDER = "attachments"
 
 
 class AttachmentService(BaseService[Attachment]):
@@ -64,7 +72,34 @@ class AttachmentService(BaseService[Attachment]):
         )
         self.db.add(attachment)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
+        await self.db.refresh(attachment)
+        return attachment
+
+    async def upload_attachment(
+        self,
+        user_id: str,
+        file: UploadFile,
+        attachment_type: str,
+        linked_transaction_id: Optional[str] = None,
+    ) -> Attachment:
+        """Store an uploaded bill/receipt and create its attachment."""
+        file_info = await StoredFileService(self.db).save(file, subfolder=ATTACHMENT_SUBFOLDER)
+        attachment = Attachment(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            file_url=file_upload_service.get_file_url(file_info["file_path"]),
+            file_path=file_info["file_path"],
+            ocr_status=OCR_PENDING,
+            type=attachment_type,
+            linked_transaction_id=linked_transaction_id,
+        )
+        self.db.add(attachment)
+        await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(attachment)
+        ThumbnailService.schedule(attachment.id, user_id, attachment.file_path)
+        await OcrService.enqueue(attachment)
         return attachment
 
     async def update_attachment(
@@ -80,6 +115,7 @@ class AttachmentService(BaseService[Attachment]):
             setattr(attachment, key, value)
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(attachment)
         return attachment
 
@@ -89,8 +125,15 @@ class AttachmentService(BaseService[Attachment]):
         if not attachment:
             return False
         
+        stored_files = StoredFileService(self.db)
+        released = None
+        if attachment.file_path:
+            released = await stored_files.release(attachment.file_path)
         await self.db.delete(attachment)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
+        # Only once the rows are gone for good
+        await stored_files.purge([released])
         return True
 
     async def link_to_transaction(
@@ -103,6 +146,7 @@ class AttachmentService(BaseService[Attachment]):
         
         attachment.linked_transaction_id = transaction_id
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(attachment)
         return attachment
 
@@ -116,6 +160,7 @@ class AttachmentService(BaseService[Attachment]):
         
         attachment.linked_transaction_id = None
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(attachment)
         return attachment
 
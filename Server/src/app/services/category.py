@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.models import Category, Transaction
 from src.app.schemas import CategoryCreate, CategoryUpdate
 from src.app.services.base import BaseService
+from src.core.cache import TaggedCache, user_tag
 
 
 class CategoryService(BaseService[Category]):
@@ -52,6 +53,7 @@ class CategoryService(BaseService[Category]):
         )
         self.db.add(category)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(category)
         return category
 
@@ -68,6 +70,7 @@ class CategoryService(BaseService[Category]):
             setattr(category, key, value)
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(category)
         return category
 
@@ -79,6 +82,7 @@ class CategoryService(BaseService[Category]):
         
         await self.db.delete(category)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         return True
 
     async def get_with_stats(self, user_id: str) -> List[dict]:
@@ -148,5 +152,6 @@ class CategoryService(BaseService[Category]):
             categories.append(category)
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         return categories
 
@@ -3,14 +3,15 @@
 from datetime import date, timedelta
 from typing import Optional
 from decimal import Decimal
-from sqlalchemy import select, func, extract
+from sqlalchemy import select, func, extract, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.models import (
     Account, Transaction, Category, Subscription,
-    Group, GroupMember, GroupExpense, ExpenseSplit
+    Group, GroupMember, GroupMemberBalance, GroupExpense, ExpenseSplit, UserMonthlyRollup
 )
 from src.app.schemas import DashboardSummary, AnalyticsData, MonthlySummary
+from src.app.services.rollup_service import month_key
 
 
 class DashboardService:
@@ -20,137 +21,177 @@ class DashboardService:
         self.db = db
 
     async def get_dashboard_summary(self, user_id: str) -> dict:
-        """Get main dashboard summary."""
-        # Net balance from accounts
-        balance_query = select(func.coalesce(func.sum(Account.current_balance), 0)).where(
-            Account.user_id == user_id,
-            Account.is_active == True
+        """Get main dashboard summary in a single round trip."""
+        row = (await self.db.execute(self._summary_query(user_id))).one()
+
+        return {
+            "net_balance": Decimal(str(row.net_balance)),
+            "total_income": Decimal(str(row.total_income)),
+            "total_expense": Decimal(str(row.total_expense)),
+            "pending_group_dues": Decimal(str(row.pending_group_dues)),
+            "account_count": row.account_count,
+            "group_count": row.group_count,
+        }
+
+    def _summary_query(self, user_id: str):
+        """
+        Build the dashboard summary as one statement.
+
+        Every figure lives in its own single-row CTE and the final SELECT
+        cross joins them, so the database computes the whole summary in
+        one pass instead of one query per number.
+        """
+        first_of_month = date.today().replace(day=1)
+
+        # Net balance and count of active accounts
+        account_totals = (
+            select(
+                func.coalesce(func.sum(Account.current_balance), 0).label("net_balance"),
+                func.count(Account.id).label("account_count"),
+            )
+            .where(Account.user_id == user_id, Account.is_active == True)
+            .cte("account_totals")
         )
-        net_balance = Decimal(str((await self.db.execute(balance_query)).scalar_one()))
-        
-        # This month's transactions
-        today = date.today()
-        first_of_month = today.replace(day=1)
-        
-        income_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            Transaction.user_id == user_id,
-            Transaction.type == "income",
-            Transaction.transaction_date >= first_of_month
+
+        # This month's income and expense, read from the monthly rollup
+        month_totals = (
+            select(
+                func.coalesce(
+                    func.sum(UserMonthlyRollup.total).filter(UserMonthlyRollup.type == "income"), 0
+                ).label("total_income"),
+                func.coalesce(
+                    func.sum(UserMonthlyRollup.total).filter(UserMonthlyRollup.type == "expense"), 0
+                ).label("total_expense"),
+            )
+            .where(
+                UserMonthlyRollup.user_id == user_id,
+                UserMonthlyRollup.year_month >= month_key(first_of_month),
+            )
+            .cte("month_totals")
         )
-        total_income = Decimal(str((await self.db.execute(income_query)).scalar_one()))
-        
-        expense_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            Transaction.user_id == user_id,
-            Transaction.type == "expense",
-            Transaction.transaction_date >= first_of_month
+
+        # Groups the user belongs to, and what the user owes across them
+        memberships = self._memberships_cte(user_id)
+        pending_dues = self._pending_dues_cte(user_id, memberships)
+
+        group_totals = (
+            select(func.count(memberships.c.group_id).label("group_count"))
+            .cte("group_totals")
+        )
+
+        return select(
+            account_totals.c.net_balance,
+            month_totals.c.total_income,
+            month_totals.c.total_expense,
+            pending_dues.c.pending_group_dues,
+            account_totals.c.account_count,
+            group_totals.c.group_count,
+        ).select_from(
+            account_totals
+            .join(month_totals, true())
+            .join(pending_dues, true())
+            .join(group_totals, true())
         )
-        total_expense = Decimal(str((await self.db.execute(expense_query)).scalar_one()))
-        
-        # Pending group dues
-        pending_dues = await self._calculate_pending_dues(user_id)
-        
-        # Counts
-        account_count = (await self.db.execute(
-            select(func.count(Account.id)).where(
-                Account.user_id == user_id,
-                Account.is_active == True
-            )
-        )).scalar_one()
-        
-        group_count = (await self.db.execute(
-            select(func.count(GroupMember.id)).where(GroupMember.user_id == user_id)
-        )).scalar_one()
-        
-        return {
-            "net_balance": net_balance,
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "pending_group_dues": pending_dues,
-            "account_count": account_count,
-            "group_count": group_count,
-        }
 
     async def _calculate_pending_dues(self, user_id: str) -> Decimal:
-        """Calculate total pending dues across all groups."""
-        # Get all groups user is member of
-        groups_query = select(GroupMember.group_id).where(GroupMember.user_id == user_id)
-        groups_result = await self.db.execute(groups_query)
-        group_ids = [row[0] for row in groups_result.all()]
-        
-        if not group_ids:
-            return Decimal("0.00")
-        
-        total_dues = Decimal("0.00")
-        
-        for group_id in group_ids:
-            # What user owes (their share)
-            owed_query = select(func.coalesce(func.sum(ExpenseSplit.share_amount), 0)).where(
-                ExpenseSplit.user_id == user_id
-            ).join(GroupExpense).where(GroupExpense.group_id == group_id)
-            total_owed = Decimal(str((await self.db.execute(owed_query)).scalar_one()))
-            
-            # What user paid
-            paid_query = select(func.coalesce(func.sum(GroupExpense.amount), 0)).where(
-                GroupExpense.group_id == group_id,
-                GroupExpense.paid_by == user_id
+        """Calculate total pending dues across all groups in one query."""
+        pending_dues = self._pending_dues_cte(user_id, self._memberships_cte(user_id))
+        query = select(pending_dues.c.pending_group_dues)
+        return Decimal(str((await self.db.execute(query)).scalar_one()))
+
+    def _memberships_cte(self, user_id: str):
+        """Groups the user belongs to."""
+        return (
+            select(GroupMember.group_id)
+            .where(GroupMember.user_id == user_id)
+            .cte("memberships")
+        )
+
+    def _pending_dues_cte(self, user_id: str, memberships):
+        """Sum of what the user owes over every group with a negative balance."""
+        group_balances = self._group_balances_cte(user_id, memberships)
+        return (
+            select(
+                func.coalesce(
+                    func.sum(-group_balances.c.balance).filter(group_balances.c.balance < 0), 0
+                ).label("pending_group_dues")
             )
-            total_paid = Decimal(str((await self.db.execute(paid_query)).scalar_one()))
-            
-            balance = total_paid - total_owed
-            if balance < 0:
-                total_dues += abs(balance)
-        
-        return total_dues
+            .cte("pending_dues")
+        )
+
+    def _group_balances_cte(self, user_id: str, memberships):
+        """
+        Per-group balance of the user for every group in ``memberships``.
+
+        Reads the group_member_balance ledger, which holds the same
+        (paid + settlements received) - (owed + settlements made) figure as
+        GroupService.calculate_user_balance, so every group is a single
+        indexed row.
+        """
+        return (
+            select(GroupMemberBalance.balance.label("balance"))
+            .where(
+                GroupMemberBalance.user_id == user_id,
+                GroupMemberBalance.group_id.in_(select(memberships.c.group_id)),
+            )
+            .cte("group_balances")
+        )
 
     async def get_monthly_breakdown(
         self, user_id: str, months: int = 6
     ) -> list:
         """Get income/expense breakdown for last N months."""
         today = date.today()
-        breakdowns = []
+        month_keys = []
         
         for i in range(months):
-            # Calculate month start and end
-            month_offset = i
+            # Calculate month key
             year = today.year
-            month = today.month - month_offset
+            month = today.month - i
             
             while month <= 0:
                 month += 12
                 year -= 1
             
-            start_date = date(year, month, 1)
-            if month == 12:
-                end_date = date(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = date(year, month + 1, 1) - timedelta(days=1)
-            
-            # Query income
-            income_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-                Transaction.user_id == user_id,
-                Transaction.type == "income",
-                Transaction.transaction_date >= start_date,
-                Transaction.transaction_date <= end_date
-            )
-            income = Decimal(str((await self.db.execute(income_query)).scalar_one()))
-            
-            # Query expense
-            expense_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-                Transaction.user_id == user_id,
-                Transaction.type == "expense",
-                Transaction.transaction_date >= start_date,
-                Transaction.transaction_date <= end_date
-            )
-            expense = Decimal(str((await self.db.execute(expense_query)).scalar_one()))
-            
+            month_keys.append(f"{year}-{month:02d}")
+        
+        totals = await self._monthly_totals(user_id, month_keys)
+        
+        breakdowns = []
+        for key in reversed(month_keys):
+            income, expense = totals.get(key, (Decimal("0.00"), Decimal("0.00")))
             breakdowns.append({
-                "month": f"{year}-{month:02d}",
+                "month": key,
                 "income": income,
                 "expense": expense,
                 "net": income - expense,
             })
         
-        return list(reversed(breakdowns))
+        return breakdowns
+
+    async def _monthly_totals(self, user_id: str, month_keys: list) -> dict:
+        """Get {YYYY-MM: (income, expense)} for the given months from the rollup."""
+        query = (
+            select(
+                UserMonthlyRollup.year_month,
+                func.coalesce(
+                    func.sum(UserMonthlyRollup.total).filter(UserMonthlyRollup.type == "income"), 0
+                ).label("income"),
+                func.coalesce(
+                    func.sum(UserMonthlyRollup.total).filter(UserMonthlyRollup.type == "expense"), 0
+                ).label("expense"),
+            )
+            .where(
+                UserMonthlyRollup.user_id == user_id,
+                UserMonthlyRollup.year_month.in_(month_keys),
+            )
+            .group_by(UserMonthlyRollup.year_month)
+        )
+        result = await self.db.execute(query)
+        return {
+            row.year_month: (Decimal(str(row.income)), Decimal(str(row.expense)))
+            for row in result.all()
+        }
 
     async def get_category_breakdown(
         self, user_id: str, transaction_type: str = "expense",
@@ -203,40 +244,20 @@ class DashboardService:
 
     async def get_monthly_summary(self, user_id: str, year: int, month: int) -> dict:
         """Get detailed monthly summary."""
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = date(year, month + 1, 1) - timedelta(days=1)
+        key = f"{year}-{month:02d}"
         
-        # Income
-        income_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            Transaction.user_id == user_id,
-            Transaction.type == "income",
-            Transaction.transaction_date >= start_date,
-            Transaction.transaction_date <= end_date
-        )
-        total_income = Decimal(str((await self.db.execute(income_query)).scalar_one()))
-        
-        # Expense
-        expense_query = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            Transaction.user_id == user_id,
-            Transaction.type == "expense",
-            Transaction.transaction_date >= start_date,
-            Transaction.transaction_date <= end_date
-        )
-        total_expense = Decimal(str((await self.db.execute(expense_query)).scalar_one()))
+        # Income and expense
+        totals = await self._monthly_totals(user_id, [key])
+        total_income, total_expense = totals.get(key, (Decimal("0.00"), Decimal("0.00")))
         
         # Group dues
         group_dues = await self._calculate_pending_dues(user_id)
         
         # Top categories
-        top_categories = await self.get_category_breakdown(
-            user_id, "expense", start_date, end_date
-        )
+        top_categories = await self._monthly_category_breakdown(user_id, "expense", key)
         
         return {
-            "month": f"{year}-{month:02d}",
+            "month": key,
             "total_income": total_income,
             "total_expense": total_expense,
             "group_dues": group_dues,
@@ -244,6 +265,48 @@ class DashboardService:
             "top_categories": top_categories[:5],
         }
 
+    async def _monthly_category_breakdown(
+        self, user_id: str, transaction_type: str, year_month: str
+    ) -> list:
+        """Get spending breakdown by category for one month from the rollup."""
+        query = (
+            select(
+                Category.id,
+                Category.name,
+                Category.icon,
+                Category.color,
+                UserMonthlyRollup.total,
+                UserMonthlyRollup.transaction_count,
+            )
+            .join(Category, UserMonthlyRollup.category_id == Category.id)
+            .where(
+                UserMonthlyRollup.user_id == user_id,
+                UserMonthlyRollup.type == transaction_type,
+                UserMonthlyRollup.year_month == year_month,
+                UserMonthlyRollup.transaction_count > 0,
+            )
+            .order_by(UserMonthlyRollup.total.desc())
+        )
+        
+        result = await self.db.execute(query)
+        rows = result.all()
+        
+        # Calculate total for percentages
+        total = sum(row.total or 0 for row in rows)
+        
+        return [
+            {
+                "category_id": row.id,
+                "category_name": row.name,
+                "category_icon": row.icon,
+                "category_color": row.color,
+                "amount": row.total or Decimal("0.00"),
+                "percentage": float((row.total or 0) / total * 100) if total > 0 else 0,
+                "transaction_count": row.transaction_count,
+            }
+            for row in rows
+        ]
+
     async def get_analytics(
         self, user_id: str, start_date: Optional[date] = None, end_date: Optional[date] = None
     ) -> dict:
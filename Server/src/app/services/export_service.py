@@ -0,0 +1,225 @@
+"""Streaming data export service for Personal Finance and Splitwise data."""
+
+import csv
+import io
+from typing import AsyncIterator, List, Optional, Sequence
+
+from sqlalchemy import Date, DateTime, Numeric, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import (
+    Account,
+    Category,
+    ExpenseSplit,
+    GroupExpense,
+    GroupMember,
+    Settlement,
+    Transaction,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: poetry install --extras export
+    pa = None
+    pq = None
+
+# Rows fetched per server-side cursor round trip and written per output chunk
+CHUNK_ROWS = 5000
+
+DATASETS = ("transactions", "group_expenses", "settlements")
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Writers record offsets from tell(); it must count every byte ever written
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ExportService:
+    """
+    Streams a user's history as CSV, Parquet or Arrow IPC.
+
+    Rows come from a server-side cursor CHUNK_ROWS at a time and each chunk
+    is encoded and yielded before the next is fetched, so memory stays flat
+    however long the history is.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def columnar_available() -> bool:
+        """Whether the optional pyarrow dependency is installed."""
+        return pa is not None
+
+    def build_query(self, dataset: str, user_id: str, group_id: Optional[str] = None) -> Select:
+        """
+        Flat SELECT for a dataset.
+
+        Transactions are the user's own; group expenses (one row per split)
+        and settlements cover every group the user is a member of.
+
+        Raises:
+            ValueError: If the dataset is unknown
+        """
+        if dataset == "transactions":
+            return (
+                select(
+                    Transaction.id,
+                    Transaction.transaction_date,
+                    Transaction.type,
+                    Transaction.amount,
+                    Transaction.currency,
+                    Transaction.description,
+                    Account.name.label("account"),
+                    Category.name.label("category"),
+                    Transaction.related_account_id,
+                    Transaction.group_expense_id,
+                    Transaction.created_at,
+                )
+                .join(Account, Transaction.account_id == Account.id)
+                .outerjoin(Category, Transaction.category_id == Category.id)
+                .where(Transaction.user_id == user_id)
+                .order_by(Transaction.transaction_date, Transaction.created_at, Transaction.id)
+            )
+
+        member_groups = select(GroupMember.group_id).where(GroupMember.user_id == user_id)
+        if dataset == "group_expenses":
+            query = (
+                select(
+                    GroupExpense.id.label("expense_id"),
+                    GroupExpense.group_id,
+                    GroupExpense.title,
+                    GroupExpense.amount,
+                    GroupExpense.currency,
+                    GroupExpense.split_type,
+                    GroupExpense.paid_by,
+                    ExpenseSplit.user_id.label("split_user_id"),
+                    ExpenseSplit.share_amount,
+                    ExpenseSplit.share_percentage,
+                    GroupExpense.created_at,
+                )
+                .join(ExpenseSplit, ExpenseSplit.group_expense_id == GroupExpense.id)
+                .where(GroupExpense.group_id.in_(member_groups))
+                .order_by(GroupExpense.created_at, GroupExpense.id, ExpenseSplit.user_id)
+            )
+            if group_id:
+                query = query.where(GroupExpense.group_id == group_id)
+            return query
+
+        if dataset == "settlements":
+            query = (
+                select(
+                    Settlement.id,
+                    Settlement.group_id,
+                    Settlement.from_user_id,
+                    Settlement.to_user_id,
+                    Settlement.amount,
+                    Settlement.currency,
+                    Settlement.method,
+                    Settlement.settled_at,
+                )
+                .where(Settlement.group_id.in_(member_groups))
+                .order_by(Settlement.settled_at, Settlement.id)
+            )
+            if group_id:
+                query = query.where(Settlement.group_id == group_id)
+            return query
+
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    async def stream(self, query: Select, file_format: str) -> AsyncIterator[bytes]:
+        """
+        Encode a query's rows chunk by chunk.
+
+        Raises:
+            ValueError: If the format is unknown or needs pyarrow and it is missing
+        """
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown format: {file_format}")
+        if file_format != "csv" and not self.columnar_available():
+            raise ValueError(f"{file_format} export needs pyarrow (install the 'export' extra)")
+
+        partitions = self._partitions(query)
+        if file_format == "csv":
+            return self._csv_chunks(query, partitions)
+        return self._arrow_chunks(query, partitions, file_format)
+
+    async def _partitions(self, query: Select) -> AsyncIterator[Sequence]:
+        """Fetch rows through a server-side cursor, CHUNK_ROWS per partition."""
+        result = await self.db.stream(query.execution_options(yield_per=CHUNK_ROWS))
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    async def _csv_chunks(query: Select, partitions: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.name for column in query.selected_columns])
+        async for rows in partitions:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate(0)
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    @classmethod
+    async def _arrow_chunks(
+        cls, query: Select, partitions: AsyncIterator[Sequence], file_format: str
+    ) -> AsyncIterator[bytes]:
+        schema = pa.schema([
+            pa.field(column.name, cls._arrow_type(column.type)) for column in query.selected_columns
+        ])
+        sink = _ChunkSink()
+        if file_format == "parquet":
+            writer = pq.ParquetWriter(sink, schema)
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+
+        async for rows in partitions:
+            # One Parquet row group / Arrow record batch per partition
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    def _arrow_type(column_type) -> "pa.DataType":
+        """Arrow type for a SQLAlchemy column type."""
+        if isinstance(column_type, Numeric):
+            return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+        if isinstance(column_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(column_type, Date):
+            return pa.date32()
+        return pa.string()
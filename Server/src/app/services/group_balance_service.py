@@ -0,0 +1,181 @@
+"""Group balance ledger service for Splitwise functionality."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import ExpenseSplit, GroupExpense, GroupMember, GroupMemberBalance, Settlement
+from src.core.cache import group_tag, user_tag
+
+# (group_id, user_id) -> balance delta
+BalanceDeltas = Dict[Tuple[str, str], Decimal]
+
+
+class GroupBalanceService:
+    """
+    Maintains group_member_balance, the running net of every member.
+
+    Balance = (paid + settlements received) - (owed + settlements made),
+    the same formula GroupService has always used. Writers call this
+    service inside their own transaction so the ledger commits (or rolls
+    back) together with the expense or settlement that changed it.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_balance(self, group_id: str, user_id: str) -> Decimal:
+        """Get a user's balance in a group."""
+        query = select(GroupMemberBalance.balance).where(
+            GroupMemberBalance.group_id == group_id,
+            GroupMemberBalance.user_id == user_id,
+        )
+        balance = (await self.db.execute(query)).scalar_one_or_none()
+        return Decimal(str(balance)) if balance is not None else Decimal("0.00")
+
+    async def get_user_balances(self, user_id: str) -> Dict[str, Decimal]:
+        """Get {group_id: balance} for every group the user has a ledger row in."""
+        query = select(GroupMemberBalance.group_id, GroupMemberBalance.balance).where(
+            GroupMemberBalance.user_id == user_id
+        )
+        result = await self.db.execute(query)
+        return {row.group_id: Decimal(str(row.balance)) for row in result.all()}
+
+    async def cache_tags(self, group_id: str) -> List[str]:
+        """Cache tags for the group and every member, whose dashboards include their balance."""
+        query = select(GroupMember.user_id).where(GroupMember.group_id == group_id)
+        members = (await self.db.execute(query)).scalars().all()
+        return [group_tag(group_id), *(user_tag(user_id) for user_id in members)]
+
+    async def apply_expense(self, expense_id: str, sign: int = 1) -> None:
+        """
+        Add (sign=1) or reverse (sign=-1) an expense as currently stored.
+
+        Reads the payer and splits from the database, so call it after the
+        expense has been flushed when adding, and before changing it when
+        reversing.
+        """
+        paid = select(
+            GroupExpense.group_id.label("group_id"),
+            GroupExpense.paid_by.label("user_id"),
+            GroupExpense.amount.label("amount"),
+        ).where(GroupExpense.id == expense_id)
+        owed = (
+            select(
+                GroupExpense.group_id.label("group_id"),
+                ExpenseSplit.user_id.label("user_id"),
+                (-ExpenseSplit.share_amount).label("amount"),
+            )
+            .join(GroupExpense, ExpenseSplit.group_expense_id == GroupExpense.id)
+            .where(ExpenseSplit.group_expense_id == expense_id)
+        )
+        flows = union_all(paid, owed).subquery("flows")
+        now = datetime.utcnow()
+        source = (
+            select(
+                flows.c.group_id,
+                flows.c.user_id,
+                func.sum(flows.c.amount) * sign,
+                literal(now),
+                literal(now),
+            )
+            .group_by(flows.c.group_id, flows.c.user_id)
+        )
+        await self._upsert_from_select(source)
+
+    async def apply_settlement(self, settlement: Settlement, sign: int = 1) -> None:
+        """Add (sign=1) or reverse (sign=-1) a settlement."""
+        amount = Decimal(str(settlement.amount)) * sign
+        await self.apply({
+            (settlement.group_id, settlement.to_user_id): amount,
+            (settlement.group_id, settlement.from_user_id): -amount,
+        })
+
+    async def apply(self, deltas: BalanceDeltas) -> None:
+        """Upsert balance deltas in a single statement."""
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        stmt = pg_insert(GroupMemberBalance).values([
+            {
+                "group_id": group_id,
+                "user_id": user_id,
+                "balance": delta,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (group_id, user_id), delta in deltas.items()
+        ])
+        await self.db.execute(self._on_conflict_add(stmt, now))
+
+    async def _upsert_from_select(self, source) -> None:
+        """Upsert (group_id, user_id, delta, created_at, updated_at) rows from a SELECT."""
+        stmt = pg_insert(GroupMemberBalance).from_select(
+            ["group_id", "user_id", "balance", "created_at", "updated_at"], source
+        )
+        await self.db.execute(self._on_conflict_add(stmt, datetime.utcnow()))
+
+    @staticmethod
+    def _on_conflict_add(stmt, now: datetime):
+        """Make an insert add its balance onto an existing ledger row."""
+        return stmt.on_conflict_do_update(
+            index_elements=[GroupMemberBalance.group_id, GroupMemberBalance.user_id],
+            set_={
+                "balance": GroupMemberBalance.balance + stmt.excluded.balance,
+                "updated_at": now,
+            },
+        )
+
+    async def rebuild(self, group_id: Optional[str] = None) -> None:
+        """Recompute the ledger from expenses, splits and settlements."""
+        flows: List = [
+            select(
+                GroupExpense.group_id.label("group_id"),
+                GroupExpense.paid_by.label("user_id"),
+                GroupExpense.amount.label("amount"),
+            ),
+            select(
+                GroupExpense.group_id.label("group_id"),
+                ExpenseSplit.user_id.label("user_id"),
+                (-ExpenseSplit.share_amount).label("amount"),
+            ).join(GroupExpense, ExpenseSplit.group_expense_id == GroupExpense.id),
+            select(
+                Settlement.group_id.label("group_id"),
+                Settlement.to_user_id.label("user_id"),
+                Settlement.amount.label("amount"),
+            ),
+            select(
+                Settlement.group_id.label("group_id"),
+                Settlement.from_user_id.label("user_id"),
+                (-Settlement.amount).label("amount"),
+            ),
+        ]
+        clear = delete(GroupMemberBalance)
+        if group_id:
+            clear = clear.where(GroupMemberBalance.group_id == group_id)
+            flows = [
+                flows[0].where(GroupExpense.group_id == group_id),
+                flows[1].where(GroupExpense.group_id == group_id),
+                flows[2].where(Settlement.group_id == group_id),
+                flows[3].where(Settlement.group_id == group_id),
+            ]
+
+        all_flows = union_all(*flows).subquery("flows")
+        source = (
+            select(
+                all_flows.c.group_id,
+                all_flows.c.user_id,
+                func.sum(all_flows.c.amount),
+                func.now(),
+                func.now(),
+            )
+            .group_by(all_flows.c.group_id, all_flows.c.user_id)
+        )
+
+        await self.db.execute(clear)
+        await self._upsert_from_select(source)
@@ -10,6 +10,8 @@ from sqlalchemy.orm import selectinload
 from src.app.models import GroupExpense, ExpenseSplit, Group, GroupMember, User
 from src.app.schemas import GroupExpenseCreate, GroupExpenseUpdate, ExpenseSplitInput
 from src.app.services.base import BaseService
+from src.app.services.group_balance_service import GroupBalanceService
+from src.core.cache import TaggedCache
 
 
 class GroupExpenseService(BaseService[GroupExpense]):
@@ -17,6 +19,7 @@ class GroupExpenseService(BaseService[GroupExpense]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, GroupExpense)
+        self.balances = GroupBalanceService(db)
 
     async def get_by_id(self, expense_id: str, user_id: str) -> Optional[GroupExpense]:
         """Get expense by ID (only if user is in the group)."""
@@ -95,7 +98,12 @@ class GroupExpenseService(BaseService[GroupExpense]):
         elif data.split_type in ["unequal", "percentage"]:
             await self._create_custom_splits(expense_id, data.splits, data.amount, data.split_type)
         
+        # Post the expense to the balance ledger
+        await self.db.flush()
+        await self.balances.apply_expense(expense_id)
+        
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(data.group_id))
         await self.db.refresh(expense)
         return expense
 
@@ -154,6 +162,9 @@ class GroupExpenseService(BaseService[GroupExpense]):
         if not expense or expense.paid_by != user_id:
             return None
         
+        # Reverse the stored expense before changing it
+        await self.balances.apply_expense(expense_id, sign=-1)
+        
         update_data = data.model_dump(exclude_unset=True, exclude={"splits"})
         for key, value in update_data.items():
             setattr(expense, key, value)
@@ -175,7 +186,12 @@ class GroupExpenseService(BaseService[GroupExpense]):
                     expense_id, data.splits, expense.amount, expense.split_type
                 )
         
+        # Post the updated expense to the balance ledger
+        await self.db.flush()
+        await self.balances.apply_expense(expense_id)
+        
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(expense.group_id))
         await self.db.refresh(expense)
         return expense
 
@@ -185,8 +201,10 @@ class GroupExpenseService(BaseService[GroupExpense]):
         if not expense or expense.paid_by != user_id:
             return False
         
+        await self.balances.apply_expense(expense_id, sign=-1)
         await self.db.delete(expense)
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(expense.group_id))
         return True
 
     async def get_expense_with_splits(self, expense_id: str, user_id: str) -> Optional[dict]:
@@ -8,9 +8,11 @@ from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.app.models import Group, GroupMember, GroupExpense, ExpenseSplit, Settlement, User
+from src.app.models import Group, GroupMember, GroupExpense, GroupMemberBalance, User
 from src.app.schemas import GroupCreate, GroupUpdate
 from src.app.services.base import BaseService
+from src.app.services.group_balance_service import GroupBalanceService
+from src.core.cache import TaggedCache
 
 
 class GroupService(BaseService[Group]):
@@ -18,6 +20,7 @@ class GroupService(BaseService[Group]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Group)
+        self.balances = GroupBalanceService(db)
 
     async def get_by_id(self, group_id: str, user_id: str) -> Optional[Group]:
         """Get group by ID (only if user is a member)."""
@@ -45,18 +48,19 @@ class GroupService(BaseService[Group]):
         result = await self.db.execute(query)
         groups = result.scalars().unique().all()
         
+        group_ids = [group.id for group in groups]
+        balances = await self.balances.get_user_balances(user_id)
+        totals = await self.get_total_expenses_by_group(group_ids)
+        
         summaries = []
         for group in groups:
-            balance = await self.calculate_user_balance(group.id, user_id)
-            total_expenses = await self.get_total_expenses(group.id)
-            
             summaries.append({
                 "id": group.id,
                 "name": group.name,
                 "currency": group.currency,
                 "member_count": len(group.members),
-                "total_expenses": total_expenses,
-                "your_balance": balance,
+                "total_expenses": totals.get(group.id, Decimal("0.00")),
+                "your_balance": balances.get(group.id, Decimal("0.00")),
                 "created_at": group.created_at,
             })
         
@@ -97,6 +101,7 @@ class GroupService(BaseService[Group]):
                 self.db.add(member)
         
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(group_id))
         await self.db.refresh(group)
         return group
 
@@ -117,6 +122,7 @@ class GroupService(BaseService[Group]):
             setattr(group, key, value)
         
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(group_id))
         await self.db.refresh(group)
         return group
 
@@ -132,8 +138,10 @@ class GroupService(BaseService[Group]):
         if not group:
             return False
         
+        cache_tags = await self.balances.cache_tags(group_id)
         await self.db.delete(group)
         await self.db.commit()
+        await TaggedCache.invalidate(*cache_tags)
         return True
 
     async def add_member(
@@ -162,6 +170,7 @@ class GroupService(BaseService[Group]):
         )
         self.db.add(member)
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(group_id))
         await self.db.refresh(member)
         return member
 
@@ -191,8 +200,10 @@ class GroupService(BaseService[Group]):
         if not member_obj:
             return False
         
+        cache_tags = await self.balances.cache_tags(group_id)
         await self.db.delete(member_obj)
         await self.db.commit()
+        await TaggedCache.invalidate(*cache_tags)
         return True
 
     async def is_admin(self, group_id: str, user_id: str) -> bool:
@@ -239,43 +250,11 @@ class GroupService(BaseService[Group]):
 
     async def calculate_user_balance(self, group_id: str, user_id: str) -> Decimal:
         """
-        Calculate user's balance in a group.
+        Get user's balance in a group from the balance ledger.
         Positive = user is owed money
         Negative = user owes money
         """
-        # What user paid
-        paid_query = select(func.coalesce(func.sum(GroupExpense.amount), 0)).where(
-            GroupExpense.group_id == group_id,
-            GroupExpense.paid_by == user_id
-        )
-        paid_result = await self.db.execute(paid_query)
-        total_paid = Decimal(str(paid_result.scalar_one()))
-        
-        # What user owes (their share of expenses)
-        owed_query = select(func.coalesce(func.sum(ExpenseSplit.share_amount), 0)).where(
-            ExpenseSplit.user_id == user_id
-        ).join(GroupExpense).where(GroupExpense.group_id == group_id)
-        owed_result = await self.db.execute(owed_query)
-        total_owed = Decimal(str(owed_result.scalar_one()))
-        
-        # Settlements received
-        received_query = select(func.coalesce(func.sum(Settlement.amount), 0)).where(
-            Settlement.group_id == group_id,
-            Settlement.to_user_id == user_id
-        )
-        received_result = await self.db.execute(received_query)
-        total_received = Decimal(str(received_result.scalar_one()))
-        
-        # Settlements made
-        made_query = select(func.coalesce(func.sum(Settlement.amount), 0)).where(
-            Settlement.group_id == group_id,
-            Settlement.from_user_id == user_id
-        )
-        made_result = await self.db.execute(made_query)
-        total_made = Decimal(str(made_result.scalar_one()))
-        
-        # Balance = (paid + received) - (owed + made)
-        return (total_paid + total_received) - (total_owed + total_made)
+        return await self.balances.get_balance(group_id, user_id)
 
     async def get_total_expenses(self, group_id: str) -> Decimal:
         """Get total expenses in a group."""
@@ -285,18 +264,45 @@ class GroupService(BaseService[Group]):
         result = await self.db.execute(query)
         return Decimal(str(result.scalar_one()))
 
+    async def get_total_expenses_by_group(self, group_ids: List[str]) -> dict:
+        """Get total expenses for several groups in one query."""
+        if not group_ids:
+            return {}
+        
+        query = (
+            select(GroupExpense.group_id, func.sum(GroupExpense.amount).label("total"))
+            .where(GroupExpense.group_id.in_(group_ids))
+            .group_by(GroupExpense.group_id)
+        )
+        result = await self.db.execute(query)
+        return {row.group_id: Decimal(str(row.total)) for row in result.all()}
+
     async def get_all_balances(self, group_id: str) -> List[dict]:
         """Get balance for all members in a group."""
-        members = await self.get_members(group_id)
-        balances = []
-        
-        for member in members:
-            balance = await self.calculate_user_balance(group_id, member["user_id"])
-            balances.append({
-                "user_id": member["user_id"],
-                "user_name": member["user_name"],
-                "balance": balance
-            })
+        query = (
+            select(
+                GroupMember.user_id,
+                User.name,
+                func.coalesce(GroupMemberBalance.balance, 0).label("balance"),
+            )
+            .join(User, GroupMember.user_id == User.id)
+            .outerjoin(
+                GroupMemberBalance,
+                and_(
+                    GroupMemberBalance.group_id == GroupMember.group_id,
+                    GroupMemberBalance.user_id == GroupMember.user_id,
+                ),
+            )
+            .where(GroupMember.group_id == group_id)
+            .order_by(GroupMember.joined_at)
+        )
+        result = await self.db.execute(query)
         
-        return balances
-
+        return [
+            {
+                "user_id": row.user_id,
+                "user_name": row.name,
+                "balance": Decimal(str(row.balance)),
+            }
+            for row in result.all()
+        ]
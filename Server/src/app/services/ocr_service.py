@@ -0,0 +1,103 @@
+"""Text extraction queue and results for attachments."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Attachment
+from src.core.cache import TaggedCache, user_tag
+from src.core.utils.job_queue import JobQueue
+
+OCR_QUEUE = JobQueue("ocr")
+
+OCR_PENDING = "pending"
+OCR_DONE = "done"
+OCR_FAILED = "failed"
+
+
+class OcrService:
+    """Queues uploaded attachments for text extraction and stores what the worker found."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    async def enqueue(*attachments: Attachment) -> bool:
+        """
+        Queue attachments for the OCR worker (scripts/ocr_worker.py).
+
+        Returns:
+            bool: False if the queue is unavailable; the attachments stay
+            pending and ``ocr_worker.py --backfill`` picks them up later
+        """
+        return await OCR_QUEUE.enqueue(*(
+            {
+                "attachment_id": attachment.id,
+                "user_id": attachment.user_id,
+                "file_path": attachment.file_path,
+            }
+            for attachment in attachments
+            if attachment.file_path
+        ))
+
+    async def get_pending(
+        self, limit: int = 1000, after: Optional[Tuple[datetime, str]] = None
+    ) -> List[Attachment]:
+        """
+        Uploaded attachments still waiting for text extraction, oldest first.
+
+        Args:
+            limit: Page size
+            after: (created_at, id) of the last attachment of the previous page
+        """
+        sort_key = (Attachment.created_at, Attachment.id)
+        query = select(Attachment).where(
+            Attachment.ocr_status == OCR_PENDING, Attachment.file_path.isnot(None)
+        )
+        if after is not None:
+            # Ties on created_at (e.g. a bulk upload) would otherwise be skipped
+            query = query.where(tuple_(*sort_key) > tuple_(*after))
+        result = await self.db.execute(query.order_by(*sort_key).limit(limit))
+        return list(result.scalars().all())
+
+    async def save_results(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch of extraction results as one executemany and commit.
+
+        Args:
+            results: One dict per attachment with attachment_id, user_id,
+                ocr_status, and text, amount, date and merchant (None when
+                not found or when extraction failed)
+        """
+        if not results:
+            return
+        stmt = (
+            update(Attachment)
+            .where(Attachment.id == bindparam("b_id"))
+            .values(
+                ocr_status=bindparam("b_status"),
+                extracted_text=bindparam("b_text"),
+                extracted_amount=bindparam("b_amount"),
+                extracted_date=bindparam("b_date"),
+                extracted_merchant=bindparam("b_merchant"),
+                updated_at=datetime.utcnow(),
+            )
+        )
+        # On the connection: a plain executemany, where the ORM would expect
+        # every attachment to still exist (one may be deleted mid-extraction)
+        connection = await self.db.connection()
+        await connection.execute(stmt, [
+            {
+                "b_id": result["attachment_id"],
+                "b_status": result["ocr_status"],
+                "b_text": result.get("text"),
+                "b_amount": result.get("amount"),
+                "b_date": result.get("date"),
+                "b_merchant": result.get("merchant"),
+            }
+            for result in results
+        ])
+        await self.db.commit()
+        await TaggedCache.invalidate(*{user_tag(result["user_id"]) for result in results})
@@ -1,6 +1,6 @@
 """Permission service."""
 
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
@@ -9,6 +9,13 @@ from sqlalchemy.orm import selectinload
 
 from src.app.models import Permission, Role
 from src.app.schemas import PermissionCreate, PermissionUpdate
+from src.core.utils.local_cache import LocalTTLCache
+
+# Compiled policies per (roles, resource, action). Mutations here and in
+# RoleService bump the version; the TTL bounds staleness in other workers.
+POLICY_CACHE_TTL = 60
+_policy_cache = LocalTTLCache(ttl=POLICY_CACHE_TTL)
+_policy_version = 0
 
 
 class PermissionService:
@@ -25,6 +32,7 @@ class PermissionService:
         return result.scalar_one_or_none()
 
     async def get_policies(self, role_names: list[str], resource: str, action: str):
+        """Get the permissions any of the roles grant for resource/action."""
         stmt = (
             select(Permission)
             .join(Permission.roles)
@@ -37,6 +45,36 @@ class PermissionService:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_compiled_policies(
+        self, role_names: list[str], resource: str, action: str
+    ) -> Tuple[Optional[Callable[[dict], Any]], ...]:
+        """
+        Get the roles' policies for resource/action as compiled expressions.
+
+        None stands for a permission without an expression (always allowed).
+        Served from the policy cache after the first lookup.
+        """
+        # Imported here: the ABAC package imports this service
+        from src.app.api.abac.engine import ABACEngine
+
+        key = (_policy_version, tuple(sorted(set(role_names))), resource, action)
+        policies = _policy_cache.get(key)
+        if policies is None:
+            permissions = await self.get_policies(role_names, resource, action)
+            policies = tuple(
+                None if permission.expression is None else ABACEngine.compile(permission.expression)
+                for permission in permissions
+            )
+            _policy_cache.set(key, policies)
+        return policies
+
+    @staticmethod
+    def invalidate_policies() -> None:
+        """Drop cached policies after a role or permission change."""
+        global _policy_version
+        _policy_version += 1
+        _policy_cache.clear()
+
     async def get_by_name(self, name: str) -> Optional[Permission]:
         """Get permission by name."""
         query = select(Permission).where(Permission.name == name)
@@ -63,6 +101,7 @@ class PermissionService:
         permission = Permission(**permission_in.model_dump())
         self.db.add(permission)
         await self.db.commit()
+        self.invalidate_policies()
         await self.db.refresh(permission)
         return permission
 
@@ -73,6 +112,7 @@ class PermissionService:
         for field, value in permission_in.model_dump(exclude_unset=True).items():
             setattr(permission, field, value)
         await self.db.commit()
+        self.invalidate_policies()
         await self.db.refresh(permission)
         return permission
 
@@ -82,6 +122,7 @@ class PermissionService:
         if permission:
             await self.db.delete(permission)
             await self.db.commit()
+            self.invalidate_policies()
 
     async def get_all_with_role_selected(self, role_id: int):
         # Get all permissions
@@ -0,0 +1,91 @@
+"""Authenticated principal cache."""
+
+import json
+from typing import Optional
+
+from loguru import logger
+
+from src.core.cache.stats import LOCAL_HIT, MISS, REDIS_HIT, record_lookup
+from src.core.redis import get_redis_client
+from src.core.utils.local_cache import LocalTTLCache
+
+# Local entries absorb repeated requests in one worker; Redis shares
+# principals between workers. Writes that change a principal delete both.
+PRINCIPAL_LOCAL_TTL = 30
+PRINCIPAL_REDIS_TTL = 300
+KEY_PREFIX = "principal:"
+
+_local = LocalTTLCache(ttl=PRINCIPAL_LOCAL_TTL)
+
+
+class PrincipalCache:
+    """
+    Caches the identity behind an access token, keyed by token subject.
+
+    A principal is the JSON-safe dict of UserResponse fields plus
+    is_superuser. Redis errors are logged and treated as misses so
+    authentication falls back to the database.
+    """
+
+    @staticmethod
+    async def get(username: str) -> Optional[dict]:
+        """Get a cached principal."""
+        principal = _local.get(username)
+        if principal is not None:
+            record_lookup("principal", LOCAL_HIT)
+            return principal
+
+        redis = get_redis_client()
+        if redis is None:
+            record_lookup("principal", MISS)
+            return None
+        try:
+            raw = await redis.get(KEY_PREFIX + username)
+        except Exception as e:
+            logger.warning(f"Principal cache read failed: {e}")
+            raw = None
+        if raw is None:
+            record_lookup("principal", MISS)
+            return None
+        record_lookup("principal", REDIS_HIT)
+        principal = json.loads(raw)
+        _local.set(username, principal)
+        return principal
+
+    @staticmethod
+    async def set(username: str, principal: dict) -> None:
+        """Cache a principal."""
+        _local.set(username, principal)
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            await redis.set(KEY_PREFIX + username, json.dumps(principal), ex=PRINCIPAL_REDIS_TTL)
+        except Exception as e:
+            logger.warning(f"Principal cache write failed: {e}")
+
+    @staticmethod
+    async def invalidate(username: str) -> None:
+        """Forget a user's principal after their roles or status change."""
+        _local.delete(username)
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            await redis.delete(KEY_PREFIX + username)
+        except Exception as e:
+            logger.warning(f"Principal cache invalidation failed: {e}")
+
+    @staticmethod
+    async def invalidate_all() -> None:
+        """Forget every principal, e.g. after a role is renamed or deleted."""
+        _local.clear()
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            keys = [key async for key in redis.scan_iter(match=KEY_PREFIX + "*", count=500)]
+            if keys:
+                await redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Principal cache invalidation failed: {e}")
@@ -0,0 +1,228 @@
+"""Receipt-to-transaction matching for Personal Finance attachments."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Date, bindparam, case, cast, exists, func, literal, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.app.models import Attachment, Transaction
+from src.core.cache import TaggedCache, user_tag
+
+# Days either side of the receipt date a transaction may be booked on
+DEFAULT_WINDOW_DAYS = 3
+DEFAULT_CANDIDATES = 3
+# Auto-link only when the best candidate is this good and clearly ahead of the next one
+AUTO_LINK_MIN_SCORE = 0.85
+AUTO_LINK_MIN_MARGIN = 0.1
+
+# Score weights; they sum to 1
+AMOUNT_WEIGHT = 0.5
+DATE_WEIGHT = 0.3
+MERCHANT_WEIGHT = 0.2
+
+
+class ReceiptMatchingService:
+    """Finds the transactions that unlinked bills and receipts most likely record."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def suggest(
+        self,
+        user_id: str,
+        attachment_ids: Optional[Sequence[str]] = None,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        amount_tolerance: Decimal = Decimal("0"),
+        limit: int = DEFAULT_CANDIDATES,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidate transactions for unlinked attachments with an extracted amount.
+
+        One query: for each attachment, a lateral lookup walks
+        ix_transaction_user_amount_date for expenses of the same user whose
+        amount is within amount_tolerance and whose date is within
+        window_days of the receipt date (the upload date if none was
+        parsed). Transactions that already have a receipt are skipped.
+        Candidates are scored on amount, date distance and trigram
+        similarity between the merchant and the description.
+
+        Args:
+            user_id: Owner of the attachments
+            attachment_ids: Only these attachments (default: all unlinked)
+            window_days: Days either side of the receipt date
+            amount_tolerance: Largest accepted amount difference
+            limit: Candidates returned per attachment
+
+        Returns:
+            One dict per attachment with at least one candidate, shaped like
+            AttachmentMatchSuggestion, candidates best first
+        """
+        linked = aliased(Attachment)
+        receipt_date = func.coalesce(Attachment.extracted_date, cast(Attachment.created_at, Date))
+        amount_diff = func.abs(Transaction.amount - Attachment.extracted_amount)
+        day_diff = func.abs(Transaction.transaction_date - receipt_date)
+
+        score = (
+            AMOUNT_WEIGHT * case(
+                (amount_diff == 0, literal(1.0)),
+                else_=literal(1.0) - amount_diff / (amount_tolerance + Decimal("0.01")) / 2,
+            )
+            + DATE_WEIGHT * (literal(1.0) - day_diff / float(window_days + 1))
+            + MERCHANT_WEIGHT * func.similarity(
+                func.coalesce(Transaction.description, ""),
+                func.coalesce(Attachment.extracted_merchant, ""),
+            )
+        ).label("score")
+
+        candidates = (
+            select(
+                Transaction.id.label("transaction_id"),
+                Transaction.amount,
+                Transaction.transaction_date,
+                Transaction.description,
+                score,
+            )
+            .where(
+                Transaction.user_id == Attachment.user_id,
+                Transaction.amount.between(
+                    Attachment.extracted_amount - amount_tolerance,
+                    Attachment.extracted_amount + amount_tolerance,
+                ),
+                Transaction.transaction_date.between(
+                    receipt_date - window_days, receipt_date + window_days
+                ),
+                Transaction.type == "expense",
+                ~exists().where(linked.linked_transaction_id == Transaction.id),
+            )
+            .order_by(score.desc(), day_diff, Transaction.id)
+            .limit(limit)
+            .correlate(Attachment)
+            .lateral("candidate")
+        )
+
+        query = (
+            select(
+                Attachment.id,
+                Attachment.extracted_amount,
+                Attachment.extracted_date,
+                Attachment.extracted_merchant,
+                candidates.c.transaction_id,
+                candidates.c.amount,
+                candidates.c.transaction_date,
+                candidates.c.description,
+                candidates.c.score,
+            )
+            .select_from(Attachment)
+            .join(candidates, true())
+            .where(
+                Attachment.user_id == user_id,
+                Attachment.linked_transaction_id.is_(None),
+                Attachment.extracted_amount.isnot(None),
+            )
+            .order_by(Attachment.created_at.desc(), Attachment.id, candidates.c.score.desc())
+        )
+        if attachment_ids is not None:
+            query = query.where(Attachment.id.in_(attachment_ids))
+
+        suggestions: Dict[str, Dict[str, Any]] = {}
+        for row in (await self.db.execute(query)).all():
+            suggestion = suggestions.setdefault(row.id, {
+                "attachment_id": row.id,
+                "extracted_amount": row.extracted_amount,
+                "extracted_date": row.extracted_date,
+                "extracted_merchant": row.extracted_merchant,
+                "candidates": [],
+            })
+            suggestion["candidates"].append({
+                "transaction_id": row.transaction_id,
+                "amount": row.amount,
+                "transaction_date": row.transaction_date,
+                "description": row.description,
+                "score": round(float(row.score), 4),
+            })
+        return list(suggestions.values())
+
+    async def auto_link(
+        self,
+        user_id: str,
+        attachment_ids: Optional[Sequence[str]] = None,
+        min_score: float = AUTO_LINK_MIN_SCORE,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        dry_run: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Link every unlinked attachment whose best match is unambiguous.
+
+        A link is made when the best candidate scores at least min_score,
+        beats the runner-up by AUTO_LINK_MIN_MARGIN, and is not also the
+        best candidate of another attachment in the same run. Only exact
+        amount matches are considered.
+
+        Args:
+            user_id: Owner of the attachments
+            attachment_ids: Only these attachments (default: all unlinked)
+            min_score: Lowest score linked automatically
+            window_days: Days either side of the receipt date
+            dry_run: Only report what would be linked
+
+        Returns:
+            List of {attachment_id, transaction_id, score} for the links made
+        """
+        suggestions = await self.suggest(
+            user_id, attachment_ids=attachment_ids, window_days=window_days, limit=2
+        )
+
+        best: Dict[str, Dict[str, Any]] = {}
+        claims: Dict[str, int] = {}
+        for suggestion in suggestions:
+            top, *rest = suggestion["candidates"]
+            if top["score"] < min_score:
+                continue
+            if rest and top["score"] - rest[0]["score"] < AUTO_LINK_MIN_MARGIN:
+                continue
+            best[suggestion["attachment_id"]] = top
+            claims[top["transaction_id"]] = claims.get(top["transaction_id"], 0) + 1
+
+        links = [
+            {
+                "attachment_id": attachment_id,
+                "transaction_id": top["transaction_id"],
+                "score": top["score"],
+            }
+            for attachment_id, top in best.items()
+            # Two receipts pointing at one transaction need a human
+            if claims[top["transaction_id"]] == 1
+        ]
+        if dry_run or not links:
+            return links
+
+        linked = aliased(Attachment)
+        stmt = (
+            update(Attachment)
+            .where(
+                Attachment.id == bindparam("b_id"),
+                Attachment.user_id == user_id,
+                # Leave attachments the user linked in the meantime alone,
+                # and transactions that got another receipt in the meantime
+                Attachment.linked_transaction_id.is_(None),
+                ~exists().where(linked.linked_transaction_id == bindparam("b_transaction_id")),
+            )
+            .values(linked_transaction_id=bindparam("b_transaction_id"), updated_at=datetime.utcnow())
+        )
+        connection = await self.db.connection()
+        await connection.execute(stmt, [
+            {"b_id": link["attachment_id"], "b_transaction_id": link["transaction_id"]}
+            for link in links
+        ])
+        # Report only the links the guards above let through
+        applied = set((await self.db.execute(
+            select(Attachment.id, Attachment.linked_transaction_id).where(
+                Attachment.id.in_([link["attachment_id"] for link in links])
+            )
+        )).tuples())
+        await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
+        return [link for link in links if (link["attachment_id"], link["transaction_id"]) in applied]
@@ -9,6 +9,8 @@ from sqlalchemy.orm import selectinload
 
 from src.app.models import Role, Permission
 from src.app.schemas import RoleCreate, RoleUpdate
+from src.app.services.permission import PermissionService
+from src.app.services.principal_cache import PrincipalCache
 from src.core.db import get_db
 
 
@@ -116,6 +118,8 @@ class RoleService:
 
         self.db.add(role)
         await self.db.commit()
+        PermissionService.invalidate_policies()
+        await PrincipalCache.invalidate_all()
         await self.db.refresh(role)
         return role
 
@@ -128,6 +132,8 @@ class RoleService:
         """
         await self.db.delete(role)
         await self.db.commit()
+        PermissionService.invalidate_policies()
+        await PrincipalCache.invalidate_all()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Role]:
         """
@@ -182,6 +188,7 @@ class RoleService:
             role.permissions.append(permission)
             self.db.add(role)
             await self.db.commit()
+            PermissionService.invalidate_policies()
             await self.db.refresh(role)
         return role
 
@@ -216,5 +223,6 @@ class RoleService:
             role.permissions.remove(permission)
             self.db.add(role)
             await self.db.commit()
+            PermissionService.invalidate_policies()
             await self.db.refresh(role)
         return role
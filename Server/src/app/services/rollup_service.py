@@ -0,0 +1,133 @@
+"""Monthly rollup service for Personal Finance aggregates."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Transaction, UserMonthlyRollup
+
+# (year_month, type, category_id) -> (amount delta, count delta)
+RollupDeltas = Dict[Tuple[str, str, str], Tuple[Decimal, int]]
+
+
+def month_key(value: date) -> str:
+    """Format a date as the rollup's YYYY-MM month key."""
+    return f"{value.year}-{value.month:02d}"
+
+
+class MonthlyRollupService:
+    """Keeps user_monthly_rollup in step with transaction writes."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def contribution(
+        transaction_date: date,
+        transaction_type: str,
+        category_id: Optional[str],
+        amount: Decimal,
+        sign: int = 1,
+    ) -> RollupDeltas:
+        """Rollup deltas for adding (sign=1) or removing (sign=-1) one transaction."""
+        key = (month_key(transaction_date), transaction_type, category_id or "")
+        return {key: (Decimal(str(amount)) * sign, sign)}
+
+    @staticmethod
+    def merge(*deltas: RollupDeltas) -> RollupDeltas:
+        """Combine deltas, dropping keys that cancel out."""
+        merged: RollupDeltas = {}
+        for delta in deltas:
+            for key, (amount, count) in delta.items():
+                prev_amount, prev_count = merged.get(key, (Decimal("0"), 0))
+                merged[key] = (prev_amount + amount, prev_count + count)
+        return {
+            key: value for key, value in merged.items()
+            if value[0] != 0 or value[1] != 0
+        }
+
+    async def add(self, transaction: Transaction) -> None:
+        """Count a newly created transaction."""
+        await self.apply(transaction.user_id, self.contribution(
+            transaction.transaction_date, transaction.type,
+            transaction.category_id, transaction.amount,
+        ))
+
+    async def remove(self, transaction: Transaction) -> None:
+        """Un-count a deleted transaction."""
+        await self.apply(transaction.user_id, self.contribution(
+            transaction.transaction_date, transaction.type,
+            transaction.category_id, transaction.amount, sign=-1,
+        ))
+
+    async def apply(self, user_id: str, deltas: RollupDeltas) -> None:
+        """Upsert deltas in a single statement inside the caller's transaction."""
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        stmt = pg_insert(UserMonthlyRollup).values([
+            {
+                "user_id": user_id,
+                "year_month": year_month,
+                "type": transaction_type,
+                "category_id": category_id,
+                "total": amount,
+                "transaction_count": count,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (year_month, transaction_type, category_id), (amount, count) in deltas.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                UserMonthlyRollup.user_id,
+                UserMonthlyRollup.year_month,
+                UserMonthlyRollup.type,
+                UserMonthlyRollup.category_id,
+            ],
+            set_={
+                "total": UserMonthlyRollup.total + stmt.excluded.total,
+                "transaction_count": UserMonthlyRollup.transaction_count + stmt.excluded.transaction_count,
+                "updated_at": now,
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def rebuild(self, user_id: Optional[str] = None) -> None:
+        """Recompute the rollup from the transaction table (for one user or everyone)."""
+        clear = delete(UserMonthlyRollup)
+        source = select(
+            Transaction.user_id,
+            func.to_char(Transaction.transaction_date, "YYYY-MM"),
+            Transaction.type,
+            func.coalesce(Transaction.category_id, ""),
+            func.sum(Transaction.amount),
+            func.count(Transaction.id),
+            func.now(),
+            func.now(),
+        )
+        if user_id:
+            clear = clear.where(UserMonthlyRollup.user_id == user_id)
+            source = source.where(Transaction.user_id == user_id)
+        source = source.group_by(
+            Transaction.user_id,
+            func.to_char(Transaction.transaction_date, "YYYY-MM"),
+            Transaction.type,
+            func.coalesce(Transaction.category_id, ""),
+        )
+
+        await self.db.execute(clear)
+        await self.db.execute(
+            insert(UserMonthlyRollup).from_select(
+                [
+                    "user_id", "year_month", "type", "category_id",
+                    "total", "transaction_count", "created_at", "updated_at",
+                ],
+                source,
+            )
+        )
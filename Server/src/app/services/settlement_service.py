@@ -11,6 +11,8 @@ from sqlalchemy.orm import selectinload
 from src.app.models import Settlement, GroupMember, User
 from src.app.schemas import SettlementCreate, SettlementUpdate
 from src.app.services.base import BaseService
+from src.app.services.group_balance_service import GroupBalanceService
+from src.core.cache import TaggedCache
 
 
 class SettlementService(BaseService[Settlement]):
@@ -18,6 +20,7 @@ class SettlementService(BaseService[Settlement]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Settlement)
+        self.balances = GroupBalanceService(db)
 
     async def get_by_id(self, settlement_id: str, user_id: str) -> Optional[Settlement]:
         """Get settlement by ID (only if user is involved)."""
@@ -98,7 +101,9 @@ class SettlementService(BaseService[Settlement]):
             settled_at=datetime.utcnow(),
         )
         self.db.add(settlement)
+        await self.balances.apply_settlement(settlement)
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(data.group_id))
         await self.db.refresh(settlement)
         return settlement
 
@@ -110,11 +115,15 @@ class SettlementService(BaseService[Settlement]):
         if not settlement or settlement.from_user_id != user_id:
             return None
         
+        await self.balances.apply_settlement(settlement, sign=-1)
+        
         update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(settlement, key, value)
         
+        await self.balances.apply_settlement(settlement)
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(settlement.group_id))
         await self.db.refresh(settlement)
         return settlement
 
@@ -124,8 +133,10 @@ class SettlementService(BaseService[Settlement]):
         if not settlement or settlement.from_user_id != user_id:
             return False
         
+        await self.balances.apply_settlement(settlement, sign=-1)
         await self.db.delete(settlement)
         await self.db.commit()
+        await TaggedCache.invalidate(*await self.balances.cache_tags(settlement.group_id))
         return True
 
     async def get_settlement_suggestions(
@@ -0,0 +1,129 @@
+"""Reference-counted, content-addressed file storage."""
+
+import mimetypes
+from datetime import datetime
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, UploadFile
+from loguru import logger
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import StoredFile
+from src.app.services.thumbnail_service import ThumbnailService
+from src.core.utils import file_upload_service
+
+
+class StoredFileService:
+    """
+    Tracks how many records point at each stored blob.
+
+    Identical uploads share one file on disk; the file is removed when the
+    last reference is released. Reference changes run inside the caller's
+    transaction, so they commit together with the record that owns them.
+    Files are only deleted after that commit (see purge); a blob placed by
+    a save whose transaction then rolls back is left without a row and is
+    removed by scripts/clean_orphan_files.py.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, file: UploadFile, subfolder: str = "files") -> dict:
+        """
+        Stream an upload to storage and take a reference on it.
+
+        Args:
+            file: Uploaded file
+            subfolder: Top-level storage folder (e.g. "attachments")
+
+        Returns:
+            dict: File info as returned by FileUploadService.save_file
+        """
+        received = await file_upload_service.receive(file)
+        file_path = file_upload_service.content_path(
+            subfolder, received.sha256, received.extension
+        )
+        try:
+            # Count the reference before placing the blob; the lock taken in
+            # acquire keeps a concurrent purge of the same blob away until commit
+            await self.acquire(file_path, received.sha256, received.size)
+            file_upload_service.place(received, subfolder)
+        except Exception as e:
+            received.temp_path.unlink(missing_ok=True)
+            logger.error(f"Error saving file: {e}")
+            raise HTTPException(status_code=500, detail="Failed to save file")
+        return file_upload_service.file_info(received, file_path)
+
+    async def acquire(self, file_path: str, sha256: str, size: int) -> None:
+        """Add a reference to a blob, creating its row on first use."""
+        await self._lock(file_path)
+        now = datetime.utcnow()
+        stmt = pg_insert(StoredFile).values(
+            file_path=file_path,
+            sha256=sha256,
+            size=size,
+            content_type=mimetypes.guess_type(file_path)[0],
+            ref_count=1,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StoredFile.file_path],
+            set_={"ref_count": StoredFile.ref_count + 1, "updated_at": now},
+        )
+        await self.db.execute(stmt)
+
+    async def release(self, file_path: str) -> Optional[str]:
+        """
+        Drop a reference to a blob inside the caller's transaction.
+
+        Nothing is deleted from disk here: pass the returned path to
+        purge() once the transaction has committed.
+
+        Returns:
+            The path if that was its last reference, else None
+        """
+        result = await self.db.execute(
+            update(StoredFile)
+            .where(StoredFile.file_path == file_path)
+            .values(ref_count=StoredFile.ref_count - 1, updated_at=datetime.utcnow())
+            .returning(StoredFile.ref_count)
+        )
+        remaining = result.scalar_one_or_none()
+        if remaining is None:
+            logger.warning(f"Released untracked file: {file_path}")
+            return None
+        if remaining <= 0:
+            await self.db.execute(delete(StoredFile).where(StoredFile.file_path == file_path))
+            return file_path
+        return None
+
+    async def purge(self, file_paths: Iterable[Optional[str]]) -> None:
+        """
+        Delete released blobs and their thumbnails; call only after commit.
+
+        A blob that a new upload took a reference on in the meantime is
+        kept. Failures are logged, never raised: the caller's change has
+        already been committed.
+        """
+        for file_path in file_paths:
+            if not file_path:
+                continue
+            try:
+                await self._lock(file_path)
+                referenced = await self.db.scalar(
+                    select(StoredFile.file_path).where(StoredFile.file_path == file_path)
+                )
+                if referenced is None:
+                    await file_upload_service.delete_file(file_path)
+                    await ThumbnailService.delete(file_path)
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(f"Error deleting released file {file_path}: {e}")
+
+    async def _lock(self, file_path: str) -> None:
+        """Serialize acquire and purge of one blob until the transaction ends."""
+        await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(file_path))))
@@ -10,6 +10,7 @@ from sqlalchemy.orm import selectinload
 from src.app.models import Subscription, Account
 from src.app.schemas import SubscriptionCreate, SubscriptionUpdate
 from src.app.services.base import BaseService
+from src.core.cache import TaggedCache, user_tag
 
 
 class SubscriptionService(BaseService[Subscription]):
@@ -64,6 +65,7 @@ class SubscriptionService(BaseService[Subscription]):
         )
         self.db.add(subscription)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(subscription)
         return subscription
 
@@ -80,6 +82,7 @@ class SubscriptionService(BaseService[Subscription]):
             setattr(subscription, key, value)
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(subscription)
         return subscription
 
@@ -91,6 +94,7 @@ class SubscriptionService(BaseService[Subscription]):
         
         await self.db.delete(subscription)
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         return True
 
     async def get_upcoming(
@@ -153,6 +157,7 @@ class SubscriptionService(BaseService[Subscription]):
             )
         
         await self.db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
         await self.db.refresh(subscription)
         return subscription
 
@@ -0,0 +1,99 @@
+"""Background thumbnail generation for attachments."""
+
+import asyncio
+from typing import Dict, Set
+
+from loguru import logger
+from sqlalchemy import update
+
+from src.app.models import Attachment
+from src.core.cache import TaggedCache, user_tag
+from src.core.db.session import async_session_factory
+from src.core.utils import file_upload_service
+from src.core.utils.process_pool import run_in_process
+from src.core.utils.thumbnails import (
+    THUMBNAIL_SIZES,
+    can_render,
+    render_thumbnails,
+    thumbnail_path,
+)
+
+# Running generations, kept so they are not garbage collected mid-flight
+_generations: Set["asyncio.Task"] = set()
+
+
+def _generation_done(task: "asyncio.Task") -> None:
+    """Forget a finished generation, logging its failure."""
+    _generations.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Thumbnail generation failed: {task.exception()}")
+
+
+class ThumbnailService:
+    """Renders attachment thumbnails in the process pool and records their URLs."""
+
+    @staticmethod
+    async def generate(file_path: str) -> Dict[str, str]:
+        """
+        Make every thumbnail size for a stored file that does not exist yet.
+
+        Thumbnails live next to the content-addressed original, so a
+        re-uploaded receipt reuses them without rendering again.
+
+        Args:
+            file_path: Upload-relative path of the original
+
+        Returns:
+            Dict mapping size (as a string) to thumbnail URL; empty if the
+            file type or the installed libraries do not support thumbnails
+        """
+        if not can_render(file_path):
+            return {}
+
+        upload_dir = file_upload_service.upload_dir
+        paths = {size: thumbnail_path(file_path, size) for size in THUMBNAIL_SIZES}
+        missing = [
+            (size, str(upload_dir / path))
+            for size, path in paths.items()
+            if not (upload_dir / path).exists()
+        ]
+        if missing:
+            written = await run_in_process(render_thumbnails, str(upload_dir / file_path), missing)
+            if len(written) < len(missing):
+                return {}
+
+        return {
+            str(size): file_upload_service.get_file_url(path) for size, path in paths.items()
+        }
+
+    @staticmethod
+    def schedule(attachment_id: str, user_id: str, file_path: str) -> None:
+        """Generate an attachment's thumbnails after the response has been sent."""
+        if not can_render(file_path):
+            return
+        task = asyncio.create_task(ThumbnailService._generate_for(attachment_id, user_id, file_path))
+        _generations.add(task)
+        task.add_done_callback(_generation_done)
+
+    @staticmethod
+    async def _generate_for(attachment_id: str, user_id: str, file_path: str) -> None:
+        thumbnails = await ThumbnailService.generate(file_path)
+        if not thumbnails:
+            return
+        # The request's session is gone by now
+        async with async_session_factory() as db:
+            await db.execute(
+                update(Attachment)
+                .where(Attachment.id == attachment_id)
+                .values(thumbnails=thumbnails)
+            )
+            await db.commit()
+        await TaggedCache.invalidate(user_tag(user_id))
+
+    @staticmethod
+    async def delete(file_path: str) -> None:
+        """Remove a stored file's thumbnails."""
+        for size in THUMBNAIL_SIZES:
+            path = thumbnail_path(file_path, size)
+            if (file_upload_service.upload_dir / path).exists():
+                await file_upload_service.delete_file(path)
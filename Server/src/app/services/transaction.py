@@ -1,16 +1,31 @@
 """Transaction service for Personal Finance."""
 
+import hashlib
+import re
 import uuid
 from datetime import date, datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.app.models import Transaction, Account, Category
+from src.app.models import Transaction, Account, Attachment, Category
 from src.app.schemas import TransactionCreate, TransactionUpdate, TransactionFilter
 from src.app.services.base import BaseService
+from src.app.services.rollup_service import MonthlyRollupService
+from src.core.cache import TaggedCache, account_tag, user_tag
+from src.core.cache.stats import LOCAL_HIT, MISS, record_lookup
+from src.core.db.explain import estimate_row_count
+from src.core.utils.local_cache import LocalTTLCache
+from src.core.utils.pagination import decode_cursor, encode_cursor
+
+# Exact counts cached per (user_id, generation, filters hash); a write bumps
+# the user's generation so this worker never serves a pre-write count.
+COUNT_CACHE_TTL = 30
+ESTIMATE_THRESHOLD = 10000
+_count_cache = LocalTTLCache(ttl=COUNT_CACHE_TTL)
+_count_generations: Dict[str, int] = {}
 
 
 class TransactionService(BaseService[Transaction]):
@@ -18,6 +33,7 @@ class TransactionService(BaseService[Transaction]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Transaction)
+        self.rollups = MonthlyRollupService(db)
 
     async def get_by_id(self, transaction_id: str, user_id: str) -> Optional[Transaction]:
         """Get transaction by ID."""
@@ -34,55 +50,200 @@ class TransactionService(BaseService[Transaction]):
         user_id: str,
         filters: Optional[TransactionFilter] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Tuple[List[Transaction], int]:
-        """Get all transactions for a user with filters and pagination."""
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact",
+    ) -> Tuple[List[Transaction], Optional[int], Optional[str]]:
+        """
+        Get all transactions for a user with filters and pagination.
+
+        Pages are ordered by (transaction_date, created_at, id) descending.
+        When ``cursor`` is given the page seeks past that key instead of
+        using ``offset``, so deep pages cost the same as the first one.
+        ``count`` is "exact", "estimate" (see count_by_user) or "none" to
+        skip counting. Returns (transactions, total, next_cursor); total is
+        None when skipped and next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        conditions = self._filter_conditions(user_id, filters)
         query = (
             select(Transaction)
-            .where(Transaction.user_id == user_id)
+            .where(*conditions)
             .options(selectinload(Transaction.category), selectinload(Transaction.account))
         )
 
-        if filters:
-            if filters.type:
-                query = query.where(Transaction.type == filters.type)
-            if filters.account_id:
-                query = query.where(Transaction.account_id == filters.account_id)
-            if filters.category_id:
-                query = query.where(Transaction.category_id == filters.category_id)
-            if filters.start_date:
-                query = query.where(Transaction.transaction_date >= filters.start_date)
-            if filters.end_date:
-                query = query.where(Transaction.transaction_date <= filters.end_date)
-            if filters.min_amount:
-                query = query.where(Transaction.amount >= filters.min_amount)
-            if filters.max_amount:
-                query = query.where(Transaction.amount <= filters.max_amount)
-            if filters.search:
-                search_pattern = f"%{filters.search.lower()}%"
-                query = query.where(
-                    func.lower(Transaction.description).like(search_pattern)
-                )
-
-        # Count total
-        count_query = select(func.count(Transaction.id)).where(Transaction.user_id == user_id)
-        if filters:
-            # Apply same filters to count query
-            if filters.type:
-                count_query = count_query.where(Transaction.type == filters.type)
-            if filters.account_id:
-                count_query = count_query.where(Transaction.account_id == filters.account_id)
-        
-        total = (await self.db.execute(count_query)).scalar_one()
+        total = None
+        if count != "none":
+            total = await self.count_by_user(user_id, filters, estimate=count == "estimate")
 
         # Pagination and ordering
-        query = query.order_by(Transaction.transaction_date.desc(), Transaction.created_at.desc())
-        query = query.offset(offset).limit(limit)
+        sort_key = (Transaction.transaction_date, Transaction.created_at, Transaction.id)
+        query = query.order_by(*(column.desc() for column in sort_key))
+        if cursor:
+            query = query.where(tuple_(*sort_key) < tuple_(*self._decode_cursor(cursor)))
+        else:
+            query = query.offset(offset)
+        query = query.limit(limit)
         
         result = await self.db.execute(query)
         transactions = list(result.scalars().all())
         
-        return transactions, total
+        next_cursor = None
+        if len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = encode_cursor([last.transaction_date, last.created_at, last.id])
+        
+        return transactions, total, next_cursor
+
+    async def count_by_user(
+        self,
+        user_id: str,
+        filters: Optional[TransactionFilter] = None,
+        estimate: bool = False,
+    ) -> int:
+        """
+        Count a user's transactions matching the filters.
+
+        Exact counts are cached per (user, filters) until the user's next
+        transaction write, or COUNT_CACHE_TTL seconds in other workers. With
+        ``estimate`` the planner's row estimate is returned instead when it
+        is above ESTIMATE_THRESHOLD; smaller results are counted exactly.
+        """
+        conditions = self._filter_conditions(user_id, filters)
+        if estimate:
+            estimated = await estimate_row_count(self.db, select(Transaction.id).where(*conditions))
+            if estimated >= ESTIMATE_THRESHOLD:
+                return estimated
+
+        key = (user_id, _count_generations.get(user_id, 0), self._filters_key(filters))
+        total = _count_cache.get(key)
+        record_lookup("transaction_count", MISS if total is None else LOCAL_HIT)
+        if total is None:
+            count_query = select(func.count()).select_from(Transaction).where(*conditions)
+            total = (await self.db.execute(count_query)).scalar_one()
+            _count_cache.set(key, total)
+        return total
+
+    @staticmethod
+    def invalidate_counts(user_id: str) -> None:
+        """Drop this worker's cached counts for a user after a transaction write."""
+        _count_generations[user_id] = _count_generations.get(user_id, 0) + 1
+
+    @staticmethod
+    async def invalidate_cache(user_id: str, transaction: Transaction) -> None:
+        """Drop cached responses that a transaction write may have changed."""
+        tags = [user_tag(user_id), account_tag(transaction.account_id)]
+        if transaction.related_account_id:
+            tags.append(account_tag(transaction.related_account_id))
+        await TaggedCache.invalidate(*tags)
+
+    @staticmethod
+    def _filters_key(filters: Optional[TransactionFilter]) -> str:
+        """Stable hash of the filters that are set."""
+        if not filters:
+            return ""
+        payload = filters.model_dump_json(exclude_none=True)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _filter_conditions(user_id: str, filters: Optional[TransactionFilter]) -> list:
+        """WHERE conditions shared by the page query and its count."""
+        conditions = [Transaction.user_id == user_id]
+        if not filters:
+            return conditions
+
+        if filters.type:
+            conditions.append(Transaction.type == filters.type)
+        if filters.account_id:
+            conditions.append(Transaction.account_id == filters.account_id)
+        if filters.category_id:
+            conditions.append(Transaction.category_id == filters.category_id)
+        if filters.start_date:
+            conditions.append(Transaction.transaction_date >= filters.start_date)
+        if filters.end_date:
+            conditions.append(Transaction.transaction_date <= filters.end_date)
+        if filters.min_amount:
+            conditions.append(Transaction.amount >= filters.min_amount)
+        if filters.max_amount:
+            conditions.append(Transaction.amount <= filters.max_amount)
+        if filters.search:
+            conditions.append(TransactionService._search_condition(filters.search))
+        return conditions
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[date, datetime, str]:
+        """Decode a transaction page cursor into its (date, created_at, id) key."""
+        transaction_date, created_at, transaction_id = decode_cursor(cursor, 3)
+        try:
+            return (
+                date.fromisoformat(transaction_date),
+                datetime.fromisoformat(created_at),
+                str(transaction_id),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    async def search(self, user_id: str, term: str, limit: int = 20) -> List[Transaction]:
+        """
+        Search transactions by description and linked attachment text, best match first.
+
+        Words are prefix-matched ("coff" finds "coffee"); matches found only
+        in a receipt's OCR text rank below matches in the description.
+        """
+        tsquery = self._prefix_tsquery(term)
+        query = (
+            select(Transaction)
+            .where(Transaction.user_id == user_id, self._search_condition(term))
+            .options(selectinload(Transaction.category), selectinload(Transaction.account))
+            .limit(limit)
+        )
+        if tsquery is not None:
+            attachment_rank = (
+                select(func.max(func.ts_rank(Attachment.search_vector, tsquery)))
+                .where(Attachment.linked_transaction_id == Transaction.id)
+                .scalar_subquery()
+            )
+            rank = func.ts_rank(Transaction.search_vector, tsquery) + func.coalesce(attachment_rank, 0) * 0.5
+            query = query.order_by(rank.desc(), Transaction.transaction_date.desc())
+        else:
+            query = query.order_by(Transaction.transaction_date.desc())
+        
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _prefix_tsquery(term: str):
+        """Build a prefix-matching tsquery ("a:* & b:*") from the words in a search term."""
+        words = re.findall(r"\w+", term.lower())
+        if not words:
+            return None
+        return func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+
+    @staticmethod
+    def _search_condition(term: str):
+        """
+        Indexed search predicate for a free-text term.
+
+        Matches word prefixes in the description or in the OCR text of a linked
+        attachment (GIN tsvector indexes), and falls back to substring matching
+        on the description (trigram index) so infix searches keep working.
+        """
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        substring = Transaction.description.ilike(pattern, escape="\\")
+        tsquery = TransactionService._prefix_tsquery(term)
+        if tsquery is None:
+            return substring
+        
+        # Uncorrelated, so matching attachments are found once through their
+        # own index rather than probed for every transaction the OR keeps
+        in_attachment = Transaction.id.in_(
+            select(Attachment.linked_transaction_id).where(
+                Attachment.search_vector.op("@@")(tsquery)
+            )
+        )
+        return or_(Transaction.search_vector.op("@@")(tsquery), substring, in_attachment)
 
     async def create_transaction(
         self, user_id: str, data: TransactionCreate, account_service
@@ -103,6 +264,7 @@ class TransactionService(BaseService[Transaction]):
         )
         
         self.db.add(transaction)
+        await self.rollups.add(transaction)
         
         # Update account balance
         if data.type == "income":
@@ -115,6 +277,8 @@ class TransactionService(BaseService[Transaction]):
             )
         
         await self.db.commit()
+        self.invalidate_counts(user_id)
+        await self.invalidate_cache(user_id, transaction)
         await self.db.refresh(transaction)
         return transaction
 
@@ -126,11 +290,27 @@ class TransactionService(BaseService[Transaction]):
         if not transaction:
             return None
         
+        previous = self.rollups.contribution(
+            transaction.transaction_date, transaction.type,
+            transaction.category_id, transaction.amount, sign=-1,
+        )
+        
         update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(transaction, key, value)
         
+        # Move the transaction's contribution if it changed month/type/category/amount
+        await self.rollups.apply(user_id, self.rollups.merge(
+            previous,
+            self.rollups.contribution(
+                transaction.transaction_date, transaction.type,
+                transaction.category_id, transaction.amount,
+            ),
+        ))
+        
         await self.db.commit()
+        self.invalidate_counts(user_id)
+        await self.invalidate_cache(user_id, transaction)
         await self.db.refresh(transaction)
         return transaction
 
@@ -152,8 +332,11 @@ class TransactionService(BaseService[Transaction]):
                 transaction.account_id, transaction.amount, is_credit=True
             )
         
+        await self.rollups.remove(transaction)
         await self.db.delete(transaction)
         await self.db.commit()
+        self.invalidate_counts(user_id)
+        await self.invalidate_cache(user_id, transaction)
         return True
 
     async def get_summary(
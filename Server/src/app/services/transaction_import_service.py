@@ -0,0 +1,296 @@
+"""Bulk transaction import service for Personal Finance."""
+
+import csv
+import io
+import json
+import re
+import uuid
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Account, Category, Transaction
+from src.app.schemas import TransactionImportResult, TransactionImportRow
+from src.app.services.account import AccountService
+from src.app.services.rollup_service import MonthlyRollupService, RollupDeltas
+from src.app.services.transaction import TransactionService
+from src.core.cache import TaggedCache, account_tag, user_tag
+
+BATCH_SIZE = 5000
+MAX_ERRORS = 50
+FORMATS = ("csv", "ofx", "jsonl")
+
+# Column order for COPY; search_vector is generated by the database
+COPY_COLUMNS = (
+    "id", "user_id", "account_id", "type", "amount", "currency", "description",
+    "transaction_date", "category_id", "created_at", "updated_at",
+)
+
+# Common bank statement headers -> TransactionImportRow fields
+CSV_ALIASES = {
+    "date": "transaction_date",
+    "txn date": "transaction_date",
+    "value date": "transaction_date",
+    "narration": "description",
+    "memo": "description",
+    "details": "description",
+    "category": "category_id",
+    "account": "account_id",
+}
+
+OFX_BLOCK = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.DOTALL | re.IGNORECASE)
+OFX_FIELD = re.compile(r"<(\w+)>([^<\r\n]*)")
+
+# (row number, raw fields or None when the row could not be parsed)
+RawRow = Tuple[int, Optional[dict]]
+
+_rows_adapter = TypeAdapter(List[TransactionImportRow])
+
+
+class TransactionImportService:
+    """
+    Imports bank statements in one database transaction.
+
+    Rows are parsed from the uploaded file as a stream, validated
+    BATCH_SIZE at a time and written with COPY. Account balances, the
+    monthly rollup and cached counts are updated once at the end instead
+    of once per row.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.accounts = AccountService(db)
+        self.rollups = MonthlyRollupService(db)
+
+    @staticmethod
+    def detect_format(filename: Optional[str]) -> Optional[str]:
+        """Guess the statement format from a file name."""
+        extension = (filename or "").rsplit(".", 1)[-1].lower()
+        if extension in ("csv", "txt"):
+            return "csv"
+        if extension in ("ofx", "qfx"):
+            return "ofx"
+        if extension in ("jsonl", "ndjson", "json"):
+            return "jsonl"
+        return None
+
+    async def import_file(
+        self,
+        user_id: str,
+        account_id: str,
+        file: IO[bytes],
+        file_format: str,
+        skip_invalid: bool = False,
+    ) -> TransactionImportResult:
+        """
+        Import every row of a statement into the user's account.
+
+        Rows may name another of the user's accounts in ``account_id``.
+        Unless ``skip_invalid`` is set, any invalid row rolls the whole
+        import back and nothing is written.
+
+        Raises:
+            ValueError: If the format is unknown or the account is not the user's
+        """
+        if file_format not in FORMATS:
+            raise ValueError(f"Unsupported format: {file_format}")
+
+        account_currencies = await self._account_currencies(user_id)
+        if account_id not in account_currencies:
+            raise ValueError("Account not found")
+        category_ids = await self._category_ids(user_id)
+
+        result = TransactionImportResult()
+        balance_deltas: Dict[str, Decimal] = {}
+        rollup_deltas: RollupDeltas = {}
+        now = datetime.utcnow()
+
+        stream = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+        try:
+            for batch in self._batches(self._parse(stream, file_format)):
+                rows = self._validate(batch, result)
+                records = []
+                for line, row in rows:
+                    row_account_id = row.account_id or account_id
+                    if row_account_id not in account_currencies:
+                        self._reject(result, line, "account not found")
+                        continue
+                    if row.category_id and row.category_id not in category_ids:
+                        self._reject(result, line, "category not found")
+                        continue
+
+                    records.append((
+                        str(uuid.uuid4()), user_id, row_account_id, row.type, row.amount,
+                        row.currency or account_currencies[row_account_id], row.description,
+                        row.transaction_date, row.category_id, now, now,
+                    ))
+                    delta = row.amount if row.type == "income" else -row.amount
+                    balance_deltas[row_account_id] = balance_deltas.get(row_account_id, Decimal("0")) + delta
+
+                if result.skipped and not skip_invalid:
+                    # The import will be rolled back; keep parsing only to report errors
+                    continue
+                if records:
+                    await self._copy(records)
+                    rollup_deltas = self.rollups.merge(rollup_deltas, *(
+                        self.rollups.contribution(r[7], r[3], r[8], r[4]) for r in records
+                    ))
+                    result.imported += len(records)
+        finally:
+            stream.detach()
+
+        if result.skipped and not skip_invalid:
+            await self.db.rollback()
+            result.imported = 0
+            return result
+
+        await self.accounts.apply_balance_deltas(balance_deltas)
+        await self.rollups.apply(user_id, rollup_deltas)
+        await self.db.commit()
+        TransactionService.invalidate_counts(user_id)
+        await TaggedCache.invalidate(user_tag(user_id), *(account_tag(a) for a in balance_deltas))
+        return result
+
+    async def _account_currencies(self, user_id: str) -> Dict[str, str]:
+        """Map the user's account IDs to their currency."""
+        query = select(Account.id, Account.currency).where(Account.user_id == user_id)
+        return {row.id: row.currency for row in (await self.db.execute(query)).all()}
+
+    async def _category_ids(self, user_id: str) -> set:
+        """IDs of the user's categories."""
+        query = select(Category.id).where(Category.user_id == user_id)
+        return set((await self.db.execute(query)).scalars().all())
+
+    async def _copy(self, records: List[tuple]) -> None:
+        """Write a batch with COPY on the session's own connection (and transaction)."""
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Transaction.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+
+    def _validate(
+        self, batch: List[RawRow], result: TransactionImportResult
+    ) -> List[Tuple[int, TransactionImportRow]]:
+        """Validate a batch in one pass, falling back to row by row to isolate errors."""
+        parsed = [(line, raw) for line, raw in batch if raw is not None]
+        for line, raw in batch:
+            if raw is None:
+                self._reject(result, line, "could not parse row")
+
+        try:
+            rows = _rows_adapter.validate_python([raw for _, raw in parsed])
+            return [(line, row) for (line, _), row in zip(parsed, rows)]
+        except ValidationError:
+            pass
+
+        valid = []
+        for line, raw in parsed:
+            try:
+                valid.append((line, TransactionImportRow.model_validate(raw)))
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                self._reject(result, line, f"{field}: {error['msg']}")
+        return valid
+
+    @staticmethod
+    def _reject(result: TransactionImportResult, line: int, message: str) -> None:
+        """Count a skipped row, keeping the first MAX_ERRORS messages."""
+        result.skipped += 1
+        if len(result.errors) < MAX_ERRORS:
+            result.errors.append(f"row {line}: {message}")
+
+    @staticmethod
+    def _batches(rows: Iterator[RawRow]) -> Iterator[List[RawRow]]:
+        """Group rows into lists of BATCH_SIZE."""
+        batch: List[RawRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parse(self, stream: IO[str], file_format: str) -> Iterator[RawRow]:
+        """Parse a statement lazily into raw field dicts."""
+        if file_format == "csv":
+            return self._parse_csv(stream)
+        if file_format == "ofx":
+            return self._parse_ofx(stream)
+        return self._parse_jsonl(stream)
+
+    @staticmethod
+    def _normalize(raw: dict) -> dict:
+        """Fill in the type from a signed amount when the statement has no type column."""
+        amount = raw.get("amount")
+        if isinstance(amount, str):
+            amount = amount.replace(",", "")
+            raw["amount"] = amount
+        if not raw.get("type") and amount not in (None, ""):
+            try:
+                value = Decimal(str(amount))
+            except InvalidOperation:
+                return raw
+            raw["type"] = "expense" if value < 0 else "income"
+            raw["amount"] = abs(value)
+        return raw
+
+    def _parse_csv(self, stream: IO[str]) -> Iterator[RawRow]:
+        """CSV with a header row; common bank column names are recognised."""
+        reader = csv.DictReader(stream)
+        for line, row in enumerate(reader, start=2):
+            raw = {}
+            for key, value in row.items():
+                if not key or value is None or not value.strip():
+                    continue
+                name = key.strip().lower()
+                raw[CSV_ALIASES.get(name, name)] = value.strip()
+            yield line, self._normalize(raw)
+
+    def _parse_jsonl(self, stream: IO[str]) -> Iterator[RawRow]:
+        """One JSON object per line."""
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                raw = json.loads(text)
+            except json.JSONDecodeError:
+                yield line, None
+                continue
+            yield line, self._normalize(raw) if isinstance(raw, dict) else None
+
+    def _parse_ofx(self, stream: IO[str], chunk_size: int = 65536) -> Iterator[RawRow]:
+        """OFX/QFX <STMTTRN> blocks (SGML or XML flavour), read in chunks."""
+        buffer = ""
+        number = 0
+        while True:
+            chunk = stream.read(chunk_size)
+            buffer += chunk
+            end = 0
+            for match in OFX_BLOCK.finditer(buffer):
+                number += 1
+                end = match.end()
+                fields = {tag.upper(): value.strip() for tag, value in OFX_FIELD.findall(match.group(1))}
+                posted = fields.get("DTPOSTED", "")
+                raw = {
+                    "amount": fields.get("TRNAMT"),
+                    "description": fields.get("NAME") or fields.get("MEMO"),
+                    "transaction_date": (
+                        f"{posted[0:4]}-{posted[4:6]}-{posted[6:8]}" if len(posted) >= 8 else None
+                    ),
+                }
+                yield number, self._normalize(raw)
+            if end:
+                buffer = buffer[end:]
+            else:
+                # Drop header text that cannot be part of a transaction block
+                start = buffer.upper().rfind("<STMTTRN>")
+                buffer = buffer[start:] if start >= 0 else buffer[-len("<STMTTRN>"):]
+            if not chunk:
+                break
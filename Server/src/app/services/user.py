@@ -10,6 +10,7 @@ from src.app.models import User, Role
 from src.app.schemas import UserWithRoles
 from src.core.security import verify_password, get_password_hash
 from src.app.services.base import BaseService
+from src.app.services.principal_cache import PrincipalCache
 
 
 class UserService(BaseService[User]):
@@ -184,6 +185,23 @@ class UserService(BaseService[User]):
             )
         return user_list
 
+    async def update(self, id: str, **kwargs) -> Optional[User]:
+        """Update a user and drop their cached principal (status, name, ...)."""
+        user = await super().update(id, **kwargs)
+        if user:
+            await PrincipalCache.invalidate(user.username)
+        return user
+
+    async def delete(self, id: str) -> bool:
+        """Delete a user and drop their cached principal."""
+        user = await self.get(id)
+        if not user:
+            return False
+        username = user.username
+        await super().delete(id)
+        await PrincipalCache.invalidate(username)
+        return True
+
     async def add_role(self, user_id: str, role_id: int):
         """Add a role to a user."""
         result = await self.db.execute(
@@ -196,6 +214,7 @@ class UserService(BaseService[User]):
         if role not in user.roles:
             user.roles.append(role)
             await self.db.commit()
+            await PrincipalCache.invalidate(user.username)
             await self.db.refresh(user)
         return user
 
@@ -211,6 +230,7 @@ class UserService(BaseService[User]):
         if role in user.roles:
             user.roles.remove(role)
             await self.db.commit()
+            await PrincipalCache.invalidate(user.username)
             await self.db.refresh(user)
         return user
 
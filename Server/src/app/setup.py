@@ -1,18 +1,23 @@
 """Application setup module."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import secrets
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from loguru import logger
-from redis import asyncio as aioredis
 from sqlalchemy import text
 
 from src.app.api import api_router
-from src.core.cache.client import init_redis_cache
+from src.core.cache import TaggedCache, init_redis_cache
 from src.core.config import settings
-from src.core.db.session import engine
+from src.core.db.session import engine, read_engine
 from src.core.err import setup_exception_handlers
 from src.core.log import setup_logging
+from src.core.metrics import render as render_metrics
+from src.core.redis import InstrumentedRedis, set_redis_client
+from src.core.utils.process_pool import shutdown_process_pool
 from src.core.middleware import setup_middleware
 
 
@@ -27,13 +32,17 @@ async def lifespan(app: FastAPI):
         async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
             logger.info("Successfully connected to PostgreSQL")
+        if read_engine is not None:
+            async with read_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                logger.info("Successfully connected to PostgreSQL read replica")
     except Exception as e:
         logger.error(f"Failed to connect to PostgreSQL: {str(e)}")
         raise
 
     try:
         # Connect to Redis
-        redis = aioredis.from_url(
+        redis = InstrumentedRedis.from_url(
             str(settings.REDIS_URL),
             encoding="utf8",
             decode_responses=True,
@@ -42,10 +51,14 @@ async def lifespan(app: FastAPI):
         await redis.ping()
         logger.info("Successfully connected to Redis")
         app.state.redis = redis
+        set_redis_client(redis)
 
         # Initialize Redis cache
         await init_redis_cache()
         logger.info("Redis cache initialized")
+
+        # Apply other workers' response cache invalidations locally
+        cache_listener = asyncio.create_task(TaggedCache.listen())
     except Exception as e:
         logger.error(f"Failed to connect to Redis: {str(e)}")
         raise
@@ -55,13 +68,27 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     try:
+        # Stop the cache invalidation listener
+        cache_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await cache_listener
+
         # Close Redis connection
+        set_redis_client(None)
         await redis.close()
         logger.info("Redis connection closed")
 
-        # Close PostgreSQL connection pool
+        # Close PostgreSQL connection pools
         await engine.dispose()
+        if read_engine is not None:
+            await read_engine.dispose()
         logger.info("PostgreSQL connection pool closed")
+
+        # Stop thumbnail workers
+        shutdown_process_pool()
+
+        # Flush queued access records
+        await logger.complete()
     except Exception as e:
         logger.error(f"Error during cleanup: {str(e)}")
 
@@ -112,4 +139,15 @@ def create_app() -> FastAPI:
 
         return response
 
+    if settings.METRICS_ENABLED:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics(request: Request):
+            """Metrics of this worker process in the Prometheus text format."""
+            if settings.METRICS_TOKEN and not secrets.compare_digest(
+                request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+            ):
+                return PlainTextResponse("Unauthorized", status_code=401)
+            return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
     return app
@@ -1,8 +1,14 @@
 from src.core.cache.client import init_redis_cache
-from src.core.cache.utils import cached, user_specific_cache_key
+from src.core.cache.tagged import TaggedCache, account_tag, group_tag, user_tag
+from src.core.cache.utils import cached, cached_response, user_specific_cache_key
 
 __all__ = [
     "init_redis_cache",
     "cached",
+    "cached_response",
     "user_specific_cache_key",
+    "TaggedCache",
+    "account_tag",
+    "group_tag",
+    "user_tag",
 ]
@@ -0,0 +1,46 @@
+"""Cache hit and miss metrics."""
+
+from typing import Dict, Iterable, Tuple
+
+from src.core.metrics import Counter, Gauge
+
+LOCAL_HIT = "local_hit"
+REDIS_HIT = "redis_hit"
+MISS = "miss"
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and outcome (local_hit, redis_hit, miss).",
+    labelnames=("cache", "result"),
+)
+
+# cache -> [hits, lookups]
+_totals: Dict[str, list] = {}
+
+
+def _hit_ratios() -> Iterable[Tuple[Dict[str, str], float]]:
+    for cache, (hits, lookups) in _totals.items():
+        yield {"cache": cache}, hits / lookups if lookups else 0.0
+
+
+CACHE_HIT_RATIO = Gauge(
+    "cache_hit_ratio",
+    "Share of lookups served from either cache tier since the worker started.",
+    labelnames=("cache",),
+    collect=_hit_ratios,
+)
+
+
+def record_lookup(cache: str, result: str) -> None:
+    """
+    Count a cache lookup.
+
+    Args:
+        cache: Cache name (e.g. "response", "principal")
+        result: LOCAL_HIT, REDIS_HIT or MISS
+    """
+    CACHE_LOOKUPS.inc(cache=cache, result=result)
+    totals = _totals.setdefault(cache, [0, 0])
+    totals[1] += 1
+    if result != MISS:
+        totals[0] += 1
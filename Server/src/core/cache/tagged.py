@@ -0,0 +1,371 @@
+"""Two-tier response cache with tag-based invalidation."""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.core.cache.stats import LOCAL_HIT, MISS, REDIS_HIT, record_lookup
+from src.core.db.replica import record_writes
+from src.core.redis import get_redis_client
+from src.core.utils.local_cache import LocalTTLCache
+
+# Local entries only bridge the gap until another worker's invalidation
+# arrives over pub/sub, so they are kept short; Redis holds the entry for
+# the TTL the endpoint asked for.
+LOCAL_TTL = 5
+KEY_PREFIX = "tcache:"
+TAG_PREFIX = "tcache:tag:"
+USER_TAG_PREFIX = "user:"
+LOCK_PREFIX = "tcache:lock:"
+INVALIDATION_CHANNEL = "tcache:invalidate"
+# How long one worker may hold a key's refresh before another may take over
+LOCK_TTL = 30
+LOCK_POLL_INTERVAL = 0.05
+# Longer than any entry's TTL, so a tag set never expires before its entries
+TAG_TTL = 86400
+
+# Delete every key listed in each tag set, then the sets themselves, in one
+# step so an entry tagged while the invalidation runs cannot be missed.
+INVALIDATE_SCRIPT = """
+local deleted = 0
+for _, tag in ipairs(KEYS) do
+    local keys = redis.call('SMEMBERS', tag)
+    for _, key in ipairs(keys) do
+        deleted = deleted + redis.call('DEL', key)
+    end
+    redis.call('DEL', tag)
+end
+return deleted
+"""
+
+# Release a lock only if we still hold it
+UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# (value, unix time until which it is fresh)
+Entry = Tuple[Any, float]
+
+_local = LocalTTLCache(ttl=LOCAL_TTL)
+# tag -> local keys carrying it
+_local_tags: Dict[str, Set[str]] = {}
+# tag -> number of invalidations seen by this worker
+_generations: Dict[str, int] = {}
+# key -> computation in progress in this worker, shared by concurrent callers
+_inflight: Dict[str, "asyncio.Future"] = {}
+# Background refreshes, kept referenced until they finish
+_refreshes: Set["asyncio.Task"] = set()
+
+
+def _refresh_done(task: "asyncio.Task") -> None:
+    """Forget a finished background refresh, logging its failure."""
+    _refreshes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Response cache refresh failed: {task.exception()}")
+
+
+def user_tag(user_id: str) -> str:
+    """Tag for everything derived from a user's own data."""
+    return f"{USER_TAG_PREFIX}{user_id}"
+
+
+def group_tag(group_id: str) -> str:
+    """Tag for everything derived from a group's expenses, settlements and members."""
+    return f"group:{group_id}"
+
+
+def account_tag(account_id: str) -> str:
+    """Tag for everything derived from one account's balance or transactions."""
+    return f"account:{account_id}"
+
+
+class TaggedCache:
+    """
+    Response cache with an in-process LRU in front of Redis.
+
+    Entries are JSON values stored under one or more tags. Invalidating a
+    tag deletes its entries from Redis and publishes the tag so every
+    worker drops its local copies. Redis errors are logged and treated as
+    misses, so a Redis outage only costs cache hits.
+
+    fetch() adds stampede protection: concurrent misses for a key share one
+    computation per worker, and a Redis lock lets one worker compute while
+    the others wait for its result. Entries may outlive their freshness by
+    a stale period, during which callers get the old value while one
+    background refresh replaces it. Invalidation always deletes outright,
+    so stale values are never served after a write.
+    """
+
+    @staticmethod
+    def generation(tags: Iterable[str]) -> tuple:
+        """Snapshot of this worker's invalidation counters for some tags."""
+        return tuple(_generations.get(tag, 0) for tag in tags)
+
+    @staticmethod
+    async def get(key: str) -> Optional[Any]:
+        """Get a cached value, fresh or stale."""
+        entry = await TaggedCache._read(key)
+        return entry[0] if entry is not None else None
+
+    @staticmethod
+    async def _read(key: str) -> Optional[Entry]:
+        """Get a cached (value, fresh_until) entry."""
+        entry = _local.get(key)
+        if entry is not None:
+            record_lookup("response", LOCAL_HIT)
+            return entry
+
+        redis = get_redis_client()
+        if redis is None:
+            record_lookup("response", MISS)
+            return None
+        try:
+            raw = await redis.get(KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            raw = None
+        if raw is None:
+            record_lookup("response", MISS)
+            return None
+        record_lookup("response", REDIS_HIT)
+        stored = json.loads(raw)
+        entry = (stored["value"], stored["fresh_until"])
+        _local.set(key, entry)
+        return entry
+
+    @staticmethod
+    async def set(
+        key: str,
+        value: Any,
+        tags: Iterable[str],
+        expire: int,
+        generation: Optional[tuple] = None,
+        stale: int = 0,
+    ) -> None:
+        """
+        Cache a JSON-safe value under some tags.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            tags: Tags that invalidate the entry
+            expire: Seconds the entry stays fresh
+            generation: TaggedCache.generation(tags) taken before the value
+                was computed; if a tag was invalidated since, the value may
+                be stale and is not stored
+            stale: Further seconds the entry may be served while it is refreshed
+        """
+        tags = list(tags)
+        if generation is not None and TaggedCache.generation(tags) != generation:
+            return
+
+        fresh_until = time.time() + expire
+        _local.set(key, (value, fresh_until))
+        for tag in tags:
+            _local_tags.setdefault(tag, set()).add(key)
+
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            stored = json.dumps({"value": value, "fresh_until": fresh_until})
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.set(KEY_PREFIX + key, stored, ex=expire + stale)
+                for tag in tags:
+                    pipe.sadd(TAG_PREFIX + tag, KEY_PREFIX + key)
+                    pipe.expire(TAG_PREFIX + tag, max(TAG_TTL, expire + stale))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    @staticmethod
+    async def fetch(
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Iterable[str],
+        expire: int,
+        stale: int = 0,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """
+        Get a value, computing it at most once across workers on a miss.
+
+        Args:
+            key: Cache key
+            compute: Produces the JSON-safe value
+            tags: Tags that invalidate the entry
+            expire: Seconds the entry stays fresh
+            stale: Further seconds a stale entry is served while refreshing
+            refresh: Like compute, but safe to run after the request has
+                finished (e.g. with its own database session); needed for
+                background refresh
+
+        Returns:
+            Cached or computed value
+        """
+        tags = list(tags)
+        entry = await TaggedCache._read(key)
+        if entry is not None:
+            value, fresh_until = entry
+            if fresh_until > time.time():
+                return value
+            if refresh is not None and stale:
+                if key not in _inflight:
+                    task = asyncio.create_task(
+                        TaggedCache._single_flight(key, refresh, tags, expire, stale)
+                    )
+                    _refreshes.add(task)
+                    task.add_done_callback(_refresh_done)
+                return value
+
+        return await TaggedCache._single_flight(key, compute, tags, expire, stale)
+
+    @staticmethod
+    async def _single_flight(
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: list,
+        expire: int,
+        stale: int,
+    ) -> Any:
+        """Run compute once per worker for concurrent callers, and once per cluster if possible."""
+        inflight = _inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The computing caller was cancelled, not us: compute again
+                return await TaggedCache._single_flight(key, compute, tags, expire, stale)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            value = await TaggedCache._compute_locked(key, compute, tags, expire, stale)
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; keep the loop from reporting it as unretrieved
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            _inflight.pop(key, None)
+
+    @staticmethod
+    async def _compute_locked(
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: list,
+        expire: int,
+        stale: int,
+    ) -> Any:
+        """Compute under the key's Redis lock, or wait for the worker holding it."""
+        redis = get_redis_client()
+        token = uuid.uuid4().hex
+        locked = False
+        if redis is not None:
+            try:
+                locked = bool(await redis.set(LOCK_PREFIX + key, token, nx=True, ex=LOCK_TTL))
+                contended = not locked
+            except Exception as e:
+                logger.warning(f"Response cache lock failed: {e}")
+                contended = False
+
+            if contended:
+                # Another worker is computing; take its result when it lands
+                previous = _local.get(key)
+                deadline = time.monotonic() + LOCK_TTL
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+                    _local.delete(key)
+                    entry = await TaggedCache._read(key)
+                    if entry is not None and entry != previous and entry[1] > time.time():
+                        return entry[0]
+                    try:
+                        if not await redis.exists(LOCK_PREFIX + key):
+                            break
+                    except Exception:
+                        break
+
+        try:
+            generation = TaggedCache.generation(tags)
+            value = await compute()
+            await TaggedCache.set(key, value, tags, expire, generation, stale)
+            return value
+        finally:
+            if locked and redis is not None:
+                try:
+                    await redis.eval(UNLOCK_SCRIPT, 1, LOCK_PREFIX + key, token)
+                except Exception as e:
+                    logger.warning(f"Response cache unlock failed: {e}")
+
+    @staticmethod
+    async def invalidate(*tags: str) -> None:
+        """Drop every entry carrying any of the tags, in every worker."""
+        if not tags:
+            return
+        TaggedCache.drop_local(tags)
+        # Every write reports the users it affected here; keep their reads on the primary
+        await record_writes(
+            tag[len(USER_TAG_PREFIX):] for tag in tags if tag.startswith(USER_TAG_PREFIX)
+        )
+
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            await redis.eval(INVALIDATE_SCRIPT, len(tags), *(TAG_PREFIX + tag for tag in tags))
+            await redis.publish(INVALIDATION_CHANNEL, json.dumps(list(tags)))
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+    @staticmethod
+    def drop_local(tags: Iterable[str]) -> None:
+        """Drop this worker's entries for some tags."""
+        for tag in tags:
+            _generations[tag] = _generations.get(tag, 0) + 1
+            for key in _local_tags.pop(tag, ()):
+                _local.delete(key)
+
+    @staticmethod
+    async def listen() -> None:
+        """
+        Apply other workers' invalidations to the local tier until cancelled.
+
+        Run as a background task for the application's lifetime. Local
+        entries are dropped wholesale whenever the subscription is lost,
+        since invalidations may have been missed meanwhile.
+        """
+        while True:
+            redis = get_redis_client()
+            if redis is None:
+                await asyncio.sleep(1)
+                continue
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        TaggedCache.drop_local(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Response cache invalidation listener failed: {e}")
+                _local.clear()
+                _local_tags.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
@@ -1,12 +1,20 @@
 """Cache utilities."""
 
-from typing import Any, Callable, Optional
+import hashlib
+import json
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
 
-from fastapi import Depends
+from fastapi.encoders import jsonable_encoder
 from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
 
-from src.app.api.deps import get_current_user
-from src.app.models.user import User
+from src.core.cache.tagged import TaggedCache, user_tag
+from src.core.db.session import read_session_factory
+from src.core.security import get_token_subject
+
+# Endpoint arguments that are injected dependencies, not part of the cache key
+DEPENDENCY_ARGS = frozenset({"db", "current_user", "request", "response"})
 
 
 def cached(
@@ -35,19 +43,107 @@ def cached(
 def user_specific_cache_key(
     func,
     namespace: Optional[str] = "",
-    user: User = Depends(get_current_user),
-    **kwargs,
+    *,
+    request=None,
+    response=None,
+    args=(),
+    kwargs=None,
 ):
     """
     Create cache key based on user.
 
+    The user is the access token's subject, so building the key needs no
+    database lookup.
+
     Args:
         func: The function being cached
         namespace: Optional cache namespace
-        user: Current user from dependency
-        kwargs: Additional arguments
+        request: Current request
+        response: Current response
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        Cache key string including username and query string
+    """
+    username = get_token_subject(request.headers.get("Authorization")) if request else None
+    query = request.url.query if request else ""
+    return f"{namespace}:{func.__name__}:user:{username}:{query}"
+
+
+def cached_response(
+    expire: int = 60,
+    namespace: Optional[str] = None,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+    model: Any = None,
+    stale: int = 0,
+) -> Callable:
+    """
+    Cache a per-user endpoint in the two-tier tagged cache.
+
+    The key is the current user plus the endpoint's own parameters. Every
+    entry is tagged with the user; ``tags`` adds more from the parameters
+    (e.g. a group tag from ``group_id``). Services invalidate the tags on
+    writes, so entries can live long without serving stale data.
+
+    Concurrent misses are coalesced into one computation. With ``stale``,
+    an expired entry keeps being served for that long while it is
+    recomputed in the background with a session of its own.
+
+    Args:
+        expire: Cache expiration time in seconds
+        namespace: Cache namespace (defaults to the endpoint's module)
+        tags: Called with the endpoint's parameters, returns extra tags
+        model: Type to serialize the result with (e.g. List[Account]) when
+            the endpoint returns ORM objects
+        stale: Seconds an expired entry may still be served while refreshing
 
     Returns:
-        Cache key string including username
+        Decorator for endpoints that depend on ``current_user``
     """
-    return f"{namespace}:{func.__name__}:user:{user.username}"
\ No newline at end of file
+    adapter = TypeAdapter(model) if model is not None else None
+
+    def decorator(func: Callable) -> Callable:
+        prefix = f"{namespace or func.__module__}:{func.__name__}"
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            user = kwargs.get("current_user")
+            if user is None:
+                return await func(*args, **kwargs)
+
+            params = {name: value for name, value in kwargs.items() if name not in DEPENDENCY_ARGS}
+            digest = hashlib.sha1(
+                json.dumps(jsonable_encoder(params), sort_keys=True).encode()
+            ).hexdigest()
+            key = f"{prefix}:{user.id}:{digest}"
+
+            def encode(result: Any) -> Any:
+                if adapter is not None:
+                    return adapter.dump_python(
+                        adapter.validate_python(result, from_attributes=True), mode="json"
+                    )
+                return jsonable_encoder(result)
+
+            async def compute() -> Any:
+                return encode(await func(*args, **kwargs))
+
+            async def refresh() -> Any:
+                # The request's session is closed by the time this runs. Entries
+                # are deleted on writes, so a stale one predates any recent write
+                # and the replica is safe to refresh it from.
+                async with read_session_factory() as session:
+                    return encode(await func(*args, **{**kwargs, "db": session}))
+
+            return await TaggedCache.fetch(
+                key,
+                compute,
+                tags=[user_tag(user.id), *(tags(**params) if tags else ())],
+                expire=expire,
+                stale=stale,
+                refresh=refresh if "db" in kwargs else None,
+            )
+
+        return wrapper
+
+    return decorator
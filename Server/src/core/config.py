@@ -1,6 +1,6 @@
 """Application configuration module."""
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 from pydantic import PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +40,18 @@ class Settings(BaseSettings):
     DB_NAME: str = "vectix"
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "postgres"
+    # Connection pool, per engine and worker process
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Statements at least this slow are logged with their endpoint
+    DB_SLOW_QUERY_MS: int = 500
+    # Optional read replica for dashboards, lists and exports
+    DATABASE_READ_URL: Optional[PostgresDsn] = None
+    # How long a user's reads stay on the primary after their data changes
+    READ_YOUR_WRITES_SECONDS: int = 10
 
     # Redis settings
     REDIS_URL: RedisDsn
@@ -47,6 +59,19 @@ class Settings(BaseSettings):
     # Rate limiting
     RATE_LIMIT_ENABLED: bool = False
     RATE_LIMIT_DEFAULT: str = "100/minute"
+    # Per-worker first tier: leases tokens from Redis in batches, rejects
+    # known-limited clients without network I/O and covers Redis outages
+    RATE_LIMIT_LOCAL_TIER: bool = False
+    RATE_LIMIT_LEASE_FRACTION: float = 0.05
+    RATE_LIMIT_LEASE_SECONDS: float = 1.0
+
+    # Share of 2xx responses written to the access log (errors are always logged)
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+
+    # Prometheus-style /metrics endpoint (per worker process); off unless asked for
+    METRICS_ENABLED: bool = False
+    # When set, scrapers must send "Authorization: Bearer <token>"
+    METRICS_TOKEN: Optional[str] = None
 
     # JWT settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -80,6 +105,8 @@ class Settings(BaseSettings):
         ".aac",
         ".ogg",
     ]
+    # Processes for CPU-bound media work (thumbnails) in each API worker
+    PROCESS_POOL_WORKERS: int = 2
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
@@ -0,0 +1,37 @@
+"""Query planner helpers."""
+
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper around a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_row_count(db: AsyncSession, statement) -> int:
+    """
+    Get the planner's row estimate for a statement without running it.
+
+    Args:
+        db: Database session
+        statement: SELECT statement to estimate
+
+    Returns:
+        Estimated number of rows (from table statistics; may be off)
+    """
+    raw = (await db.execute(Explain(statement))).scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,130 @@
+"""Query and connection pool instrumentation."""
+
+import time
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.config import settings
+from src.core.metrics import Counter, Gauge, Histogram
+
+# "METHOD /path" of the request being served, for the slow-query log
+current_endpoint: ContextVar[Optional[str]] = ContextVar("current_endpoint", default=None)
+
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Statement execution time.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    labelnames=("engine", "operation"),
+)
+QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Rows returned or affected per statement.",
+    buckets=(0, 1, 10, 100, 1000, 10000, 100000),
+    labelnames=("engine", "operation"),
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+    labelnames=("engine",),
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after pool_timeout because the pool was exhausted.",
+    labelnames=("engine",),
+)
+
+# name -> engine, for the pool gauges
+_engines: Dict[str, AsyncEngine] = {}
+
+
+def _pool_stats() -> Iterable[Tuple[Dict[str, str], float]]:
+    """Current pool occupancy of every instrumented engine."""
+    for name, engine in _engines.items():
+        pool = engine.sync_engine.pool
+        for state, value in (
+            ("size", pool.size()),
+            ("checked_out", pool.checkedout()),
+            ("checked_in", pool.checkedin()),
+            ("overflow", max(0, pool.overflow())),
+        ):
+            yield {"engine": name, "state": state}, value
+
+
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pool size and connections checked out, idle and in overflow.",
+    labelnames=("engine", "state"),
+    collect=_pool_stats,
+)
+
+OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "COPY")
+SLOW_QUERY_MAX_CHARS = 1000
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that times every checkout, labelled by its logging name."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc(engine=self._orig_logging_name or "default")
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - started, engine=self._orig_logging_name or "default"
+            )
+
+
+def _operation(statement: str) -> str:
+    """First keyword of a statement, from a fixed set to bound label cardinality."""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    Record latency and row counts of every statement run on an engine.
+
+    Statements slower than DB_SLOW_QUERY_MS are logged with the endpoint
+    that issued them. The engine's pool occupancy is reported as gauges.
+
+    Args:
+        engine: Engine to instrument
+        name: Label for the engine's metrics (e.g. "primary", "replica")
+    """
+    _engines[name] = engine
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation = _operation(statement)
+        QUERY_DURATION.observe(elapsed, engine=name, operation=operation)
+        rows = getattr(cursor, "rowcount", -1)
+        if rows is not None and rows >= 0:
+            QUERY_ROWS.observe(rows, engine=name, operation=operation)
+
+        if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.0f} ms, {name}, "
+                f"endpoint {current_endpoint.get() or 'none'}): "
+                f"{' '.join(statement.split())[:SLOW_QUERY_MAX_CHARS]}"
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_started") if context.connection else None
+        if started:
+            started.pop()
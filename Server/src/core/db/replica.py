@@ -0,0 +1,73 @@
+"""Read-your-writes tracking for read-replica routing."""
+
+import time
+from typing import Dict, Iterable
+
+from loguru import logger
+
+from src.core.config import settings
+from src.core.redis import get_redis_client
+
+KEY_PREFIX = "recent_write:"
+
+# user_id -> monotonic time until which this worker routes the user's reads to the primary
+_recent: Dict[str, float] = {}
+
+
+async def record_writes(user_ids: Iterable[str]) -> None:
+    """
+    Mark users whose data just changed on the primary.
+
+    For READ_YOUR_WRITES_SECONDS their reads skip the replica, so nobody
+    reads a pre-write snapshot while replication catches up. The mark is
+    kept locally and in Redis so every worker honours it.
+
+    Args:
+        user_ids: IDs of the users whose data changed
+    """
+    user_ids = list(user_ids)
+    if not user_ids or not settings.DATABASE_READ_URL:
+        return
+
+    ttl = settings.READ_YOUR_WRITES_SECONDS
+    until = time.monotonic() + ttl
+    for user_id in user_ids:
+        _recent[user_id] = until
+    if len(_recent) > 10000:
+        now = time.monotonic()
+        for user_id in [u for u, t in _recent.items() if t <= now]:
+            del _recent[user_id]
+
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.set(KEY_PREFIX + user_id, 1, ex=ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Recording recent writes failed: {e}")
+
+
+async def wrote_recently(user_id: str) -> bool:
+    """
+    Whether a user's reads must go to the primary.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        True if the user's data changed recently, or if Redis cannot tell
+    """
+    if _recent.get(user_id, 0) > time.monotonic():
+        return True
+
+    redis = get_redis_client()
+    if redis is None:
+        return False
+    try:
+        return bool(await redis.exists(KEY_PREFIX + user_id))
+    except Exception as e:
+        logger.warning(f"Checking recent writes failed: {e}")
+        return True
@@ -1,8 +1,9 @@
 """Database session management."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -10,18 +11,39 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
+from src.core.db.instrumentation import InstrumentedQueuePool, instrument_engine
+from src.core.db.replica import wrote_recently
+
+
+def create_pooled_engine(url: str, name: str) -> AsyncEngine:
+    """
+    Create an instrumented engine with the pool settings from config.
+
+    Args:
+        url: Database URL
+        name: Label for the engine's pool and query metrics
+
+    Returns:
+        Async engine
+    """
+    pooled_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,  # SQL logging
+        future=True,  # Enable future SQLAlchemy features
+        poolclass=InstrumentedQueuePool,  # Records checkout wait and timeouts
+        pool_logging_name=name,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # Enable connection health checks
+        pool_size=settings.DB_POOL_SIZE,  # Connections kept in the pool
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Connections that can be created beyond pool_size
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Timeout for getting connection from pool
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections after this many seconds
+    )
+    instrument_engine(pooled_engine, name)
+    return pooled_engine
+
 
 # Create async engine
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DEBUG,  # SQL logging
-    future=True,  # Enable future SQLAlchemy features
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_size=20,  # Maximum number of connections in the pool
-    max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
-    pool_timeout=30,  # Timeout for getting connection from pool
-    pool_recycle=1800,  # Recycle connections after 30 minutes
-)
+engine = create_pooled_engine(str(settings.DATABASE_URL), "primary")
 
 # Create async session factory
 async_session_factory = async_sessionmaker(
@@ -32,6 +54,25 @@ async_session_factory = async_sessionmaker(
     autocommit=False,  # Don't auto commit transactions
 )
 
+# Optional read replica; without one, reads use the primary
+read_engine = (
+    create_pooled_engine(str(settings.DATABASE_READ_URL), "replica")
+    if settings.DATABASE_READ_URL
+    else None
+)
+
+read_session_factory = (
+    async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+    if read_engine is not None
+    else async_session_factory
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -57,6 +98,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_session_factory(user_id: Optional[str]) -> async_sessionmaker:
+    """
+    Pick the session factory for a user's reads.
+
+    The replica serves reads unless the user's data changed within
+    READ_YOUR_WRITES_SECONDS, in which case the primary does, so users
+    always see their own writes.
+
+    Args:
+        user_id: ID of the user the reads are for, if any
+
+    Returns:
+        Replica or primary session factory
+    """
+    if read_engine is None:
+        return async_session_factory
+    if user_id is not None and await wrote_recently(user_id):
+        return async_session_factory
+    return read_session_factory
+
+
+async def get_read_db_for(user_id: Optional[str]) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a read-only database session for a user.
+
+    Yields:
+        AsyncSession: Replica session, or primary session after a recent write
+    """
+    session_factory = await get_read_session_factory(user_id)
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            # Nothing to commit; end the read transaction
+            await session.rollback()
+            await session.close()
+
+
 # For testing: create engine without connection pooling
 def create_test_engine():
     """Create test engine without connection pooling."""
@@ -51,14 +51,23 @@ def setup_logging() -> None:
         logging.getLogger(name).handlers = []
         logging.getLogger(name).propagate = True
 
-    # Configure loguru
+    # Configure loguru: application logs as text, access records as JSON lines
+    # through a queue so requests never block on stdout
     logger.configure(
         handlers=[
             {
                 "sink": sys.stdout,
                 "level": settings.LOG_LEVEL,
                 "format": "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            }
+                "filter": lambda record: "access" not in record["extra"],
+            },
+            {
+                "sink": sys.stdout,
+                "level": "INFO",
+                "format": "{message}",
+                "filter": lambda record: "access" in record["extra"],
+                "enqueue": True,
+            },
         ]
     )
 
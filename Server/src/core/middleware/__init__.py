@@ -2,8 +2,9 @@
 
 from src.core.middleware.cors import setup_cors_middleware
 from src.core.middleware.logging import LoggingMiddleware
+from src.core.middleware.metrics import MetricsMiddleware
 
-__all__ = ["setup_middleware", "LoggingMiddleware"]
+__all__ = ["setup_middleware", "LoggingMiddleware", "MetricsMiddleware"]
 
 
 def setup_middleware(app):
@@ -13,3 +14,6 @@ def setup_middleware(app):
 
     # Setup logging middleware
     app.add_middleware(LoggingMiddleware)
+
+    # Setup metrics middleware (outermost, so it times everything inside it)
+    app.add_middleware(MetricsMiddleware)
@@ -1,54 +1,86 @@
 """Logging middleware."""
 
-from typing import Callable
+import json
+import random
+import time
+from datetime import datetime, timezone
 
-from fastapi import Request, Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests and responses."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request and log details.
-
-        Args:
-            request: FastAPI request
-            call_next: Next middleware or endpoint
-
-        Returns:
-            Response
-        """
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
-
-        # Process request
-        response = await call_next(request)
-
-        # Log response
-        if response.status_code >= 400:
-            # Log 4xx and 5xx responses as errors
-            logger.error(
-                f"Error {response.status_code}: {request.method} {request.url.path}"
-            )
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.db.instrumentation import current_endpoint
+
+# Records bound with access=True go to the JSON access sink set up in setup_logging
+access_logger = logger.bind(access=True)
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware writing one JSON access record per request.
+
+    Errors and redirects are always logged; 2xx responses are sampled at
+    ACCESS_LOG_SAMPLE_RATE. Records go through an enqueued sink, so the
+    request never waits on stdout. Rate limit info left in the request
+    state by the rate limiter is added as X-RateLimit-* headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        sent_bytes = 0
+
+        async def send_with_logging(message: Message) -> None:
+            nonlocal status, sent_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # Add rate limit headers if available
+                rate_limit_info = scope.get("state", {}).get("rate_limit_info")
+                if rate_limit_info:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
+                    headers["X-RateLimit-Remaining"] = str(rate_limit_info["remaining"])
+                    headers["X-RateLimit-Reset"] = str(rate_limit_info["reset"])
+            elif message["type"] == "http.response.body":
+                sent_bytes += len(message.get("body", b""))
+            await send(message)
+
+        # Tag the request's queries with the endpoint for the slow-query log
+        endpoint_token = current_endpoint.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send_with_logging)
+        finally:
+            current_endpoint.reset(endpoint_token)
+            if status >= 300 or random.random() < settings.ACCESS_LOG_SAMPLE_RATE:
+                self._log(scope, status, sent_bytes, time.perf_counter() - started)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, sent_bytes: int, elapsed: float) -> None:
+        """Emit the access record."""
+        client = scope.get("client")
+        route = scope.get("route")
+        record = {
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status,
+            "duration_ms": round(elapsed * 1000, 2),
+            "bytes": sent_bytes,
+            "client": client[0] if client else None,
+        }
+        message = json.dumps(record)
+        if status >= 500:
+            access_logger.error(message)
+        elif status >= 400:
+            access_logger.warning(message)
         else:
-            # Log successful responses as info
-            logger.info(
-                f"Response: {response.status_code} for {request.method} {request.url.path}"
-            )
-
-        # Add rate limit headers if available
-        if hasattr(request.state, "rate_limit_info"):
-            rate_limit_info = request.state.rate_limit_info
-            response.headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
-            response.headers["X-RateLimit-Remaining"] = str(
-                rate_limit_info["remaining"]
-            )
-            response.headers["X-RateLimit-Reset"] = str(rate_limit_info["reset"])
-
-        return response
\ No newline at end of file
+            access_logger.info(message)
@@ -0,0 +1,68 @@
+"""Request metrics middleware."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import Counter, Gauge, Histogram
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests served, by route template and status.",
+    labelnames=("method", "route", "status"),
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10),
+    labelnames=("method", "route", "status"),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being served right now.",
+)
+
+# Route label for requests that matched no route, so scanners cannot explode cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request count, latency and concurrency.
+
+    Requests are labelled with the matched route's template (e.g.
+    /api/v1/vectix/accounts/{account_id}), not the raw path. Nothing is
+    wrapped but ``send``, so streaming responses pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            IN_FLIGHT.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            labels = {
+                "method": scope["method"],
+                "route": getattr(route, "path", None) or UNMATCHED_ROUTE,
+                "status": str(status),
+            }
+            REQUESTS.inc(**labels)
+            REQUEST_DURATION.observe(time.perf_counter() - started, **labels)
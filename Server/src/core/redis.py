@@ -0,0 +1,52 @@
+"""Shared Redis client."""
+
+import time
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from src.core.metrics import Histogram
+
+COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Round trip time of Redis commands.",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1),
+    labelnames=("command",),
+)
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """Redis client that times every command it sends (pipelines are not included)."""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            COMMAND_DURATION.observe(
+                time.perf_counter() - started, command=str(args[0]).upper() if args else ""
+            )
+
+# Set during application startup; None in scripts and when Redis is not configured
+redis_client: Optional[aioredis.Redis] = None
+
+
+def set_redis_client(client: Optional[aioredis.Redis]) -> None:
+    """
+    Register the application's Redis client.
+
+    Args:
+        client: Connected Redis client, or None to unset it
+    """
+    global redis_client
+    redis_client = client
+
+
+def get_redis_client() -> Optional[aioredis.Redis]:
+    """
+    Get the application's Redis client.
+
+    Returns:
+        Redis client, or None if none has been registered
+    """
+    return redis_client
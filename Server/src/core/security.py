@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 
 import bcrypt
-from jose import jwt
+from jose import JWTError, jwt
 
 from src.core.config import settings
 
@@ -93,3 +93,23 @@ def create_refresh_token(subject: Union[str, Any]) -> str:
     to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
     return encoded_jwt
+
+
+def get_token_subject(authorization: Optional[str]) -> Optional[str]:
+    """
+    Get the subject of a valid access token without touching the database.
+
+    Args:
+        authorization: Authorization header value ("Bearer <token>")
+
+    Returns:
+        Token subject (username), or None if there is no valid access token
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    except JWTError:
+        return None
+    return payload.get("sub") if payload.get("type") == "access" else None
@@ -1,9 +1,14 @@
 from src.core.utils.rate_limit import create_rate_limiter
 from src.core.utils.file_utils import FileUploadService, file_upload_service
 from src.core.utils.enum_helper import get_enum_key_from_value
+from src.core.utils.pagination import decode_cursor, encode_cursor
+from src.core.utils.local_cache import LocalTTLCache
 __all__ = [
     "create_rate_limiter",
     "FileUploadService",
     "file_upload_service",
     "get_enum_key_from_value",  
+    "encode_cursor",
+    "decode_cursor",
+    "LocalTTLCache",
 ]
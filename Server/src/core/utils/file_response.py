@@ -0,0 +1,234 @@
+"""Conditional and ranged file responses."""
+
+import mimetypes
+import os
+import re
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Bytes per message when the server offers no zero-copy extension
+CHUNK_SIZE = 64 * 1024
+
+# Content-addressed uploads (<sha256><ext>) and their thumbnails (<sha256>_<size>.webp) never change
+CONTENT_HASH_RE = re.compile(r"^[0-9a-f]{64}(_\d+)?$")
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# Shown in the browser instead of downloaded
+INLINE_TYPES = ("image/", "application/pdf", "text/plain", "video/", "audio/")
+
+
+def file_etag(path: Path, stat_result: os.stat_result) -> str:
+    """Strong ETag: the content hash for content-addressed files, else mtime and size."""
+    if CONTENT_HASH_RE.match(path.stem):
+        return f'"{path.stem}"'
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for it)."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        return int(mtime) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header.
+
+    Args:
+        header: Range header value
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end), or None if the header should be ignored
+        (malformed or multi-range, which is then served whole)
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if size == 0:
+        # No byte of an empty file can be selected
+        raise ValueError("range of an empty file")
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range starts past the end of the file")
+    return start, end
+
+
+class FileResponse(Response):
+    """
+    File response honouring conditional and range requests.
+
+    Answers ``If-None-Match``/``If-Modified-Since`` with 304 and single
+    ``Range`` requests (guarded by ``If-Range``) with 206. The body is sent
+    with the ASGI ``http.response.zerocopy`` or ``http.response.pathsend``
+    extension when the server offers one, otherwise in chunks.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        request_headers: Mapping[str, str],
+        stat_result: Optional[os.stat_result] = None,
+        filename: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        self.path = path
+        self.background = background
+        stat_result = stat_result or os.stat(path)
+        size = stat_result.st_size
+
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        etag = file_etag(path, stat_result)
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": (
+                IMMUTABLE_CACHE_CONTROL if CONTENT_HASH_RE.match(path.stem)
+                else REVALIDATE_CACHE_CONTROL
+            ),
+            "accept-ranges": "bytes",
+        }
+
+        self.start, self.end = 0, size - 1
+        status_code = 200
+        if_none_match = request_headers.get("if-none-match")
+        if_modified_since = request_headers.get("if-modified-since")
+        if (
+            (if_none_match and _etag_matches(if_none_match, etag))
+            or (not if_none_match and if_modified_since
+                and _not_modified_since(if_modified_since, stat_result.st_mtime))
+        ):
+            status_code = 304
+        elif request_headers.get("range") and self._if_range_holds(
+            request_headers.get("if-range"), etag, stat_result.st_mtime
+        ):
+            try:
+                byte_range = parse_range(request_headers["range"], size)
+            except ValueError:
+                status_code = 416
+                headers["content-range"] = f"bytes */{size}"
+            else:
+                if byte_range is not None:
+                    status_code = 206
+                    self.start, self.end = byte_range
+                    headers["content-range"] = f"bytes {self.start}-{self.end}/{size}"
+
+        self.status_code = status_code
+        if status_code == 200 or status_code == 206:
+            headers["content-type"] = media_type
+            headers["content-length"] = str(self.end - self.start + 1)
+            disposition = "inline" if media_type.startswith(INLINE_TYPES) else "attachment"
+            name = filename or path.name
+            headers["content-disposition"] = f"{disposition}; filename*=utf-8''{quote(name)}"
+        elif status_code == 416:
+            headers["content-length"] = "0"
+        self.init_headers(headers)
+
+    @staticmethod
+    def _if_range_holds(if_range: Optional[str], etag: str, mtime: float) -> bool:
+        """A Range applies unless If-Range names a different version of the file."""
+        if not if_range:
+            return True
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            # If-Range needs a strong comparison
+            return if_range.strip() == etag
+        # A date only validates if it is exactly our Last-Modified
+        try:
+            return int(mtime) == int(parsedate_to_datetime(if_range).timestamp())
+        except (TypeError, ValueError):
+            return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if self.status_code not in (200, 206) or scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            await self._send_file(scope, send)
+        if self.background is not None:
+            await self.background()
+
+    async def _send_file(self, scope: Scope, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        count = self.end - self.start + 1
+
+        if "http.response.zerocopy" in extensions:
+            # The server sendfile()s from the descriptor straight to the socket
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file,
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False,
+                })
+            return
+
+        if "http.response.pathsend" in extensions and self.status_code == 200:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        if count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.start)
+            remaining = count
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+            if remaining > 0:
+                # File shrank underneath us; close the body cleanly
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def stat_regular_file(path: Path) -> Optional[os.stat_result]:
+    """stat() a path, or None if it is missing or not a regular file."""
+    try:
+        stat_result = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
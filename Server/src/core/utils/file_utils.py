@@ -1,4 +1,7 @@
+import hashlib
+import os
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
 import aiofiles
@@ -9,13 +12,30 @@ logger = logging.getLogger(__name__)
 DEFAULT_UPLOAD_DIR = Path(settings.UPLOAD_DIR or "uploads")
 DEFAULT_MAX_SIZE = settings.MAX_FILE_SIZE or 10 * 1024 * 1024
 
+# Bytes read from the upload per iteration; bounds memory per request
+UPLOAD_CHUNK_SIZE = 256 * 1024
+# Scratch directory inside the upload dir, so the final move is an atomic rename
+TEMP_SUBFOLDER = ".tmp"
+
+
+@dataclass
+class ReceivedFile:
+    """An upload streamed to a temporary file, not yet placed in storage."""
+
+    temp_path: Path
+    sha256: str
+    size: int
+    extension: str
+    original_filename: str
+    content_type: str
+
 
 class FileUploadService:
     """Service for handling file uploads."""
 
     def __init__(self):
         self.upload_dir = DEFAULT_UPLOAD_DIR
-        self.max_file_size = settings.MAX_FILE_SIZE
+        self.max_file_size = DEFAULT_MAX_SIZE
         self.allowed_extensions = {
             "image": {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"},
             "document": {".pdf", ".doc", ".docx", ".txt", ".rtf"},
@@ -28,18 +48,22 @@ class FileUploadService:
 
         # Create subdirectories for different services
         (self.upload_dir / "files").mkdir(exist_ok=True)
+        (self.upload_dir / TEMP_SUBFOLDER).mkdir(exist_ok=True)
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {self.max_file_size/1024/1024:.1f}MB",
+        )
 
     def _validate_file(self, file: UploadFile) -> bool:
-        """Validate file type and size."""
+        """Validate file type, and size when the client declared it."""
         if not file.filename:
             raise HTTPException(status_code=400, detail="No filename provided")
 
-        # Check file size
+        # Cheap early reject; the byte count while streaming is what's enforced
         if file.size and file.size > self.max_file_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size: {self.max_file_size/1024/1024:.1f}MB",
-            )
+            raise self._too_large()
 
         # Check file extension
         file_ext = Path(file.filename).suffix.lower()
@@ -55,46 +79,94 @@ class FileUploadService:
 
         return True
 
-    def _generate_unique_filename(self, original_filename: str) -> str:
-        """Generate unique filename to avoid conflicts."""
-        file_ext = Path(original_filename).suffix.lower()
-        unique_id = str(uuid.uuid4())
-        return f"{unique_id}{file_ext}"
-
-    async def save_file(self, file: UploadFile, subfolder: str = "files") -> dict:
-        """Save uploaded file and return file info."""
-        try:
-            # Validate file
-            self._validate_file(file)
-
-            # Generate unique filename
-            unique_filename = self._generate_unique_filename(file.filename)
-
-            # Create file path
-            file_path = self.upload_dir / subfolder / unique_filename
+    @staticmethod
+    def content_path(subfolder: str, sha256: str, extension: str) -> str:
+        """Relative storage path of a blob: <subfolder>/ab/cd/<sha256><ext>."""
+        return f"{subfolder}/{sha256[:2]}/{sha256[2:4]}/{sha256}{extension}"
 
-            # Ensure subfolder exists
-            (self.upload_dir / subfolder).mkdir(parents=True, exist_ok=True)
+    async def receive(self, file: UploadFile) -> ReceivedFile:
+        """
+        Stream an upload to a temporary file in fixed-size chunks.
 
-            # Save file
-            async with aiofiles.open(file_path, "wb") as f:
-                content = await file.read()
-                await f.write(content)
+        The content is hashed as it is written and the size limit is
+        enforced on the bytes actually received, not on what the client
+        declared. The temporary file is removed if anything goes wrong.
 
-            # Get file size
-            file_size = len(content)
+        Args:
+            file: Uploaded file
 
-            logger.info(f"File saved: {file_path}")
+        Returns:
+            ReceivedFile: Temporary location, SHA-256 and size of the content
+        """
+        self._validate_file(file)
 
-            return {
-                "original_filename": file.filename,
-                "saved_filename": unique_filename,
-                "file_path": str(file_path.relative_to(self.upload_dir)),
-                "file_size": file_size,
-                "mimetype": file.content_type,
-                "full_path": str(file_path),
-            }
+        temp_path = self.upload_dir / TEMP_SUBFOLDER / uuid.uuid4().hex
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_file_size:
+                        raise self._too_large()
+                    digest.update(chunk)
+                    await f.write(chunk)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return ReceivedFile(
+            temp_path=temp_path,
+            sha256=digest.hexdigest(),
+            size=size,
+            extension=Path(file.filename).suffix.lower(),
+            original_filename=file.filename,
+            content_type=file.content_type,
+        )
+
+    def place(self, received: ReceivedFile, subfolder: str = "files") -> str:
+        """
+        Move a received file to its content-addressed path.
+
+        If identical content is already stored, the temporary file is
+        dropped and the existing blob is reused.
+
+        Returns:
+            str: Path relative to the upload directory
+        """
+        file_path = self.content_path(subfolder, received.sha256, received.extension)
+        full_path = self.upload_dir / file_path
+        if full_path.exists():
+            received.temp_path.unlink(missing_ok=True)
+            # Fresh mtime: orphan cleanup leaves recently used blobs alone
+            os.utime(full_path)
+            logger.info(f"File deduplicated: {full_path}")
+        else:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic on the same filesystem; concurrent identical uploads just overwrite each other
+            os.replace(received.temp_path, full_path)
+            logger.info(f"File saved: {full_path}")
+        return file_path
+
+    def file_info(self, received: ReceivedFile, file_path: str) -> dict:
+        """File info returned to callers of save_file."""
+        return {
+            "original_filename": received.original_filename,
+            "saved_filename": Path(file_path).name,
+            "file_path": file_path,
+            "file_size": received.size,
+            "sha256": received.sha256,
+            "mimetype": received.content_type,
+            "full_path": str(self.upload_dir / file_path),
+        }
 
+    async def save_file(self, file: UploadFile, subfolder: str = "files") -> dict:
+        """Stream an uploaded file to content-addressed storage and return file info."""
+        try:
+            received = await self.receive(file)
+            return self.file_info(received, self.place(received, subfolder))
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error saving file: {e}")
             raise HTTPException(status_code=500, detail="Failed to save file")
@@ -114,7 +186,7 @@ class FileUploadService:
 
     def get_file_url(self, file_path: str) -> str:
         """Generate URL for file access."""
-        return f"/api/v1/files{file_path}"
+        return f"{settings.API_V1_STR}/file/files/{file_path}"
 
 
 # Global instance
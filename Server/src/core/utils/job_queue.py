@@ -0,0 +1,106 @@
+"""Redis-backed job queue."""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.core.redis import get_redis_client
+
+QUEUE_PREFIX = "jobs:"
+
+
+class JobQueue:
+    """
+    FIFO job queue on a Redis list with at-least-once delivery.
+
+    A reserved job is moved atomically onto the consumer's own processing
+    list and stays there until it is acknowledged, so jobs held by a
+    consumer that crashes are handed out again when it restarts.
+    Payloads are JSON objects.
+    """
+
+    def __init__(self, name: str, redis: Optional[aioredis.Redis] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            name: Queue name (e.g. "ocr")
+            redis: Client to use; defaults to the application's client
+        """
+        self.name = name
+        self.key = f"{QUEUE_PREFIX}{name}"
+        self._redis = redis
+
+    @property
+    def redis(self) -> Optional[aioredis.Redis]:
+        return self._redis or get_redis_client()
+
+    def processing_key(self, consumer: str) -> str:
+        return f"{self.key}:processing:{consumer}"
+
+    async def enqueue(self, *payloads: Dict[str, Any]) -> bool:
+        """
+        Add jobs to the back of the queue.
+
+        Returns:
+            bool: False if Redis is unavailable and the jobs were not queued
+        """
+        if not payloads:
+            return True
+        redis = self.redis
+        if redis is None:
+            logger.warning(f"No Redis client; {len(payloads)} {self.name} job(s) not queued")
+            return False
+        try:
+            await redis.lpush(self.key, *(json.dumps(p, separators=(",", ":")) for p in payloads))
+            return True
+        except RedisError as e:
+            logger.warning(f"Failed to queue {self.name} job(s): {e}")
+            return False
+
+    async def reserve(self, consumer: str, timeout: float = 1.0) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Take the oldest job, waiting up to timeout seconds for one.
+
+        Returns:
+            (raw, payload), or None on timeout; pass raw to ack()
+        """
+        raw = await self.redis.blmove(
+            self.key, self.processing_key(consumer), timeout, src="RIGHT", dest="LEFT"
+        )
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return raw, json.loads(raw)
+
+    async def ack(self, consumer: str, *raws: str) -> None:
+        """Mark reserved jobs as done."""
+        if not raws:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for raw in raws:
+                pipe.lrem(self.processing_key(consumer), 1, raw)
+            await pipe.execute()
+
+    async def recover(self, consumer: str) -> int:
+        """
+        Put jobs a previous run of this consumer left unacknowledged back on the queue.
+
+        Returns:
+            int: Number of jobs recovered
+        """
+        recovered = 0
+        # Newest first onto the head of the queue, so the oldest ends up next in line
+        while await self.redis.lmove(
+            self.processing_key(consumer), self.key, src="LEFT", dest="RIGHT"
+        ):
+            recovered += 1
+        return recovered
+
+    async def size(self) -> int:
+        """Jobs waiting to be reserved."""
+        return await self.redis.llen(self.key)
@@ -0,0 +1,224 @@
+"""Text extraction and receipt parsing for uploaded bills and receipts.
+
+Runs inside process pool workers, so it imports nothing from the app.
+"""
+
+import re
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional: poetry install --extras ocr
+    Image = None
+    ImageOps = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: poetry install --extras ocr
+    pdfium = None
+
+try:
+    import pytesseract
+except ImportError:  # optional: poetry install --extras ocr (needs the tesseract binary)
+    pytesseract = None
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
+PDF_EXTENSIONS = {".pdf"}
+
+# Receipts are short; later pages of long PDFs are terms and conditions
+MAX_PDF_PAGES = 5
+# Render scanned PDF pages at about 300 dpi for OCR
+PDF_RENDER_SCALE = 300 / 72
+# Shrink huge photos before OCR; tesseract gains nothing past this
+MAX_OCR_EDGE = 3000
+# Kill tesseract on pathological images instead of holding a pool process
+OCR_TIMEOUT_SECONDS = 60
+
+TOTAL_KEYWORDS = re.compile(
+    r"\b(grand\s*total|total\s*(amount|due|payable)?|amount\s*(due|paid|payable)|net\s*amount|balance\s*due)\b",
+    re.IGNORECASE,
+)
+# The final figure when present, over any other total line
+GRAND_TOTAL_KEYWORDS = re.compile(
+    r"\b(grand\s*total|amount\s*(due|payable)|net\s*amount|balance\s*due)\b", re.IGNORECASE
+)
+SUBTOTAL_KEYWORDS = re.compile(
+    r"\b(sub\s*-?\s*total|tax|vat|gst|discount|savings?|change|tip|items?|qty)\b", re.IGNORECASE
+)
+AMOUNT_RE = re.compile(r"(?<![\d.,])(\d{1,3}(?:,\d{3})+|\d+)([.,]\d{2})(?![\d.,]*\d)")
+
+MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+         ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+         ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"),
+         ("dec", "december")],
+        start=1,
+    )
+    for name in names
+}
+ISO_DATE_RE = re.compile(r"\b(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})\b")
+NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})[-/.](\d{1,2})[-/.](\d{2,4})\b")
+DAY_MONTH_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?[\s-]+([A-Za-z]{3,9})[\s,-]+(\d{2,4})\b")
+MONTH_DAY_RE = re.compile(r"\b([A-Za-z]{3,9})[\s-]+(\d{1,2})(?:st|nd|rd|th)?,?[\s-]+(\d{2,4})\b")
+
+# Header lines that are never the merchant's name
+NOT_MERCHANT = re.compile(
+    r"^(tax\s*invoice|invoice|receipt|bill|cash\s*memo|gstin|tel|phone|date|welcome)\b", re.IGNORECASE
+)
+MAX_MERCHANT_LENGTH = 100
+
+
+def can_extract(file_path: str) -> bool:
+    """Whether text can be pulled from this file with the installed libraries."""
+    extension = Path(file_path).suffix.lower()
+    if extension in PDF_EXTENSIONS:
+        return pdfium is not None
+    return extension in IMAGE_EXTENSIONS and Image is not None and pytesseract is not None
+
+
+def _ocr(image: "Image.Image") -> str:
+    image.thumbnail((MAX_OCR_EDGE, MAX_OCR_EDGE))
+    # Raises RuntimeError on timeout; the attachment is marked failed
+    return pytesseract.image_to_string(image.convert("L"), timeout=OCR_TIMEOUT_SECONDS)
+
+
+def extract_text(source: str) -> str:
+    """
+    Text of an image (by OCR) or a PDF (text layer, else OCR of its pages).
+
+    Args:
+        source: Absolute path of the file
+
+    Returns:
+        Extracted text; empty if there is none
+    """
+    path = Path(source)
+    if path.suffix.lower() in PDF_EXTENSIONS:
+        pdf = pdfium.PdfDocument(source)
+        try:
+            pages = [pdf[i] for i in range(min(len(pdf), MAX_PDF_PAGES))]
+            text = "\n".join(page.get_textpage().get_text_range() for page in pages)
+            if text.strip() or pytesseract is None or Image is None:
+                return text
+            # Scanned PDF without a text layer
+            return "\n".join(_ocr(page.render(scale=PDF_RENDER_SCALE).to_pil()) for page in pages)
+        finally:
+            pdf.close()
+
+    with Image.open(path) as image:
+        return _ocr(ImageOps.exif_transpose(image))
+
+
+def _to_decimal(whole: str, fraction: str) -> Optional[Decimal]:
+    try:
+        return Decimal(whole.replace(",", "") + "." + fraction[1:])
+    except InvalidOperation:
+        return None
+
+
+def parse_amount(lines: List[str]) -> Optional[Decimal]:
+    """
+    The total: the last grand total (or amount due) line, else the last
+    total line, else the largest amount on the receipt.
+
+    Lines such as "Total savings" or "Total items" are not totals.
+    """
+    grand_total = total = None
+    candidates = []
+    for line in lines:
+        amounts = [_to_decimal(*m) for m in AMOUNT_RE.findall(line)]
+        amounts = [a for a in amounts if a is not None]
+        if not amounts:
+            continue
+        candidates.extend(amounts)
+        if SUBTOTAL_KEYWORDS.search(line):
+            continue
+        if GRAND_TOTAL_KEYWORDS.search(line):
+            grand_total = amounts[-1]
+        elif TOTAL_KEYWORDS.search(line):
+            total = amounts[-1]
+    if grand_total is not None:
+        return grand_total
+    if total is not None:
+        return total
+    return max(candidates) if candidates else None
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[date]:
+    if year < 100:
+        year += 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_date(text: str, dayfirst: bool = True) -> Optional[date]:
+    """First plausible date on the receipt; numeric dates are read day-first unless impossible."""
+    for match in ISO_DATE_RE.finditer(text):
+        found = _make_date(int(match[1]), int(match[2]), int(match[3]))
+        if found:
+            return found
+    for match in DAY_MONTH_RE.finditer(text):
+        month = MONTHS.get(match[2].lower())
+        found = month and _make_date(int(match[3]), month, int(match[1]))
+        if found:
+            return found
+    for match in MONTH_DAY_RE.finditer(text):
+        month = MONTHS.get(match[1].lower())
+        found = month and _make_date(int(match[3]), month, int(match[2]))
+        if found:
+            return found
+    for match in NUMERIC_DATE_RE.finditer(text):
+        first, second, year = int(match[1]), int(match[2]), int(match[3])
+        day, month = (first, second) if dayfirst else (second, first)
+        found = _make_date(year, month, day) or _make_date(year, day, month)
+        if found:
+            return found
+    return None
+
+
+def parse_merchant(lines: List[str]) -> Optional[str]:
+    """The merchant: the first header line that reads like a name."""
+    for line in lines[:8]:
+        name = " ".join(line.split()).strip(" -*=#:|")
+        letters = sum(ch.isalpha() for ch in name)
+        if letters >= 3 and letters >= len(name) / 2 and not NOT_MERCHANT.match(name):
+            return name[:MAX_MERCHANT_LENGTH]
+    return None
+
+
+def parse_receipt(text: str, dayfirst: bool = True) -> Dict[str, Any]:
+    """
+    Pull the amount, date and merchant out of a receipt's text.
+
+    Returns:
+        Dict with amount (Decimal), date (date) and merchant (str); each may be None
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    return {
+        "amount": parse_amount(lines),
+        "date": parse_date(text, dayfirst=dayfirst),
+        "merchant": parse_merchant(lines),
+    }
+
+
+def extract_receipt(source: str, dayfirst: bool = True) -> Dict[str, Any]:
+    """
+    Extract a receipt's text and parse it.
+
+    Args:
+        source: Absolute path of the file
+        dayfirst: Read ambiguous numeric dates as DD/MM
+
+    Returns:
+        Dict with text, amount, date and merchant
+    """
+    # PostgreSQL text cannot hold NUL, which some PDF text layers contain
+    text = extract_text(source).replace("\x00", "")
+    return {"text": text, **parse_receipt(text, dayfirst=dayfirst)}
@@ -0,0 +1,64 @@
+"""Shared process pool for CPU-bound work off the event loop."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from src.core.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """The worker's process pool, started on first use."""
+    global _pool
+    if _pool is None:
+        # spawn, not fork: forking a process with a running loop and threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a picklable, module-level function in the process pool.
+
+    If a worker process died (e.g. killed for memory), the broken pool is
+    replaced and the call retried once.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments (must be picklable)
+        **kwargs: Keyword arguments (must be picklable)
+
+    Returns:
+        The function's return value
+    """
+    global _pool
+    loop = asyncio.get_running_loop()
+    call = partial(func, *args, **kwargs)
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, call)
+    except BrokenProcessPool:
+        # Concurrent callers see the same failure; only the first replaces the pool
+        if _pool is pool:
+            logger.warning("Process pool broke; starting a new one and retrying")
+            pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        return await loop.run_in_executor(get_process_pool(), call)
+
+
+def shutdown_process_pool() -> None:
+    """Stop the pool's processes, dropping work that has not started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
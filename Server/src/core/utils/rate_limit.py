@@ -1,16 +1,67 @@
 """Rate limiting utilities."""
 
+import math
 import time
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, Request, status
+from loguru import logger
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from src.core.config import settings
+from src.core.security import get_token_subject
+
+# Token bucket over every key in KEYS, in one atomic step. Up to ARGV[3]
+# tokens are taken from each bucket, limited by the emptiest one; the
+# request (or lease) is allowed if at least one was taken. Buckets are
+# hashes {tokens, ts}; time comes from the Redis server so app hosts with
+# skewed clocks agree.
+#
+# ARGV: capacity, refill rate (tokens/second), tokens wanted
+# Returns: {tokens taken, tokens left in the emptiest bucket, seconds until a token (string)}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local wanted = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local ttl = math.ceil(capacity / rate) + 1
+
+local levels = {}
+local available = capacity
+for i, key in ipairs(KEYS) do
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local level = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    level = math.min(capacity, level + math.max(0, now - ts) * rate)
+    levels[i] = level
+    if level < available then
+        available = level
+    end
+end
+
+local taken = math.min(wanted, math.floor(available))
+local remaining = capacity
+for i, key in ipairs(KEYS) do
+    local level = levels[i] - taken
+    redis.call('HSET', key, 'tokens', tostring(level), 'ts', tostring(now))
+    redis.call('EXPIRE', key, ttl)
+    if level < remaining then
+        remaining = level
+    end
+end
+
+local wait = 0
+if taken == 0 then
+    wait = (1 - remaining) / rate
+end
+return {taken, math.floor(remaining), tostring(wait)}
+"""
 
 
 class RateLimiter:
-    """Rate limiter using Redis."""
+    """Token-bucket rate limiter using a Redis Lua script (one round trip per check)."""
 
     def __init__(
         self,
@@ -23,51 +74,142 @@ class RateLimiter:
 
         Args:
             redis_client: Redis client
-            times: Number of requests allowed
-            seconds: Time window in seconds
+            times: Number of requests allowed (also the burst size)
+            seconds: Time window in seconds over which ``times`` tokens refill
         """
         self.redis_client = redis_client
         self.times = times
         self.seconds = seconds
+        self.rate = times / seconds
+        # EVALSHA with automatic EVAL fallback if the script cache was flushed
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
 
-    async def is_rate_limited(self, key: str) -> Tuple[bool, Dict]:
+    async def is_rate_limited(self, *keys: str) -> Tuple[bool, Dict]:
         """
         Check if request is rate limited.
 
         Args:
-            key: Rate limit key
+            keys: Rate limit keys; the request is counted against all of them
 
         Returns:
             Tuple of (is_limited, rate_limit_info)
         """
-        # Get current timestamp
-        current = int(time.time())
-        time_window = current - self.seconds
-
-        # Create pipeline
-        async with self.redis_client.pipeline() as pipe:
-            # Remove old requests
-            await pipe.zremrangebyscore(key, 0, time_window)
-            # Add current request
-            await pipe.zadd(key, {str(current): current})
-            # Get count of requests in window
-            await pipe.zcount(key, time_window, "+inf")
-            # Set key expiration
-            await pipe.expire(key, self.seconds)
-            # Execute pipeline
-            _, _, count, _ = await pipe.execute()
-
-        # Check if rate limited
-        is_limited = count > self.times
+        taken, rate_limit_info = await self.acquire(keys, 1)
+        return taken == 0, rate_limit_info
+
+    async def acquire(self, keys: Sequence[str], tokens: int) -> Tuple[int, Dict]:
+        """
+        Take up to ``tokens`` tokens from every key's bucket.
+
+        Args:
+            keys: Rate limit keys
+            tokens: Tokens wanted
+
+        Returns:
+            Tuple of (tokens taken, rate_limit_info)
+        """
+        taken, remaining, wait = await self._script(
+            keys=list(keys), args=[self.times, self.rate, tokens]
+        )
+        wait = float(wait)
 
         # Return rate limit info
         rate_limit_info = {
             "limit": self.times,
-            "remaining": max(0, self.times - count),
-            "reset": self.seconds - (current % self.seconds),
+            "remaining": max(0, int(remaining)),
+            # Seconds until a token is available (limited) or the bucket is full again
+            "reset": math.ceil(wait if not taken else (self.times - int(remaining)) / self.rate),
         }
 
-        return is_limited, rate_limit_info
+        return int(taken), rate_limit_info
+
+
+class LocalRateLimiter:
+    """
+    Per-worker first tier in front of RateLimiter.
+
+    Tokens are leased from Redis in batches (a fraction of the limit, at
+    least one) and spent locally until the lease runs out or expires, so
+    the global count stays exact while most requests skip Redis. A client
+    Redis reported as limited is rejected locally until its reset time.
+    If Redis is unreachable, a per-worker token bucket with the same limit
+    takes over. State is spread over shards that are swept for expired
+    entries as they grow.
+    """
+
+    SHARDS = 16
+    MAX_SHARD_ENTRIES = 4096
+
+    def __init__(self, times: int, seconds: int, lease_fraction: float, lease_seconds: float):
+        """
+        Initialize the local tier.
+
+        Args:
+            times: Number of requests allowed
+            seconds: Time window in seconds
+            lease_fraction: Share of ``times`` leased from Redis per round trip
+            lease_seconds: How long unspent leased tokens stay usable
+        """
+        self.times = times
+        self.rate = times / seconds
+        self.lease_size = max(1, int(times * lease_fraction))
+        self.lease_seconds = lease_seconds
+        # key tuple -> [leased tokens, lease expiry, blocked until, last known remaining]
+        self._shards: List[Dict[Tuple[str, ...], list]] = [{} for _ in range(self.SHARDS)]
+        # key tuple -> [tokens, updated at] for the Redis-down fallback
+        self._fallback: Dict[Tuple[str, ...], list] = {}
+
+    def _shard(self, keys: Tuple[str, ...]) -> Dict[Tuple[str, ...], list]:
+        return self._shards[hash(keys) % self.SHARDS]
+
+    def try_local(self, keys: Tuple[str, ...]) -> Optional[Tuple[bool, Dict]]:
+        """Decide without Redis if possible: (is_limited, info), or None to ask Redis."""
+        state = self._shard(keys).get(keys)
+        if state is None:
+            return None
+
+        now = time.monotonic()
+        if state[2] > now:
+            return True, {"limit": self.times, "remaining": 0, "reset": math.ceil(state[2] - now)}
+        if state[0] > 0 and state[1] > now:
+            state[0] -= 1
+            state[3] = max(0, state[3] - 1)
+            return False, {
+                "limit": self.times,
+                "remaining": state[3],
+                "reset": math.ceil((self.times - state[3]) / self.rate),
+            }
+        return None
+
+    def record(self, keys: Tuple[str, ...], taken: int, info: Dict) -> None:
+        """Store what Redis granted: the lease beyond this request, or a block until reset."""
+        now = time.monotonic()
+        shard = self._shard(keys)
+        if len(shard) >= self.MAX_SHARD_ENTRIES:
+            for stale in [k for k, v in shard.items() if v[1] <= now and v[2] <= now]:
+                del shard[stale]
+
+        if taken:
+            shard[keys] = [taken - 1, now + self.lease_seconds, 0.0, info["remaining"]]
+        else:
+            shard[keys] = [0, 0.0, now + max(info["reset"], 1), 0]
+
+    def fallback(self, keys: Tuple[str, ...]) -> Tuple[bool, Dict]:
+        """Per-worker token bucket used while Redis is unreachable."""
+        now = time.monotonic()
+        if len(self._fallback) >= self.MAX_SHARD_ENTRIES:
+            self._fallback.clear()
+        tokens, updated_at = self._fallback.get(keys, (self.times, now))
+        tokens = min(self.times, tokens + (now - updated_at) * self.rate)
+        is_limited = tokens < 1
+        if not is_limited:
+            tokens -= 1
+        self._fallback[keys] = [tokens, now]
+        return is_limited, {
+            "limit": self.times,
+            "remaining": int(tokens),
+            "reset": math.ceil((1 - tokens) / self.rate if is_limited else (self.times - tokens) / self.rate),
+        }
 
 
 def create_rate_limiter(
@@ -77,6 +219,9 @@ def create_rate_limiter(
     """
     Create rate limiter dependency.
 
+    Requests are limited per client IP and, when they carry a valid access
+    token, per user as well.
+
     Args:
         times: Number of requests allowed
         seconds: Time window in seconds
@@ -107,6 +252,16 @@ def create_rate_limiter(
         times = times or default_times
         seconds = seconds or default_seconds
 
+    # One limiter per dependency, created on first use with the app's client
+    limiters: Dict[int, RateLimiter] = {}
+    local = (
+        LocalRateLimiter(
+            times, seconds, settings.RATE_LIMIT_LEASE_FRACTION, settings.RATE_LIMIT_LEASE_SECONDS
+        )
+        if settings.RATE_LIMIT_LOCAL_TIER
+        else None
+    )
+
     async def rate_limit(request: Request) -> None:
         """
         Rate limit requests.
@@ -120,28 +275,44 @@ def create_rate_limiter(
         if not settings.RATE_LIMIT_ENABLED:
             return
 
-        # Get Redis client from app state
-        redis_client = request.app.state.redis
-
-        # Create rate limiter
-        limiter = RateLimiter(
-            redis_client=redis_client,
-            times=times,
-            seconds=seconds,
-        )
-
         # Get client IP
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            client_ip = forwarded.split(",")[0]
+            client_ip = forwarded.split(",")[0].strip()
         else:
             client_ip = request.client.host  # type: ignore
 
-        # Create rate limit key
-        key = f"rate_limit:{client_ip}:{request.url.path}"
+        # Create rate limit keys
+        keys = [f"rate_limit:ip:{client_ip}:{request.url.path}"]
+        username = get_token_subject(request.headers.get("Authorization"))
+        if username:
+            keys.append(f"rate_limit:user:{username}:{request.url.path}")
+        keys = tuple(keys)
 
-        # Check if rate limited
-        is_limited, rate_limit_info = await limiter.is_rate_limited(key)
+        # Check if rate limited: locally when possible, then in Redis
+        decision = local.try_local(keys) if local else None
+        if decision is None:
+            # Get Redis client from app state
+            redis_client = request.app.state.redis
+            limiter = limiters.get(id(redis_client))
+            if limiter is None:
+                limiter = limiters[id(redis_client)] = RateLimiter(
+                    redis_client=redis_client,
+                    times=times,
+                    seconds=seconds,
+                )
+            try:
+                taken, rate_limit_info = await limiter.acquire(keys, local.lease_size if local else 1)
+            except RedisError as e:
+                if local is None:
+                    raise
+                logger.warning(f"Rate limiter falling back to local buckets: {e}")
+                decision = local.fallback(keys)
+            else:
+                if local:
+                    local.record(keys, taken, rate_limit_info)
+                decision = (taken == 0, rate_limit_info)
+        is_limited, rate_limit_info = decision
 
         # Set rate limit headers
         request.state.rate_limit_info = rate_limit_info
@@ -151,6 +322,7 @@ def create_rate_limiter(
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many requests",
+                headers={"Retry-After": str(rate_limit_info["reset"])},
             )
 
-    return rate_limit
\ No newline at end of file
+    return rate_limit
@@ -0,0 +1,91 @@
+"""Thumbnail and preview rendering for uploaded images and PDFs.
+
+Runs inside process pool workers, so it imports nothing from the app.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional: poetry install --extras media
+    Image = None
+    ImageOps = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: poetry install --extras media
+    pdfium = None
+
+# Longest edge in pixels: grid thumbnail and full-screen preview
+THUMBNAIL_SIZES = (256, 1024)
+THUMBNAIL_EXTENSION = ".webp"
+THUMBNAIL_QUALITY = 80
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
+PDF_EXTENSIONS = {".pdf"}
+
+
+def thumbnail_path(file_path: str, size: int) -> str:
+    """Path of a file's thumbnail, next to it: ab/cd/<sha256>_<size>.webp."""
+    path = Path(file_path)
+    return str(path.with_name(f"{path.stem}_{size}{THUMBNAIL_EXTENSION}").as_posix())
+
+
+def can_render(file_path: str) -> bool:
+    """Whether thumbnails can be made for this file with the installed libraries."""
+    extension = Path(file_path).suffix.lower()
+    if Image is None:
+        return False
+    if extension in PDF_EXTENSIONS:
+        return pdfium is not None
+    return extension in IMAGE_EXTENSIONS
+
+
+def _open(source: Path, longest_edge: int) -> "Image.Image":
+    """Decode an image, or the first page of a PDF, at no more than about longest_edge."""
+    if source.suffix.lower() in PDF_EXTENSIONS:
+        pdf = pdfium.PdfDocument(str(source))
+        try:
+            page = pdf[0]
+            width, height = page.get_size()
+            scale = longest_edge / max(width, height, 1)
+            return page.render(scale=scale).to_pil()
+        finally:
+            pdf.close()
+
+    image = Image.open(source)
+    # JPEG can decode straight at a reduced scale, which is most of the saving
+    image.draft("RGB", (longest_edge, longest_edge))
+    return ImageOps.exif_transpose(image)
+
+
+def render_thumbnails(source: str, targets: List[Tuple[int, str]]) -> Dict[int, str]:
+    """
+    Write downscaled WebP copies of an image or a PDF's first page.
+
+    Args:
+        source: Absolute path of the original
+        targets: (longest edge, absolute destination path) pairs
+
+    Returns:
+        Dict mapping each size written to its destination path
+    """
+    if not targets or not can_render(source):
+        return {}
+
+    targets = sorted(targets, reverse=True)
+    image = _open(Path(source), targets[0][0])
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    written = {}
+    # Largest first, each one downscaled from the previous
+    for size, destination in targets:
+        image.thumbnail((size, size), Image.LANCZOS)
+        temp_path = f"{destination}.{os.getpid()}.tmp"
+        image.save(temp_path, "WEBP", quality=THUMBNAIL_QUALITY, method=4)
+        os.replace(temp_path, destination)
+        written[size] = destination
+    return written